@@ -1,20 +1,106 @@
 import os
 from pathlib import Path
+from time import perf_counter, time
 from dotenv import load_dotenv
+from fastapi import Request
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 # 현재 파일(database.py)의 위치를 기준으로 상위 폴더(..)에 있는 .env 찾기
 env_path = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 # .env 파일에서 DATABASE_URL 읽어오기
 DATABASE_URL = os.getenv("DATABASE_URL")
+# [v2.3] 읽기 전용 복제본(replica) 주소. 없으면 읽기도 기본(primary) DB로 보냅니다.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+# 쓰기 요청 후 이 시간(초) 동안은 같은 클라이언트의 읽기를 primary로 보냅니다 (복제 지연 대비, 0: 사용 안 함)
+DB_READ_PIN_SECONDS = float(os.getenv("DB_READ_PIN_SECONDS", 5))
+PRIMARY_PIN_COOKIE = "db_primary_until"
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
+# [v2.3] 커넥션 풀 설정 (uvicorn 워커 하나당 값입니다. DB 최대 연결 수 >= 워커 수 x (POOL_SIZE + MAX_OVERFLOW))
+# SQL 로그는 기본 꺼짐 (개발 중에만 DB_ECHO=true)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 이 시간(초)보다 오래된 연결은 교체 (-1: 사용 안 함)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# asyncpg prepared statement 캐시 크기 (PgBouncer transaction 모드에서는 0)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """연결을 빌려 갈 때의 대기 시간과 타임아웃 횟수를 기록하는 커넥션 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = perf_counter() - started
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.checkouts += 1
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+        }
+
+
+def _engine_options(url: str) -> dict:
+    options = {
+        "echo": DB_ECHO,
+        "poolclass": InstrumentedPool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if url.startswith("postgresql+asyncpg"):
+        options["connect_args"] = {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
 # DB 엔진 생성
-engine = create_async_engine(DATABASE_URL, echo=True)
+engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+# [v2.3] 읽기 엔진 (복제본이 없으면 primary 엔진을 그대로 사용)
+read_engine = create_async_engine(DATABASE_READ_URL, **_engine_options(DATABASE_READ_URL)) if DATABASE_READ_URL else engine
+READ_REPLICA_ENABLED = read_engine is not engine
+
+
+def pool_stats() -> dict:
+    """엔진별 커넥션 풀 지표 (dispose 후에는 새 풀 기준으로 다시 집계)"""
+    return {
+        "primary": engine.pool.stats(),
+        "read": read_engine.pool.stats() if READ_REPLICA_ENABLED else None,
+    }
 
 # 세션 생성기 정의
 AsyncSessionLocal = async_sessionmaker(
@@ -23,6 +109,13 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# 읽기 전용 세션 생성기
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 # SQLAlchemy 2.0 스타일의 Base 클래스 선언
 class Base(DeclarativeBase):
     pass
@@ -35,4 +128,18 @@ async def get_db():
         finally:
             # async with를 쓰면 자동으로 닫히지만, 
             # 명시적으로 await db.close()를 넣기도 합니다.
-            await db.close()
\ No newline at end of file
+            await db.close()
+
+def pinned_to_primary(request: Request) -> bool:
+    """최근에 쓰기를 한 클라이언트인지 (PrimaryPinMiddleware가 심은 쿠키 기준)"""
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time()
+    except ValueError:
+        return False
+
+# [v2.3] 읽기 전용 API용 DB 세션 의존성 주입 함수
+# 복제본이 설정되어 있으면 복제본으로, 없거나 방금 쓰기를 한 클라이언트면 primary로 보냅니다.
+async def get_read_db(request: Request):
+    session_factory = ReadSessionLocal if READ_REPLICA_ENABLED and not pinned_to_primary(request) else AsyncSessionLocal
+    async with session_factory() as db:
+        yield db
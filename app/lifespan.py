@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import logging
+import os
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from datetime import datetime
+from time import perf_counter
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import AddConstraint, CreateIndex, CreateTable
+from app import models
+from app.database import AsyncSessionLocal, DB_POOL_SIZE, READ_REPLICA_ENABLED, engine, read_engine
+from app.metrics import METRICS_ENABLED, METRICS_FLUSH_INTERVAL, METRICS_MULTIPROC_DIR, metrics
+from app.services.password_hasher import password_hasher
+from app.services.review_service import review_service
+from app.services.reservation_service import reservation_service
+from app.services.room_feed import ROOM_FEED_REFRESH_INTERVAL, room_feed
+from app.services.status_materializer import RESERVATION_STATUS_JOB_ENABLED, status_materializer
+from app.services.reservation_archiver import RESERVATION_ARCHIVE_ENABLED, RESERVATION_ARCHIVE_INTERVAL, reservation_archiver
+
+logger = logging.getLogger("uvicorn.error")
+
+# [v2.3] 기동 시 미리 열어 둘 커넥션 수 (엔진별, 0: 사용 안 함)
+DB_POOL_WARMUP = min(int(os.getenv("DB_POOL_WARMUP", 2)), DB_POOL_SIZE)
+
+# advisory lock 키: 여러 워커가 동시에 떠도 DDL은 한 워커만 실행
+SCHEMA_LOCK_KEY = 20231018
+
+# 지문 계산 방식의 버전. 기존 테이블의 누락 객체를 확인하지 않던 이전 버전이 기록한 지문을 한 번 무효화합니다.
+SCHEMA_CHECK_VERSION = "2"
+
+# 적용된 스키마 지문을 기록하는 테이블 (모델 메타데이터와 분리하여 지문 계산에서 제외)
+schema_state_metadata = MetaData()
+schema_state = Table(
+    "schema_state", schema_state_metadata,
+    Column("name", String(50), primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+# 기동 지표 (/admin/stats/startup)
+startup_stats: dict = {"imported_at": perf_counter()}
+
+
+def schema_fingerprint(dialect) -> str:
+    """모델 메타데이터로 만든 CREATE 문 전체의 해시. 모델(테이블/컬럼/인덱스/제약조건)이 바뀌면 값이 달라집니다."""
+    digest = hashlib.sha256(SCHEMA_CHECK_VERSION.encode("utf-8"))
+    for table in models.Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode("utf-8"))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def _stored_fingerprint(conn) -> str | None:
+    try:
+        return await conn.scalar(select(schema_state.c.fingerprint).where(schema_state.c.name == "models"))
+    except DBAPIError:
+        # 최초 기동: schema_state 테이블이 아직 없음
+        await conn.rollback()
+        return None
+
+
+async def ensure_schema() -> bool:
+    """저장된 지문이 현재 모델과 같으면 DDL을 건너뜁니다. DDL을 실행했으면 True"""
+    fingerprint = schema_fingerprint(engine.dialect)
+    async with engine.connect() as conn:
+        if await _stored_fingerprint(conn) == fingerprint:
+            return False
+
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+            # 잠금을 기다리는 동안 다른 워커가 이미 적용했을 수 있음
+            await conn.run_sync(schema_state_metadata.create_all)
+            if await conn.scalar(select(schema_state.c.fingerprint).where(schema_state.c.name == "models")) == fingerprint:
+                return False
+
+        existing_tables = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+        # run_sync를 쓰는 이유: metadata.create_all은 내부적으로 동기 함수라서
+        # 비동기 연결(conn) 내에서 실행시키기 위한 특수 도구입니다.
+        await conn.run_sync(models.Base.metadata.create_all)
+        # create_all은 이미 있는 테이블을 통째로 건너뛰므로, 빠진 인덱스/제약조건은 따로 만듭니다.
+        unresolved = await conn.run_sync(apply_missing_objects, existing_tables)
+        await conn.run_sync(schema_state_metadata.create_all)
+        startup_stats["schema_unresolved"] = unresolved
+        if unresolved:
+            # 지문을 기록하지 않으면 다음 기동에서 다시 확인합니다.
+            logger.error("Schema drift not resolved, fingerprint not stored: %s", ", ".join(unresolved))
+            return True
+        await conn.execute(schema_state.delete().where(schema_state.c.name == "models"))
+        await conn.execute(schema_state.insert().values(name="models", fingerprint=fingerprint, applied_at=datetime.now()))
+    return True
+
+
+def apply_missing_objects(sync_conn, existing_tables: set[str]) -> list[str]:
+    """
+    기동 전부터 있던 테이블에 모델의 인덱스/배타 제약조건이 없으면 만들고, 해결하지 못한 항목 이름을 반환합니다.
+    빠진 컬럼은 자동으로 고치지 않고(수동 마이그레이션) 항목에 포함합니다.
+    DDL 트랜잭션 안에서 실행되므로 CONCURRENTLY를 쓸 수 없습니다. 큰 테이블은 migrations/의 SQL을 먼저 적용하세요.
+    """
+    inspector = inspect(sync_conn)
+    is_postgres = sync_conn.dialect.name == "postgresql"
+    unresolved = []
+    for table in models.Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        unresolved += [f"{table.name}.{column.name}" for column in table.columns if column.name not in columns]
+
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing = [CreateIndex(index) for index in table.indexes if index.name not in indexes]
+        if is_postgres:
+            constraints = set(sync_conn.execute(
+                text("SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass)"), {"table": table.name}
+            ).scalars())
+            excludes = [
+                AddConstraint(constraint) for constraint in table.constraints
+                if isinstance(constraint, ExcludeConstraint) and constraint.name not in constraints
+            ]
+            if excludes:
+                # 정수/날짜의 = 연산을 GiST 인덱스에서 쓰기 위해 필요
+                sync_conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+            missing += excludes
+
+        for ddl in missing:
+            name = ddl.element.name
+            try:
+                # 기존 데이터가 제약조건을 위반하는 등 실패해도 나머지 DDL은 계속 적용
+                with sync_conn.begin_nested():
+                    sync_conn.execute(ddl)
+                logger.info("Schema: created %s on %s", name, table.name)
+            except DBAPIError as e:
+                logger.error("Schema: failed to create %s on %s: %s", name, table.name, e.orig)
+                unresolved.append(f"{table.name}.{name}")
+    return unresolved
+
+
+async def warm_pool(target_engine, size: int):
+    """커넥션 size개를 동시에 열었다가 풀에 돌려놓아 첫 요청들이 연결 수립 비용을 내지 않게 합니다."""
+    if size <= 0:
+        return
+    async with AsyncExitStack() as stack:
+        connections = await asyncio.gather(*[stack.enter_async_context(target_engine.connect()) for _ in range(size)])
+        await asyncio.gather(*[conn.execute(text("SELECT 1")) for conn in connections])
+
+
+@asynccontextmanager
+async def lifespan(app):
+    started = perf_counter()
+
+    # 1. 스키마 확인 (변경이 없으면 DDL 생략)
+    ddl_started = perf_counter()
+    applied = await ensure_schema()
+    startup_stats["ddl"] = "applied" if applied else "skipped"
+    startup_stats["ddl_seconds"] = round(perf_counter() - ddl_started, 6)
+
+    # [v2.3] 사전 중복 체크 생략은 배타 제약조건이 실제로 있을 때만 적용
+    async with engine.connect() as conn:
+        startup_stats["overlap_precheck"] = await reservation_service.configure_overlap_precheck(conn)
+
+    # 2. 평점 집계/하루 이용 시간 테이블 최초 백필 (스키마가 바뀐 기동에서만 확인)
+    if applied:
+        async with AsyncSessionLocal() as db:
+            await review_service.backfill_rating_summaries(db)
+            await reservation_service.backfill_daily_usage(db)
+
+    # 3. 커넥션 풀 예열
+    warmup_started = perf_counter()
+    await warm_pool(engine, DB_POOL_WARMUP)
+    if READ_REPLICA_ENABLED:
+        await warm_pool(read_engine, DB_POOL_WARMUP)
+    startup_stats["warmup_seconds"] = round(perf_counter() - warmup_started, 6)
+
+    startup_stats["ready_at"] = perf_counter()
+    startup_stats["startup_seconds"] = round(startup_stats["ready_at"] - started, 6)
+    logger.info("Startup: ddl %s, %.3fs total", startup_stats["ddl"], startup_stats["startup_seconds"])
+
+    # 4. 다중 워커 지표 집계용 파일 내보내기
+    metrics_task = None
+    if METRICS_ENABLED and METRICS_MULTIPROC_DIR:
+        metrics_task = asyncio.create_task(metrics.flush_periodically(METRICS_MULTIPROC_DIR, METRICS_FLUSH_INTERVAL))
+
+    # 5. 방 상태 스트림: 정시 전환/주기적 재계산 (구독자가 없으면 아무 일도 하지 않음)
+    feed_task = asyncio.create_task(room_feed.run_ticker(ROOM_FEED_REFRESH_INTERVAL))
+
+    # 6. 예약 상태 갱신 (기동 시 밀린 건 처리 후 매 정시)
+    status_task = None
+    if RESERVATION_STATUS_JOB_ENABLED:
+        status_task = asyncio.create_task(status_materializer.run_forever())
+
+    # 7. 지난 예약 보관 (기동 1분 후, 이후 RESERVATION_ARCHIVE_INTERVAL마다)
+    archive_task = None
+    if RESERVATION_ARCHIVE_ENABLED:
+        archive_task = asyncio.create_task(reservation_archiver.run_forever(RESERVATION_ARCHIVE_INTERVAL, initial_delay=60))
+
+    yield
+
+    for task in (feed_task, status_task, archive_task):
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    if metrics_task:
+        metrics_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await metrics_task
+
+    # 종료: 풀의 연결을 정리하고 bcrypt 스레드 풀을 닫습니다.
+    await engine.dispose()
+    if READ_REPLICA_ENABLED:
+        await read_engine.dispose()
+    password_hasher.shutdown()
+
+
+def get_startup_stats() -> dict:
+    imported_at = startup_stats["imported_at"]
+    result = {key: value for key, value in startup_stats.items() if key not in ("imported_at", "ready_at", "first_request_at")}
+    if "ready_at" in startup_stats:
+        result["import_to_ready_seconds"] = round(startup_stats["ready_at"] - imported_at, 6)
+    if "first_request_at" in startup_stats:
+        result["time_to_first_request_seconds"] = round(startup_stats["first_request_at"] - imported_at, 6)
+    return result
@@ -1,29 +1,55 @@
 import traceback
 from app.database import AsyncSessionLocal
 from fastapi import FastAPI, Request
-from app.database import Base, engine
+from app.database import Base, engine, read_engine, DB_READ_PIN_SECONDS, READ_REPLICA_ENABLED
+from app.middleware.first_request import FirstRequestTimer
+from app.middleware.primary_pin import PrimaryPinMiddleware
+from app.middleware.sql_timing import SQL_N_PLUS_ONE_THRESHOLD, SQL_TIMING_ENABLED, SQLTimingMiddleware, instrument_engine
+from app.lifespan import lifespan, startup_stats
 from app import models
-from app.routers import auth, user, rooms, reservations
+from app.routers import auth, user, rooms, reservations, review, admin
+from app.routers import metrics as metrics_router
+from app.metrics import METRICS_ENABLED, metrics, register_default_collectors
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.rate_limit import RATE_LIMIT_ENABLED, RateLimitMiddleware, rate_limiter
 
 # 기존 테이블 지우기
 # models.Base.metadata.drop_all(bind=engine)
 # 정의된 모델들을 기반으로 DB에 테이블을 생성한다.
 # models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+# [v2.3] 기동/종료 처리는 lifespan으로 (스키마 지문 확인, 풀 예열, 종료 시 정리)
+app = FastAPI(lifespan=lifespan)
 app.include_router(user.router)
 app.include_router(auth.router)
 app.include_router(rooms.router)
 app.include_router(reservations.router)
+app.include_router(review.router)
+app.include_router(admin.router)
 
-# 1. 테이블 생성 방식을 비동기(startup)로 변경
-@app.on_event("startup")
-async def startup():
-    # 비동기 엔진을 사용하여 테이블 생성
-    async with engine.begin() as conn:
-        # run_sync를 쓰는 이유: metadata.create_all은 내부적으로 동기 함수라서 
-        # 비동기 연결(conn) 내에서 실행시키기 위한 특수 도구입니다.
-        await conn.run_sync(models.Base.metadata.create_all)
+# [v2.3] 읽기 복제본 사용 시, 쓰기 직후의 읽기는 primary로 고정
+if READ_REPLICA_ENABLED and DB_READ_PIN_SECONDS > 0:
+    app.add_middleware(PrimaryPinMiddleware, seconds=DB_READ_PIN_SECONDS)
+app.add_middleware(FirstRequestTimer, stats=startup_stats)
+
+# [v2.3] 요청별 SQL 실행 수/DB 시간 (Server-Timing 헤더, N+1 경고)
+if SQL_TIMING_ENABLED:
+    instrument_engine(engine)
+    if READ_REPLICA_ENABLED:
+        instrument_engine(read_engine)
+    app.add_middleware(SQLTimingMiddleware, n_plus_one_threshold=SQL_N_PLUS_ONE_THRESHOLD)
+
+# [v2.3] 로그인/쓰기 요청 제한 (클라이언트별 토큰 버킷 + 그룹별 동시 처리 수). 세션/SQL 계측보다 바깥에서 거절합니다.
+if RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
+# [v2.3] Prometheus 지표 (/metrics). 가장 바깥에 두어 다른 미들웨어 시간까지 포함합니다.
+if METRICS_ENABLED:
+    register_default_collectors()
+    if RATE_LIMIT_ENABLED:
+        metrics.register_collector(rate_limiter.collect)
+    app.include_router(metrics_router.router)
+    app.add_middleware(MetricsMiddleware, registry=metrics)
 
 # @app.on_event("startup")
 # async def startup():
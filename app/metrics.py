@@ -0,0 +1,262 @@
+import asyncio
+import fcntl
+import json
+import os
+from bisect import bisect_left
+from pathlib import Path
+from time import time
+
+# [v2.3] Prometheus 지표 설정
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# 워커가 여러 개일 때 워커별 지표 파일을 모으는 디렉터리 (비우면 현재 프로세스 지표만 노출)
+METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR")
+# 워커가 자기 지표를 파일로 내보내는 주기(초)
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+# 종료된 워커들의 누적 지표를 합쳐 두는 파일 이름 (METRICS_MULTIPROC_DIR 안)
+DEAD_SNAPSHOT_FILE = "dead.json"
+
+# collector 값의 종류: gauge(순간값, 종료된 워커는 제외) / counter(누적값, 종료된 워커 것도 합계에 유지)
+GAUGE = "gauge"
+COUNTER = "counter"
+
+# 지연 시간 히스토그램 구간(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _read_snapshot(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data: dict):
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 깨진 파일을 보지 않게 합니다."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def _series_key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted(labels.items()))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """
+    요청 지표(라우트별 지연 시간 히스토그램/요청 수, 처리 중 요청 수)와
+    다른 모듈의 상태 값(collector)을 모아 Prometheus 텍스트 형식으로 내보냅니다.
+    요청마다 하는 일은 딕셔너리 조회와 정수 증가뿐이라 부담이 거의 없습니다.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        # (method, route, status) -> [요청 수, 누적 시간, 구간별 개수(누적 아님) ...]
+        self._requests: dict[tuple[str, str, int], list] = {}
+        self.in_flight = 0
+        self._collectors = []
+
+    def observe(self, method: str, route: str, status: int, seconds: float):
+        key = (method, route, status)
+        series = self._requests.get(key)
+        if series is None:
+            series = self._requests[key] = [0, 0.0] + [0] * (len(self.buckets) + 1)
+        series[0] += 1
+        series[1] += seconds
+        series[2 + bisect_left(self.buckets, seconds)] += 1
+
+    def register_collector(self, collector):
+        """
+        collector() -> [(종류, 이름, 설명, 라벨 dict, 값), ...] 형태의 함수. /metrics 조회 시점에 호출됩니다.
+        종류는 GAUGE 또는 COUNTER. 워커 시작 이후 늘기만 하는 값은 COUNTER로 내보내야 워커가 재시작되어도 합계가 줄지 않습니다.
+        """
+        self._collectors.append(collector)
+
+    def snapshot(self) -> dict:
+        gauges, counters = [], []
+        for collector in self._collectors:
+            for kind, name, help_text, labels, value in collector():
+                (counters if kind == COUNTER else gauges).append([name, help_text, labels, value])
+        return {
+            "pid": os.getpid(),
+            "written_at": time(),
+            "requests": [[*key, *series] for key, series in self._requests.items()],
+            "in_flight": self.in_flight,
+            "gauges": gauges,
+            "counters": counters,
+        }
+
+    # --- 다중 워커 집계 ---
+    def write_snapshot(self, directory: str):
+        """워커 자신의 지표를 <pid>.json으로 저장"""
+        _write_json(Path(directory) / f"{os.getpid()}.json", self.snapshot())
+
+    def merge_dead_snapshots(self, directory: str) -> int:
+        """
+        기동 시 호출: 종료된 워커(같은 pid의 이전 프로세스 포함)의 지표 파일을 dead.json 하나에 합치고 지웁니다.
+        워커가 재시작될 때마다 파일이 늘어나지 않게 하면서, 한 배포 안에서는 요청 수 합계가 줄지 않게 유지합니다.
+        여러 워커가 동시에 떠도 같은 파일을 두 번 합치지 않도록 파일 잠금을 잡고 실행합니다. 합친 파일 수를 반환
+        """
+        base = Path(directory)
+        with open(base / "merge.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            dead_path = base / DEAD_SNAPSHOT_FILE
+            merged = _read_snapshot(dead_path) or {"pid": None, "requests": [], "in_flight": 0, "gauges": []}
+            requests = {tuple(row[:3]): row[3:] for row in merged["requests"]}
+            counters = {_series_key(name, labels): [name, help_text, labels, value]
+                        for name, help_text, labels, value in merged.get("counters", [])}
+            merged_paths = []
+            for path in base.glob("*.json"):
+                if path.name == DEAD_SNAPSHOT_FILE:
+                    continue
+                snapshot = _read_snapshot(path)
+                if snapshot is None or (snapshot["pid"] != os.getpid() and _pid_alive(snapshot["pid"])):
+                    continue
+                for method, route, status, *series in snapshot["requests"]:
+                    total = requests.setdefault((method, route, status), [0] * len(series))
+                    for i, value in enumerate(series):
+                        total[i] += value
+                for name, help_text, labels, value in snapshot.get("counters", []):
+                    counters.setdefault(_series_key(name, labels), [name, help_text, labels, 0])[3] += value
+                merged_paths.append(path)
+            if merged_paths:
+                merged["requests"] = [[*key, *series] for key, series in requests.items()]
+                merged["counters"] = list(counters.values())
+                merged["written_at"] = time()
+                # 합친 결과를 먼저 기록한 뒤 원본을 지워, 중간에 멈춰도 요청 수가 사라지지 않게 합니다.
+                _write_json(dead_path, merged)
+                for path in merged_paths:
+                    path.unlink(missing_ok=True)
+        return len(merged_paths)
+
+    def collect_snapshots(self) -> list[dict]:
+        """현재 프로세스 지표 + (설정 시) 다른 워커들이 저장한 지표"""
+        snapshots = [self.snapshot()]
+        if not METRICS_MULTIPROC_DIR:
+            return snapshots
+        for path in Path(METRICS_MULTIPROC_DIR).glob("*.json"):
+            snapshot = _read_snapshot(path)
+            if snapshot is None or snapshot["pid"] == os.getpid():
+                continue
+            if snapshot["pid"] is None:
+                # dead.json: 종료된 워커들의 누적값 (요청 수/카운터, 게이지 없음)
+                snapshots.append(snapshot)
+                continue
+            # 종료된 워커의 요청 수/히스토그램/카운터는 누적값이므로 유지하고, 순간값(게이지)은 제외합니다.
+            if not _pid_alive(snapshot["pid"]):
+                snapshot["in_flight"] = 0
+                snapshot["gauges"] = []
+            snapshots.append(snapshot)
+        return snapshots
+
+    def render(self) -> str:
+        """모든 워커 지표를 합쳐 Prometheus 텍스트 형식으로 변환"""
+        requests: dict[tuple, list] = {}
+        # (이름, 라벨) -> 합계, 이름 -> (종류, 설명)
+        values: dict[tuple, float] = {}
+        families: dict[str, tuple[str, str]] = {}
+        in_flight = 0
+        for snapshot in self.collect_snapshots():
+            for method, route, status, *series in snapshot["requests"]:
+                merged = requests.setdefault((method, route, status), [0] * len(series))
+                for i, value in enumerate(series):
+                    merged[i] += value
+            for kind, rows in ((GAUGE, snapshot["gauges"]), (COUNTER, snapshot.get("counters", []))):
+                for name, help_text, labels, value in rows:
+                    key = _series_key(name, labels)
+                    values[key] = values.get(key, 0) + value
+                    families[name] = (kind, help_text)
+            in_flight += snapshot["in_flight"]
+
+        lines = [
+            "# HELP http_requests_total Total HTTP requests by route template, method and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), series in sorted(requests.items()):
+            lines.append(f"http_requests_total{{{_labels(method=method, route=route, status=status)}}} {series[0]}")
+
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency by route template, method and status.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route, status), series in sorted(requests.items()):
+            labels = _labels(method=method, route=route, status=status)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series[2:]):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {series[1]:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {series[0]}")
+
+        lines += [
+            "# HELP http_requests_in_flight HTTP requests currently being processed.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+        ]
+
+        for name in sorted(families):
+            kind, help_text = families[name]
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for (series_name, labels), value in sorted(values.items()):
+                if series_name == name:
+                    label_text = _labels(**dict(labels))
+                    lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    async def flush_periodically(self, directory: str, interval: float):
+        """lifespan에서 백그라운드로 실행: 종료된 워커의 파일을 정리한 뒤 주기적으로 지표 파일 갱신"""
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.merge_dead_snapshots(directory)
+        try:
+            while True:
+                self.write_snapshot(directory)
+                await asyncio.sleep(interval)
+        finally:
+            # 종료 직전까지의 누적값을 남겨 두어 재시작 후에도 합계가 줄지 않게 합니다. (다음 기동 시 dead.json에 합쳐짐)
+            self.write_snapshot(directory)
+
+
+metrics = MetricsRegistry()
+
+
+def register_default_collectors():
+    """DB 풀, bcrypt 스레드 풀, 예약 잠금 대기열 상태를 게이지로, 풀 대기 시간 초과 수를 카운터로 노출"""
+    from app.database import pool_stats
+    from app.services.booking_lock import booking_lock
+    from app.services.password_hasher import password_hasher
+
+    def collect():
+        values = []
+        for engine_name, stats in pool_stats().items():
+            if stats is None:
+                continue
+            labels = {"engine": engine_name}
+            values += [
+                (GAUGE, "db_pool_checked_out", "DB connections currently checked out.", labels, stats["checked_out"]),
+                (GAUGE, "db_pool_overflow", "DB connections opened beyond pool_size.", labels, stats["overflow"]),
+                (COUNTER, "db_pool_checkout_timeouts_total", "Pool checkout timeouts.", labels, stats["timeouts"]),
+            ]
+        values += [
+            (GAUGE, "bcrypt_pending", "Password hashing jobs running or queued.", {}, password_hasher.pending),
+            (GAUGE, "booking_lock_waiting", "Reservation writes waiting for the booking lock.", {}, booking_lock.waiting),
+        ]
+        return values
+
+    metrics.register_collector(collect)
@@ -0,0 +1,21 @@
+from time import perf_counter
+
+
+class FirstRequestTimer:
+    """[v2.3] 첫 HTTP 응답이 나간 시각을 기록합니다 (기동 후 첫 요청까지 걸린 시간 측정용)"""
+
+    def __init__(self, app, stats: dict):
+        self.app = app
+        self.stats = stats
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "first_request_at" in self.stats:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_and_mark(message):
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                self.stats.setdefault("first_request_at", perf_counter())
+
+        await self.app(scope, receive, send_and_mark)
@@ -0,0 +1,38 @@
+from time import perf_counter
+from app.metrics import MetricsRegistry
+
+# 라우트에 매칭되지 않은 요청(404 등)은 경로별로 나누지 않습니다 (라벨 수 폭증 방지).
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """[v2.3] 요청마다 (메서드, 라우트 템플릿, 상태 코드)별 지연 시간과 처리 중 요청 수를 기록"""
+
+    def __init__(self, app, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = perf_counter()
+        self.registry.in_flight += 1
+
+        async def send_and_capture(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_capture)
+        finally:
+            self.registry.in_flight -= 1
+            # 라우팅이 끝나면 FastAPI가 scope["route"]에 매칭된 라우트를 남깁니다 (/rooms/{room_id} 형태).
+            route = scope.get("route")
+            self.registry.observe(
+                scope["method"], getattr(route, "path", UNMATCHED_ROUTE), status, perf_counter() - started
+            )
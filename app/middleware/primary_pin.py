@@ -0,0 +1,33 @@
+from time import time
+from app.database import PRIMARY_PIN_COOKIE
+
+# 데이터를 바꾸지 않는 메서드 (이 요청들은 고정 쿠키를 심지 않습니다)
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class PrimaryPinMiddleware:
+    """
+    [v2.3] 쓰기 요청(POST/PATCH/DELETE 등)이 성공하면 응답에 쿠키를 심어,
+    이후 seconds초 동안 같은 클라이언트의 읽기를 primary DB로 보내게 합니다 (get_read_db 참고).
+    복제 지연 때문에 방금 만든 예약이 "내 예약" 목록에 안 보이는 현상을 막습니다.
+    """
+
+    def __init__(self, app, seconds: float):
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (
+                    f"{PRIMARY_PIN_COOKIE}={time() + self.seconds:.0f}; "
+                    f"Max-Age={int(self.seconds) + 1}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
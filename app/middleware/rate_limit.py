@@ -0,0 +1,256 @@
+import importlib
+import ipaddress
+import json
+import math
+import os
+from collections import Counter, OrderedDict
+from time import monotonic
+from app.database import DB_MAX_OVERFLOW, DB_POOL_SIZE
+from app.metrics import COUNTER, GAUGE
+from app.services.password_hasher import BCRYPT_MAX_PENDING
+
+# [v2.3] 요청 제한(rate limit) / 동시 처리 제한 설정
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# 로그인/회원가입: IP별 분당 허용 횟수와 한 번에 몰아 쓸 수 있는 여유분(burst)
+RATE_LIMIT_AUTH_PER_MINUTE = float(os.getenv("RATE_LIMIT_AUTH_PER_MINUTE", 10))
+RATE_LIMIT_AUTH_BURST = int(os.getenv("RATE_LIMIT_AUTH_BURST", 5))
+# 로그인/회원가입을 동시에 처리하는 최대 요청 수 (워커당). 기본값은 bcrypt 대기열 상한과 같습니다.
+RATE_LIMIT_AUTH_CONCURRENCY = int(os.getenv("RATE_LIMIT_AUTH_CONCURRENCY", BCRYPT_MAX_PENDING))
+# 예약/리뷰 쓰기: 유저별(토큰이 없으면 IP별) 분당 허용 횟수와 burst
+RATE_LIMIT_WRITE_PER_MINUTE = float(os.getenv("RATE_LIMIT_WRITE_PER_MINUTE", 60))
+RATE_LIMIT_WRITE_BURST = int(os.getenv("RATE_LIMIT_WRITE_BURST", 10))
+# 쓰기를 동시에 처리하는 최대 요청 수 (워커당). 기본값은 DB 풀 최대 연결 수의 2배입니다.
+RATE_LIMIT_WRITE_CONCURRENCY = int(os.getenv("RATE_LIMIT_WRITE_CONCURRENCY", 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+# 프록시 뒤에서 실행할 때 믿을 수 있는 프록시 주소/대역 (쉼표 구분, 예: "10.0.0.0/8,127.0.0.1")
+# 직접 연결한 상대가 이 목록에 있을 때만 X-Forwarded-For를 오른쪽부터 읽어, 목록에 없는 첫 주소를 클라이언트 IP로 씁니다.
+# 맨 앞(왼쪽) 값은 클라이언트가 마음대로 넣을 수 있으므로 쓰지 않습니다. 비우면 헤더를 무시합니다.
+# (uvicorn --proxy-headers --forwarded-allow-ips로 scope["client"]를 고쳐 쓰는 경우에는 비워 둡니다)
+RATE_LIMIT_TRUSTED_PROXIES = [
+    ipaddress.ip_network(value.strip(), strict=False)
+    for value in os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",") if value.strip()
+]
+# 버킷 저장소 ("모듈:이름" 형식, 비우면 프로세스 내 저장소). 여러 워커가 한도를 공유하려면 외부 저장소를 지정합니다.
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND")
+# 프로세스 내 저장소가 기억하는 최대 키 수 (가장 오래 쓰이지 않은 키부터 버림)
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 10000))
+
+RATE_LIMITED_DETAIL = "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요."
+OVERLOADED_DETAIL = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."
+
+
+class InMemoryBucketBackend:
+    """
+    토큰 버킷 저장소 (프로세스 내, 워커마다 따로 셉니다).
+    다른 저장소(Redis 등)를 쓰려면 같은 시그니처의 async take()를 구현한 객체를 RATE_LIMIT_BACKEND로 지정합니다.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """토큰 1개를 씁니다. 허용되면 0, 거부되면 다음 토큰이 찰 때까지 남은 시간(초)"""
+        now = monotonic()
+        tokens, updated = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def stats(self) -> dict:
+        return {"keys": len(self._buckets), "max_keys": self.max_keys}
+
+
+def load_backend(path: str | None):
+    if not path:
+        return InMemoryBucketBackend(RATE_LIMIT_MAX_KEYS)
+    module_name, _, attr = path.partition(":")
+    backend = getattr(importlib.import_module(module_name), attr)
+    # 클래스나 팩토리 함수를 지정했으면 인스턴스를 만듭니다.
+    return backend() if isinstance(backend, type) or not hasattr(backend, "take") else backend
+
+
+class RouteGroup:
+    """같은 한도를 적용받는 요청 묶음 (메서드 + 경로 접두사)"""
+
+    def __init__(self, name: str, methods: set[str], prefixes: tuple[str, ...], per_minute: float, burst: int,
+                 concurrency: int, per_user: bool):
+        self.name = name
+        self.methods = methods
+        self.prefixes = prefixes
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.concurrency = concurrency
+        # True면 로그인 유저 단위, False면 IP 단위로 셉니다.
+        self.per_user = per_user
+        self.in_flight = 0
+
+    def matches(self, method: str, path: str) -> bool:
+        return method in self.methods and path.startswith(self.prefixes)
+
+
+class RateLimiter:
+    """route group별 토큰 버킷(클라이언트 단위) + 동시 처리 수 제한과 거부 카운터"""
+
+    def __init__(self, groups: list[RouteGroup], backend):
+        self.groups = groups
+        self.backend = backend
+        self.allowed: Counter = Counter()
+        # (group, "rate" | "concurrency") -> 거부 수
+        self.rejected: Counter = Counter()
+
+    def group_for(self, method: str, path: str) -> RouteGroup | None:
+        for group in self.groups:
+            if group.matches(method, path):
+                return group
+        return None
+
+    def stats(self) -> dict:
+        result = {
+            group.name: {
+                "in_flight": group.in_flight,
+                "concurrency": group.concurrency,
+                "per_minute": group.rate * 60,
+                "burst": group.burst,
+                "allowed": self.allowed[group.name],
+                "rejected_rate": self.rejected[(group.name, "rate")],
+                "rejected_concurrency": self.rejected[(group.name, "concurrency")],
+            }
+            for group in self.groups
+        }
+        if hasattr(self.backend, "stats"):
+            result["backend"] = self.backend.stats()
+        return result
+
+    def collect(self):
+        """Prometheus 지표 (app.metrics collector 형식): 처리 중 요청 수는 게이지, 거부 수는 카운터"""
+        values = []
+        for group in self.groups:
+            values.append((GAUGE, "rate_limit_in_flight", "Requests in flight per rate-limited route group.",
+                           {"group": group.name}, group.in_flight))
+            for reason in ("rate", "concurrency"):
+                values.append((COUNTER, "rate_limit_rejected_total", "Requests rejected by the rate limiter.",
+                               {"group": group.name, "reason": reason}, self.rejected[(group.name, reason)]))
+        return values
+
+
+rate_limiter = RateLimiter(
+    groups=[
+        RouteGroup("auth", {"POST"}, ("/auth/login", "/auth/signup"),
+                   RATE_LIMIT_AUTH_PER_MINUTE, RATE_LIMIT_AUTH_BURST, RATE_LIMIT_AUTH_CONCURRENCY, per_user=False),
+        RouteGroup("write", {"POST", "PATCH", "PUT", "DELETE"}, ("/reservations", "/reviews"),
+                   RATE_LIMIT_WRITE_PER_MINUTE, RATE_LIMIT_WRITE_BURST, RATE_LIMIT_WRITE_CONCURRENCY, per_user=True),
+    ],
+    backend=load_backend(RATE_LIMIT_BACKEND),
+)
+
+
+def _header(scope, name: bytes) -> str | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _trusted(address: str, proxies) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in proxies)
+
+
+def client_ip(scope, trusted_proxies=RATE_LIMIT_TRUSTED_PROXIES) -> str:
+    """
+    직접 연결한 주소. 그 주소가 믿을 수 있는 프록시면 X-Forwarded-For를 오른쪽(가장 가까운 프록시가 붙인 값)부터
+    거슬러 올라가 처음 만나는 믿을 수 없는 주소를 씁니다. 프록시는 헤더 끝에 덧붙이므로 이 값은 위조할 수 없습니다.
+    """
+    client = scope.get("client")
+    peer = client[0] if client else "unknown"
+    if not trusted_proxies or not _trusted(peer, trusted_proxies):
+        return peer
+    forwarded = _header(scope, b"x-forwarded-for")
+    if not forwarded:
+        return peer
+    for address in reversed([value.strip() for value in forwarded.split(",")]):
+        if not _trusted(address, trusted_proxies):
+            return address
+    # 모든 주소가 프록시: 가장 바깥 프록시를 클라이언트로 봅니다.
+    return address
+
+
+def client_key(scope, per_user: bool) -> str:
+    """유저 단위 그룹은 검증된 토큰의 sub, 토큰이 없거나 유효하지 않으면 IP"""
+    if per_user:
+        from app.services.auth_service import decode_token
+
+        authorization = _header(scope, b"authorization")
+        if authorization and authorization[:7].lower() == "bearer ":
+            payload = decode_token(authorization[7:])
+            if payload is not None:
+                return f"user:{payload['sub']}"
+    return f"ip:{client_ip(scope)}"
+
+
+async def _reject(send, status: int, detail: str, retry_after: float):
+    body = json.dumps({"detail": detail}, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """
+    [v2.3] 로그인/쓰기 요청의 과도한 반복을 DB·bcrypt에 닿기 전에 차단합니다.
+    1. 클라이언트별 토큰 버킷이 비었으면 429 (Retry-After: 다음 토큰까지 남은 초)
+    2. 그룹 전체의 동시 처리 수가 상한이면 대기열에 넣지 않고 바로 503 (Retry-After: 1)
+    한 클라이언트가 반복 요청을 보내도 먼저 429로 걸러지므로 다른 유저의 지연 시간이 유지됩니다.
+    """
+
+    def __init__(self, app, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        group = self.limiter.group_for(scope["method"], scope["path"])
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 분당 허용 횟수가 0이면 그 그룹은 동시 처리 수만 제한합니다.
+        wait = 0.0
+        if group.rate > 0:
+            key = f"{group.name}:{client_key(scope, group.per_user)}"
+            wait = await self.limiter.backend.take(key, group.rate, group.burst)
+        if wait > 0:
+            self.limiter.rejected[(group.name, "rate")] += 1
+            await _reject(send, 429, RATE_LIMITED_DETAIL, wait)
+            return
+        if group.in_flight >= group.concurrency:
+            self.limiter.rejected[(group.name, "concurrency")] += 1
+            await _reject(send, 503, OVERLOADED_DETAIL, 1)
+            return
+
+        self.limiter.allowed[group.name] += 1
+        group.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            group.in_flight -= 1
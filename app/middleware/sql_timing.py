@@ -0,0 +1,100 @@
+import logging
+import os
+from collections import Counter
+from contextvars import ContextVar
+from time import perf_counter
+from sqlalchemy import event
+
+logger = logging.getLogger("uvicorn.error")
+
+# [v2.3] 요청 단위 SQL 계측 설정
+SQL_TIMING_ENABLED = os.getenv("SQL_TIMING_ENABLED", "true").lower() == "true"
+# 한 요청에서 같은 형태의 SQL이 이 횟수보다 많이 실행되면 N+1 의심 경고 (0: 사용 안 함)
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", 0))
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 SQL 수, 누적 DB 시간, 문장 형태별 실행 횟수"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def server_timing(self) -> str:
+        return f'db;desc="{self.count} queries";dur={self.seconds * 1000:.2f}'
+
+
+# 현재 요청의 지표 (요청 밖에서 실행되는 SQL은 집계하지 않음)
+current_query_stats: ContextVar[RequestQueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    stats = current_query_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.seconds += perf_counter() - started
+    # 바인딩 파라미터는 자리표시자로 남아 있으므로 문장 자체가 "형태"입니다.
+    stats.shapes[statement] += 1
+
+
+def _handle_error(exception_context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리합니다.
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine):
+    """엔진에 SQL 계측 이벤트를 등록합니다 (AsyncEngine은 sync_engine에 등록)"""
+    target = engine.sync_engine
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
+
+
+class SQLTimingMiddleware:
+    """
+    [v2.3] 요청마다 SQL 실행 수와 DB 시간을 모아 Server-Timing 응답 헤더로 내보냅니다.
+    (브라우저 개발자 도구 Network > Timing 탭에서 바로 확인 가능)
+    N+1 감지 임계값이 설정되어 있으면 응답 후 반복 실행된 문장을 경고로 남깁니다.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int = 0):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = [*message.get("headers", []), (b"server-timing", stats.server_timing().encode("latin-1"))]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            if self.n_plus_one_threshold:
+                self._warn_repeated(scope, stats)
+
+    def _warn_repeated(self, scope, stats: RequestQueryStats):
+        for statement, count in stats.shapes.items():
+            if count > self.n_plus_one_threshold:
+                logger.warning(
+                    "N+1 의심: %s %s 에서 같은 SQL이 %d회 실행됨: %s",
+                    scope["method"], scope["path"], count, " ".join(statement.split())[:200],
+                )
@@ -1,9 +1,13 @@
 from .reservation import Reservation
+from .reservation_archive import ReservationArchive
 
 from .room import StudyRoom
 from .review import Review
+from .resource_version import ResourceVersion
+from .room_rating import RoomRatingSummary
 from .user import User
+from .user_daily_usage import UserDailyUsage
 from ..database import Base
 
-__all__ = ["Base", "Reservation", "StudyRoom", "Review", "User"]
+__all__ = ["Base", "Reservation", "ReservationArchive", "StudyRoom", "Review", "ResourceVersion", "RoomRatingSummary", "User", "UserDailyUsage"]
 # __all__ = ["Base", "User", "Reservation"]
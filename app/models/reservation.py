@@ -1,4 +1,5 @@
-from sqlalchemy import ForeignKey, Date, func
+from sqlalchemy import DDL, ForeignKey, Date, Index, event, func, literal, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 from datetime import date, datetime
@@ -10,9 +11,41 @@ if TYPE_CHECKING:
     from app.models.review import Review
 
 
+# [v2.3] 부분 인덱스/제약조건이 적용되는 "유효한 예약" 조건 (취소된 예약 제외)
+ACTIVE_RESERVATION_SQL = "status <> 'CANCELLED'"
+# [v2.3] 아직 시작하지 않은 예약 조건
+# 저장된 상태는 CONFIRMED → IN_USE → COMPLETED 순으로 정시마다 상태 갱신 작업이 옮기므로
+# 이 부분 인덱스에는 앞으로의 예약만 남습니다.
+UPCOMING_RESERVATION_SQL = "status = 'CONFIRMED'"
+
+
 # 강의 예약 모델(중계테이블)
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        # [v2.3] 중복 체크/방 검색(방 + 날짜 + 시간), 유저 중복 체크(유저 + 날짜 + 시간)
+        # 취소된 예약은 조회 대상이 아니므로 부분 인덱스로 크기를 줄입니다.
+        Index(
+            "ix_reservations_room_date_active", "room_id", "reservation_date", "start_time", "end_time",
+            postgresql_where=text(ACTIVE_RESERVATION_SQL), sqlite_where=text(ACTIVE_RESERVATION_SQL),
+        ),
+        Index(
+            "ix_reservations_user_date_active", "user_id", "reservation_date", "start_time", "end_time",
+            postgresql_where=text(ACTIVE_RESERVATION_SQL), sqlite_where=text(ACTIVE_RESERVATION_SQL),
+        ),
+        # 날짜 범위 조회 (예약 가능 달력, 현재 사용 중인 방)
+        Index(
+            "ix_reservations_date_active", "reservation_date",
+            postgresql_where=text(ACTIVE_RESERVATION_SQL), sqlite_where=text(ACTIVE_RESERVATION_SQL),
+        ),
+        # 내 예약 목록 (날짜, 시작 시간, id) 키셋 페이지네이션
+        Index("ix_reservations_user_list", "user_id", "reservation_date", "start_time", "id"),
+        # [v2.3] 내 예약 중 "예정된 예약만" 조회
+        Index(
+            "ix_reservations_user_upcoming", "user_id", "reservation_date", "start_time", "id",
+            postgresql_where=text(UPCOMING_RESERVATION_SQL), sqlite_where=text(UPCOMING_RESERVATION_SQL),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -32,3 +65,44 @@ class Reservation(Base):
     reviews: Mapped[List["Review"]] = relationship(
         "Review", back_populates="reservation"
     )
+
+
+
+def active_reservation():
+    """
+    취소되지 않은 예약 조건식.
+    값을 바인드 파라미터가 아닌 리터럴로 렌더링해야 PostgreSQL 플래너가
+    부분 인덱스 조건(status <> 'CANCELLED')과 일치함을 판단할 수 있습니다.
+    """
+    return Reservation.status != literal("CANCELLED", literal_execute=True)
+
+
+def upcoming_reservation():
+    """아직 시작 전으로 저장된 예약 조건식 (부분 인덱스 ix_reservations_user_upcoming과 일치)"""
+    return Reservation.status == literal("CONFIRMED", literal_execute=True)
+
+
+# [v2.3] DB 레벨 중복 예약 차단 (PostgreSQL 전용)
+# 같은 방(또는 같은 유저)·같은 날짜에서 [시작, 종료) 구간이 겹치는 유효한 예약을 거부합니다.
+# 정수/날짜의 = 연산을 GiST 인덱스에서 쓰기 위해 btree_gist 확장이 필요합니다.
+ROOM_OVERLAP_CONSTRAINT = "ex_reservations_room_no_overlap"
+USER_OVERLAP_CONSTRAINT = "ex_reservations_user_no_overlap"
+
+for _name, _owner in ((ROOM_OVERLAP_CONSTRAINT, Reservation.__table__.c.room_id),
+                      (USER_OVERLAP_CONSTRAINT, Reservation.__table__.c.user_id)):
+    Reservation.__table__.append_constraint(
+        ExcludeConstraint(
+            (_owner, "="),
+            (Reservation.__table__.c.reservation_date, "="),
+            (func.int4range(Reservation.__table__.c.start_time, Reservation.__table__.c.end_time), "&&"),
+            name=_name,
+            using="gist",
+            where=text(ACTIVE_RESERVATION_SQL),
+        ).ddl_if(dialect="postgresql")
+    )
+
+event.listen(
+    Reservation.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,27 @@
+from datetime import date, datetime
+from sqlalchemy import Date, ForeignKey, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+# [v2.3] 지난 예약 보관 테이블
+# 오래된 COMPLETED/CANCELLED 예약을 보관 작업이 reservations에서 이곳으로 옮겨,
+# 중복 체크/목록 조회가 도는 reservations 테이블에는 최근 예약만 남깁니다.
+# 컬럼은 reservations와 같고(id도 그대로 유지), 옮긴 시각만 추가됩니다.
+class ReservationArchive(Base):
+    __tablename__ = "reservations_archive"
+    __table_args__ = (
+        # 내 예약 목록 (날짜, 시작 시간, id) 키셋 페이지네이션
+        Index("ix_reservations_archive_user_list", "user_id", "reservation_date", "start_time", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id"), nullable=False)
+
+    reservation_date: Mapped[date] = mapped_column(Date, nullable=False)
+    start_time: Mapped[int] = mapped_column(nullable=False)
+    end_time: Mapped[int] = mapped_column(nullable=False)
+    status: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    canceled_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(server_default=func.now())
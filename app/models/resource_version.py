@@ -0,0 +1,12 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+# [v2.3] 조건부 GET(ETag)용 리소스 버전
+# 쓰기 트랜잭션 안에서 해당 리소스의 version을 1 올리고, 읽기 API는 이 값으로 ETag를 만듭니다.
+# DB에 두므로 여러 워커가 같은 버전을 봅니다.
+class ResourceVersion(Base):
+    __tablename__ = "resource_versions"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)  # 예: "rooms", "reservations:user:3"
+    version: Mapped[int] = mapped_column(default=0, server_default="0")
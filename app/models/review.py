@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 from typing import TYPE_CHECKING
@@ -13,6 +13,11 @@ if TYPE_CHECKING:
 # 리뷰 모델(중계테이블)
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # [v2.3] 방별/유저별 리뷰 최신순 키셋 페이지네이션용
+        Index("ix_reviews_room_id_id", "room_id", "id"),
+        Index("ix_reviews_user_id_id", "user_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
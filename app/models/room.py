@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 from typing import List, TYPE_CHECKING
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
 # 스터디룸 모델
 class StudyRoom(Base):
     __tablename__ = "rooms"
+    __table_args__ = (
+        # [v2.3] 조건 검색용: 운영 중인 방을 수용 인원 순으로 탐색
+        Index("ix_rooms_active_capacity", "is_active", "capacity"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(nullable=False) # 방 이름
@@ -0,0 +1,26 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+# [v2.3] 방별 평점 집계 (리뷰 작성/삭제와 같은 트랜잭션에서 증감)
+# 목록 화면에서 리뷰 전체를 읽어 평균을 내지 않도록 개수/합계/점수별 개수를 미리 유지합니다.
+class RoomRatingSummary(Base):
+    __tablename__ = "room_rating_summaries"
+
+    room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id", ondelete="CASCADE"), primary_key=True)
+    review_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(default=0, server_default="0")
+    # 점수별 리뷰 수 (히스토그램)
+    rating_1: Mapped[int] = mapped_column(default=0, server_default="0")
+    rating_2: Mapped[int] = mapped_column(default=0, server_default="0")
+    rating_3: Mapped[int] = mapped_column(default=0, server_default="0")
+    rating_4: Mapped[int] = mapped_column(default=0, server_default="0")
+    rating_5: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    @property
+    def average(self) -> float | None:
+        return round(self.rating_sum / self.review_count, 2) if self.review_count else None
+
+    @property
+    def histogram(self) -> dict[int, int]:
+        return {score: getattr(self, f"rating_{score}") for score in range(1, 6)}
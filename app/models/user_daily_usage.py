@@ -0,0 +1,13 @@
+from datetime import date
+from sqlalchemy import Date, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+# [v2.3] 유저별·날짜별 예약 시간 합계 (예약 생성/수정/취소와 같은 트랜잭션에서 증감)
+# 하루 최대 이용 시간 확인을 예약 목록 SUM 대신 기본키 조회 한 번으로 처리합니다.
+class UserDailyUsage(Base):
+    __tablename__ = "user_daily_usage"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    usage_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    booked_hours: Mapped[int] = mapped_column(default=0, server_default="0")  # 취소되지 않은 예약 시간 합계
@@ -0,0 +1,185 @@
+import asyncio
+import os
+from datetime import date
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.reservation import Reservation, active_reservation
+
+# 인덱스 사용 여부 (기본: 사용 안 함)
+# 프로세스 메모리에 보관되므로 다른 워커에서 생긴 예약은 보이지 않습니다.
+# 단일 워커로 운영하거나, DB 제약조건이 최종 중복을 막아줄 때 켜는 것을 권장합니다.
+OCCUPANCY_INDEX_ENABLED = os.getenv("OCCUPANCY_INDEX_ENABLED", "false").lower() == "true"
+
+
+def slot_mask(start: int, end: int) -> int:
+    """[start, end) 시간 구간을 24비트 마스크로 변환 (예: 14~16시 -> 14, 15번 비트)"""
+    return ((1 << (end - start)) - 1) << start
+
+
+class OccupancyIndex:
+    """
+    (room_id, 날짜), (user_id, 날짜) 단위의 하루 점유 비트맵.
+    예약은 정시 단위(9~22시)이므로 하루치 예약이 정수 하나에 모두 들어갑니다.
+    날짜별로 처음 조회될 때 DB에서 한 번에 불러오고, 이후에는 예약 생성/수정/취소 시 갱신합니다.
+    """
+
+    def __init__(self):
+        self._room_masks: dict[tuple[int, date], int] = {}
+        self._user_masks: dict[tuple[int, date], int] = {}
+        self._loaded_dates: set[date] = set()
+        # 로딩 중인 날짜별 쓰기 횟수: 로딩 도중 쓰기가 끼어들면 다시 읽기 위해 사용
+        self._write_counts: dict[date, int] = {}
+        # 로딩 중인 날짜 -> 로딩 결과(성공 여부). 같은 날짜의 동시 조회는 첫 요청의 로딩을 기다립니다.
+        self._loading: dict[date, asyncio.Future] = {}
+
+    async def _scan(self, db: AsyncSession, dates):
+        """지정한 날짜들의 취소되지 않은 예약을 한 번의 쿼리로 읽어 마스크를 계산"""
+        result = await db.execute(
+            select(
+                Reservation.room_id,
+                Reservation.user_id,
+                Reservation.reservation_date,
+                Reservation.start_time,
+                Reservation.end_time,
+            ).where(
+                and_(
+                    Reservation.reservation_date.in_(list(dates)),
+                    active_reservation(),
+                )
+            )
+        )
+        room_masks: dict[tuple[int, date], int] = {}
+        user_masks: dict[tuple[int, date], int] = {}
+        for room_id, user_id, res_date, start, end in result.all():
+            mask = slot_mask(start, end)
+            room_masks[(room_id, res_date)] = room_masks.get((room_id, res_date), 0) | mask
+            user_masks[(user_id, res_date)] = user_masks.get((user_id, res_date), 0) | mask
+        return room_masks, user_masks
+
+    async def ensure_loaded(self, db: AsyncSession, target_date: date) -> bool:
+        """
+        날짜를 인덱스에 불러옵니다. 같은 날짜는 한 요청만 DB를 읽고 나머지는 그 결과를 기다립니다.
+        쓰기가 계속 끼어들어 일관된 결과를 얻지 못했으면 불러온 것으로 표시하지 않고 False를 반환합니다.
+        """
+        if target_date in self._loaded_dates:
+            return True
+        pending = self._loading.get(target_date)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[target_date] = future
+        self._write_counts[target_date] = 0
+        loaded = False
+        try:
+            self._evict_past()
+            for _ in range(3):
+                writes_before = self._write_counts[target_date]
+                room_masks, user_masks = await self._scan(db, [target_date])
+                # 조회하는 사이에 같은 날짜에 쓰기가 끼어들었다면 결과가 낡았을 수 있으므로 다시 읽습니다.
+                if self._write_counts[target_date] == writes_before:
+                    self._replace({target_date}, room_masks, user_masks)
+                    self._loaded_dates.add(target_date)
+                    loaded = True
+                    break
+        finally:
+            del self._loading[target_date]
+            del self._write_counts[target_date]
+            future.set_result(loaded)
+        return loaded
+
+    async def _day_masks(self, db: AsyncSession, res_date: date):
+        """(방 마스크, 유저 마스크). 인덱스에 불러오지 못한 날짜는 DB에서 직접 읽은 결과를 씁니다."""
+        if await self.ensure_loaded(db, res_date):
+            return self._room_masks, self._user_masks
+        return await self._scan(db, [res_date])
+
+    def _evict_past(self):
+        """지난 날짜는 더 이상 예약/수정 대상이 아니므로 메모리에서 정리"""
+        today = date.today()
+        past = {d for d in self._loaded_dates if d < today}
+        if not past:
+            return
+        self._replace(past, {}, {})
+        self._loaded_dates -= past
+
+    def _replace(self, dates, room_masks, user_masks):
+        """해당 날짜들의 기존 마스크를 지우고 새로 읽은 마스크로 교체"""
+        for masks, fresh in ((self._room_masks, room_masks), (self._user_masks, user_masks)):
+            for key in [k for k in masks if k[1] in dates]:
+                del masks[key]
+            masks.update(fresh)
+
+    async def room_conflict(self, db: AsyncSession, room_id: int, res_date: date, start: int, end: int, ignore_mask: int = 0) -> bool:
+        """[규칙 5] 방 중복 체크. ignore_mask로 수정 중인 자기 자신의 구간을 제외합니다."""
+        room_masks, _ = await self._day_masks(db, res_date)
+        occupied = room_masks.get((room_id, res_date), 0) & ~ignore_mask
+        return bool(occupied & slot_mask(start, end))
+
+    async def user_conflict(self, db: AsyncSession, user_id: int, res_date: date, start: int, end: int, ignore_mask: int = 0) -> bool:
+        """[규칙 7] 유저 중복 체크"""
+        _, user_masks = await self._day_masks(db, res_date)
+        occupied = user_masks.get((user_id, res_date), 0) & ~ignore_mask
+        return bool(occupied & slot_mask(start, end))
+
+    def _mark_write(self, res_date: date):
+        if res_date in self._write_counts:
+            self._write_counts[res_date] += 1
+
+    def add(self, room_id: int, user_id: int, res_date: date, start: int, end: int):
+        """커밋이 끝난 예약을 인덱스에 반영"""
+        self._mark_write(res_date)
+        if res_date not in self._loaded_dates:
+            # 아직 불러오지 않은 날짜는 다음 조회 때 DB에서 함께 읽힙니다.
+            return
+        mask = slot_mask(start, end)
+        self._room_masks[(room_id, res_date)] = self._room_masks.get((room_id, res_date), 0) | mask
+        self._user_masks[(user_id, res_date)] = self._user_masks.get((user_id, res_date), 0) | mask
+
+    def remove(self, room_id: int, user_id: int, res_date: date, start: int, end: int):
+        """취소되었거나 시간이 변경된 예약의 기존 구간을 인덱스에서 제거"""
+        self._mark_write(res_date)
+        if res_date not in self._loaded_dates:
+            return
+        mask = ~slot_mask(start, end)
+        for masks, key in ((self._room_masks, (room_id, res_date)), (self._user_masks, (user_id, res_date))):
+            remaining = masks.get(key, 0) & mask
+            if remaining:
+                masks[key] = remaining
+            else:
+                masks.pop(key, None)
+
+    async def verify(self, db: AsyncSession) -> list[dict]:
+        """불러온 날짜들에 대해 인덱스와 DB 테이블을 대조하여 불일치 목록을 반환"""
+        if not self._loaded_dates:
+            return []
+        dates = set(self._loaded_dates)
+        room_masks, user_masks = await self._scan(db, dates)
+
+        mismatches = []
+        for kind, expected, actual in (
+            ("room", room_masks, self._room_masks),
+            ("user", user_masks, self._user_masks),
+        ):
+            keys = {k for k in expected} | {k for k in actual if k[1] in dates}
+            for key in keys:
+                if expected.get(key, 0) != actual.get(key, 0):
+                    mismatches.append({
+                        "kind": kind,
+                        "id": key[0],
+                        "date": key[1],
+                        "expected": expected.get(key, 0),
+                        "actual": actual.get(key, 0),
+                    })
+        return mismatches
+
+    async def rebuild(self, db: AsyncSession):
+        """불러온 날짜들을 DB에서 다시 읽어 인덱스를 새로 구성"""
+        dates = set(self._loaded_dates)
+        if not dates:
+            return
+        room_masks, user_masks = await self._scan(db, dates)
+        self._replace(dates, room_masks, user_masks)
+
+
+occupancy_index = OccupancyIndex()
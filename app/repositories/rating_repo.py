@@ -0,0 +1,60 @@
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.review import Review
+from app.models.room_rating import RoomRatingSummary
+
+class RatingSummaryRepository:
+    async def apply(self, db: AsyncSession, room_id: int, rating: int, delta: int):
+        """
+        리뷰 1건 작성(delta=1)/삭제(delta=-1)를 집계에 반영합니다. commit은 서비스에서 합니다.
+        읽고-계산하고-쓰는 대신 UPDATE 한 문장으로 증감하므로 동시에 리뷰가 달려도 값이 유실되지 않습니다.
+        """
+        values = {
+            "review_count": RoomRatingSummary.review_count + delta,
+            "rating_sum": RoomRatingSummary.rating_sum + rating * delta,
+            f"rating_{rating}": getattr(RoomRatingSummary, f"rating_{rating}") + delta,
+        }
+        stmt = update(RoomRatingSummary).where(RoomRatingSummary.room_id == room_id).values(**values)
+        result = await db.execute(stmt)
+        if result.rowcount or delta < 0:
+            return
+
+        # 방의 첫 리뷰: 집계 행을 만듭니다.
+        # 다른 요청이 먼저 만들었다면 savepoint만 되돌리고 UPDATE로 다시 반영합니다.
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(RoomRatingSummary).values(
+                    room_id=room_id, review_count=1, rating_sum=rating, **{f"rating_{rating}": 1}
+                ))
+        except IntegrityError:
+            await db.execute(stmt)
+
+    async def get_by_room(self, db: AsyncSession, room_id: int):
+        # UPDATE 문으로 증감한 직후에도 세션에 남은 이전 값이 아닌 DB 값을 읽습니다.
+        result = await db.execute(
+            select(RoomRatingSummary).where(RoomRatingSummary.room_id == room_id).execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_all(self, db: AsyncSession) -> dict[int, RoomRatingSummary]:
+        result = await db.execute(select(RoomRatingSummary))
+        return {summary.room_id: summary for summary in result.scalars().all()}
+
+    async def is_empty(self, db: AsyncSession) -> bool:
+        return await db.scalar(select(RoomRatingSummary.room_id).limit(1)) is None
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """reviews 테이블에서 집계를 처음부터 다시 계산합니다 (최초 배포 백필/정합성 복구용)"""
+        await db.execute(delete(RoomRatingSummary))
+        aggregate = select(
+            Review.room_id,
+            func.count(Review.id),
+            func.sum(Review.rating),
+            *[func.sum(case((Review.rating == score, 1), else_=0)) for score in range(1, 6)],
+        ).group_by(Review.room_id)
+        columns = ["room_id", "review_count", "rating_sum", *[f"rating_{score}" for score in range(1, 6)]]
+        result = await db.execute(insert(RoomRatingSummary).from_select(columns, aggregate))
+        return result.rowcount
+
+rating_repo = RatingSummaryRepository()
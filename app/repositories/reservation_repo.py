@@ -1,6 +1,14 @@
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_, insert, tuple_, update, delete, exists, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.reservation import Reservation
+from app.models.reservation import (
+    Reservation, active_reservation, upcoming_reservation, ROOM_OVERLAP_CONSTRAINT, USER_OVERLAP_CONSTRAINT
+)
+from app.models.reservation_archive import ReservationArchive
+from app.models.review import Review
+
+# [v2.3] 보관 테이블로 옮길 수 있는 상태 (더 이상 바뀌지 않는 상태)
+ARCHIVABLE_STATUSES = ("COMPLETED", "CANCELLED")
 
 class ReservationRepository:
     async def find_overlap(self, db: AsyncSession, res_date, start, end, room_id=None, user_id=None, exclude_id=None):
@@ -10,7 +18,7 @@ class ReservationRepository:
                 Reservation.reservation_date == res_date,
                 Reservation.start_time < end,
                 Reservation.end_time > start,
-                Reservation.status != "CANCELLED"
+                active_reservation()
             )
         )
         
@@ -26,20 +34,126 @@ class ReservationRepository:
         # scalars().first()는 결과가 없으면 None을 반환하므로 서비스 레이어에서 조건문 처리에 최적입니다.
         return result.scalars().first()
 
+    async def find_active_on_dates(self, db: AsyncSession, room_id: int, user_id: int, dates):
+        """[v2.3] 일괄 예약용: 여러 날짜에 걸친 방/유저의 유효한 예약을 한 번의 쿼리로 조회"""
+        result = await db.execute(
+            select(
+                Reservation.room_id,
+                Reservation.user_id,
+                Reservation.reservation_date,
+                Reservation.start_time,
+                Reservation.end_time,
+            ).where(
+                and_(
+                    Reservation.reservation_date.in_(list(dates)),
+                    or_(Reservation.room_id == room_id, Reservation.user_id == user_id),
+                    active_reservation()
+                )
+            )
+        )
+        return result.all()
+
+    async def save_all(self, db: AsyncSession, rows: list[dict]):
+        """[v2.3] 여러 예약을 한 번의 multi-row INSERT로 저장하고 생성된 객체를 반환"""
+        result = await db.scalars(insert(Reservation).returning(Reservation, sort_by_parameter_order=True), rows)
+        return result.all()
+
+    def overlap_violation(self, exc: IntegrityError):
+        """[v2.3] DB 중복 예약 제약조건 위반이면 "room" 또는 "user", 그 외 무결성 에러면 None"""
+        message = str(exc.orig)
+        if ROOM_OVERLAP_CONSTRAINT in message:
+            return "room"
+        if USER_OVERLAP_CONSTRAINT in message:
+            return "user"
+        return None
+
+    async def overlap_constraints_present(self, conn) -> bool:
+        """[v2.3] 방/유저 배타 제약조건이 실제 DB에 모두 있는지 (PostgreSQL이 아니면 항상 False)"""
+        if conn.dialect.name != "postgresql":
+            return False
+        result = await conn.execute(
+            text("SELECT conname FROM pg_constraint WHERE conrelid = 'reservations'::regclass AND contype = 'x'")
+        )
+        return {ROOM_OVERLAP_CONSTRAINT, USER_OVERLAP_CONSTRAINT} <= set(result.scalars().all())
+
+    async def exists_any(self, db: AsyncSession) -> bool:
+        return await db.scalar(select(Reservation.id).limit(1)) is not None
+
     async def get_by_id(self, db: AsyncSession, res_id: int):
         """ID로 단건 조회 (수정/취소 시 검증용)"""
         result = await db.execute(select(Reservation).where(Reservation.id == res_id))
         return result.scalars().first()
 
-    async def get_my_list(self, db: AsyncSession, user_id: int):
-        """특정 유저의 전체 예약 목록 조회"""
-        result = await db.execute(
+    async def get_my_list(self, db: AsyncSession, user_id: int, after=None, limit: int | None = None, upcoming_after=None):
+        """
+        특정 유저의 예약 목록 조회 (최신순)
+        [v2.3] after=(reservation_date, start_time, id)를 주면 그 다음 항목부터 키셋 방식으로 조회합니다.
+        [v2.3] upcoming_after=(날짜, 시)를 주면 그 이후에 시작하는 예정된 예약만 조회합니다.
+        """
+        query = (
             select(Reservation)
             .where(Reservation.user_id == user_id)
-            .order_by(Reservation.reservation_date.desc(), Reservation.start_time.desc())
+            .order_by(Reservation.reservation_date.desc(), Reservation.start_time.desc(), Reservation.id.desc())
+        )
+        if upcoming_after is not None:
+            # 저장된 상태로 부분 인덱스를 타고, 상태 갱신 작업이 정시 직후 아직 돌지 않았을 때를 위해 시각도 비교합니다.
+            query = query.where(
+                upcoming_reservation(),
+                tuple_(Reservation.reservation_date, Reservation.start_time) > tuple_(*upcoming_after),
+            )
+        if after is not None:
+            query = query.where(
+                tuple_(Reservation.reservation_date, Reservation.start_time, Reservation.id) < tuple_(*after)
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def get_archived_list(self, db: AsyncSession, user_id: int, after=None, limit: int | None = None):
+        """[v2.3] 보관 테이블의 내 예약 목록 (get_my_list와 같은 정렬/키셋)"""
+        query = (
+            select(ReservationArchive)
+            .where(ReservationArchive.user_id == user_id)
+            .order_by(
+                ReservationArchive.reservation_date.desc(), ReservationArchive.start_time.desc(), ReservationArchive.id.desc()
+            )
         )
+        if after is not None:
+            query = query.where(
+                tuple_(ReservationArchive.reservation_date, ReservationArchive.start_time, ReservationArchive.id) < tuple_(*after)
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db.execute(query)
         return result.scalars().all()
 
+    async def archive_batch(self, db, before_date, batch_size: int) -> int:
+        """
+        [v2.3] before_date 이전의 COMPLETED/CANCELLED 예약을 최대 batch_size건 보관 테이블로 옮깁니다. (commit은 호출한 쪽에서)
+        리뷰가 참조하는 예약(외래키)은 옮기지 않습니다. 옮긴 건수를 반환
+        """
+        result = await db.execute(
+            select(Reservation.id)
+            .where(
+                Reservation.status.in_(ARCHIVABLE_STATUSES),
+                Reservation.reservation_date < before_date,
+                ~exists().where(Review.reservation_id == Reservation.id),
+            )
+            .limit(batch_size)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            return 0
+        columns = [column.name for column in Reservation.__table__.columns]
+        await db.execute(
+            insert(ReservationArchive.__table__).from_select(
+                columns, select(*Reservation.__table__.columns).where(Reservation.id.in_(ids))
+            )
+        )
+        await db.execute(delete(Reservation.__table__).where(Reservation.id.in_(ids)))
+        return len(ids)
+
     async def save(self, db: AsyncSession, reservation: Reservation):
         """
         객체를 세션에 추가합니다. 
@@ -57,6 +171,22 @@ class ReservationRepository:
         await db.flush()
         return res_obj
     
+    async def mark_due(self, db, status: str, from_statuses: tuple[str, ...], condition, batch_size: int) -> int:
+        """
+        [v2.3] 상태 갱신 작업용: 조건에 맞는 예약을 batch_size건씩 status로 옮깁니다. (commit은 호출한 쪽에서)
+        ORM 객체를 읽지 않는 집합 UPDATE 한 문장이며, 옮긴 건수를 반환합니다.
+        """
+        due_ids = (
+            select(Reservation.id)
+            .where(Reservation.status.in_(from_statuses), condition)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(Reservation.__table__).where(Reservation.id.in_(due_ids)).values(status=status)
+        )
+        return result.rowcount
+
     async def find_active_now(self, db: AsyncSession, room_id: int, target_date, target_hour: int):
         """[추가] 현재 날짜/시간에 해당 방이 예약(사용) 중인지 확인"""
         # find_overlap을 재활용합니다. (시작시간 <= 현재시간 < 종료시간)
@@ -69,4 +199,41 @@ class ReservationRepository:
             room_id=room_id
         )
 
+    async def get_occupied_room_ids(self, db: AsyncSession, target_date, target_hour: int) -> set[int]:
+        """[v2.3] 해당 날짜/시간에 사용 중인 방 ID 집합을 한 번의 쿼리로 조회"""
+        # find_active_now와 같은 조건(시작 <= 현재 < 종료)을 방 단위로 모아서 반환합니다.
+        result = await db.execute(
+            select(Reservation.room_id)
+            .where(
+                and_(
+                    Reservation.reservation_date == target_date,
+                    Reservation.start_time <= target_hour,
+                    Reservation.end_time > target_hour,
+                    active_reservation()
+                )
+            )
+            .distinct()
+        )
+        return set(result.scalars().all())
+
+    async def get_active_in_range(self, db: AsyncSession, date_from, date_to, room_id=None):
+        """[v2.3] 기간 내 취소되지 않은 예약을 한 번에 조회 (달력용: 방/날짜/시간만 가져옴)"""
+        query = select(
+            Reservation.room_id,
+            Reservation.reservation_date,
+            Reservation.start_time,
+            Reservation.end_time,
+        ).where(
+            and_(
+                Reservation.reservation_date >= date_from,
+                Reservation.reservation_date <= date_to,
+                active_reservation()
+            )
+        )
+        if room_id:
+            query = query.where(Reservation.room_id == room_id)
+
+        result = await db.execute(query)
+        return result.all()
+
 reservation_repo = ReservationRepository()
\ No newline at end of file
@@ -11,10 +11,26 @@ class ReviewRepository:
         result = await db.execute(select(Review).where(Review.id == review_id))
         return result.scalars().first()
 
-    async def get_all_by_room(self, db: AsyncSession, room_id: int):
-        result = await db.execute(select(Review).where(Review.room_id == room_id))
+    async def get_all_by_room(self, db: AsyncSession, room_id: int, before_id: int | None = None, limit: int | None = None):
+        """방별 리뷰 최신순 조회 ([v2.3] before_id 이전 항목부터 키셋 페이지네이션)"""
+        return await self._get_page(db, Review.room_id == room_id, before_id, limit)
+
+    async def get_all_by_user(self, db: AsyncSession, user_id: int, before_id: int | None = None, limit: int | None = None):
+        """내가 작성한 리뷰 최신순 조회"""
+        return await self._get_page(db, Review.user_id == user_id, before_id, limit)
+
+    async def _get_page(self, db: AsyncSession, condition, before_id, limit):
+        query = select(Review).where(condition).order_by(Review.id.desc())
+        if before_id is not None:
+            query = query.where(Review.id < before_id)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db.execute(query)
         return result.scalars().all()
 
+    async def exists_any(self, db: AsyncSession) -> bool:
+        return await db.scalar(select(Review.id).limit(1)) is not None
+
     async def save(self, db: AsyncSession, review: Review):
         db.add(review)
         await db.flush()
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, and_, exists, true
 from app.models.room import StudyRoom
+from app.models.reservation import Reservation, active_reservation
 
 class RoomRepository:
     async def save_room(self, db: AsyncSession, room_obj: StudyRoom):
@@ -10,14 +11,51 @@ class RoomRepository:
         return room_obj
 
     # 전체 조회: 모든 스터디룸 목록 가져오기
-    async def get_all_rooms(self, db: AsyncSession, skip: int = 0, limit: int = 100):
-    # offset(skip): 앞에서부터 몇 개를 무시할지
-    # limit(limit): 그 뒤로 최대 몇 개를 가져올지
+    async def get_all_rooms(self, db: AsyncSession, after_id: int | None = None, limit: int | None = 100):
+        # [v2.3] OFFSET 대신 키셋(keyset) 방식: 마지막으로 받은 id 다음부터 limit개
+        # OFFSET은 앞 페이지를 모두 읽고 버리므로 뒤 페이지일수록 느려집니다.
+        query = select(StudyRoom).order_by(StudyRoom.id).limit(limit)
+        if after_id is not None:
+            query = query.where(StudyRoom.id > after_id)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    # 운영 중인 방 전체 조회 (달력/검색 등 모든 방을 한 번에 다뤄야 할 때)
+    async def get_active_rooms(self, db: AsyncSession):
         result = await db.execute(
-        select(StudyRoom).offset(skip).limit(limit)
+            select(StudyRoom).where(StudyRoom.is_active == true()).order_by(StudyRoom.id)
         )
         return result.scalars().all()
 
+    # [v2.3] 조건 검색: 시설 조건 + 해당 시간대에 비어 있는 방 (anti-join 한 번으로 처리)
+    async def search_free_rooms(self, db: AsyncSession, res_date, start: int, end: int,
+                                min_capacity: int | None = None, has_whiteboard: bool | None = None,
+                                has_projector: bool | None = None, floor: int | None = None, limit: int = 20):
+        # [규칙 5]와 같은 겹침 공식으로 "해당 시간대에 예약이 있는 방"을 정의하고 NOT EXISTS로 제외합니다.
+        busy = select(Reservation.id).where(
+            and_(
+                Reservation.room_id == StudyRoom.id,
+                Reservation.reservation_date == res_date,
+                Reservation.start_time < end,
+                Reservation.end_time > start,
+                active_reservation()
+            )
+        )
+        query = select(StudyRoom).where(StudyRoom.is_active == true(), ~exists(busy))
+
+        if min_capacity is not None:
+            query = query.where(StudyRoom.capacity >= min_capacity)
+        if has_whiteboard is not None:
+            query = query.where(StudyRoom.has_whiteboard == has_whiteboard)
+        if has_projector is not None:
+            query = query.where(StudyRoom.has_projector == has_projector)
+        if floor is not None:
+            query = query.where(StudyRoom.floor == floor)
+
+        # 최적 배정: 인원 조건을 만족하는 가장 작은 방부터
+        result = await db.execute(query.order_by(StudyRoom.capacity, StudyRoom.id).limit(limit))
+        return result.scalars().all()
+
     # 단일 조회: ID로 특정 방 찾기 (수정/삭제 시 필수)
     async def get_room_by_id(self,db: AsyncSession, room_id: int):
         result = await db.execute(select(StudyRoom).where(StudyRoom.id == room_id))
@@ -0,0 +1,66 @@
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.reservation import Reservation, active_reservation
+from app.models.user_daily_usage import UserDailyUsage
+
+class DailyUsageRepository:
+    async def apply(self, db: AsyncSession, user_id: int, usage_date, hours: int, limit: int | None = None) -> bool:
+        """
+        예약 시간 합계를 hours만큼 증감합니다. commit은 서비스에서 합니다.
+        limit을 주면 "합계 + hours <= limit"일 때만 반영하고, 넘치면 아무것도 바꾸지 않고 False를 반환합니다.
+        확인과 증가가 UPDATE 한 문장이므로 같은 유저의 예약이 동시에 들어와도 한도를 넘길 수 없습니다.
+        """
+        stmt = (
+            update(UserDailyUsage)
+            .where(UserDailyUsage.user_id == user_id, UserDailyUsage.usage_date == usage_date)
+            .values(booked_hours=UserDailyUsage.booked_hours + hours)
+            .execution_options(synchronize_session=False)
+        )
+        if limit is not None:
+            stmt = stmt.where(UserDailyUsage.booked_hours + hours <= limit)
+        result = await db.execute(stmt)
+        if result.rowcount:
+            return True
+        if hours <= 0:
+            return True
+        if limit is not None and hours > limit:
+            return False
+
+        # 그날의 첫 예약이면 행을 만들고, 행이 이미 있었다면(한도 초과 또는 동시 생성) UPDATE로 다시 판단합니다.
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(UserDailyUsage).values(user_id=user_id, usage_date=usage_date, booked_hours=hours))
+            return True
+        except IntegrityError:
+            result = await db.execute(stmt)
+            return bool(result.rowcount)
+
+    async def get_range(self, db: AsyncSession, user_id: int, date_from, date_to) -> dict:
+        """기간 내 날짜별 예약 시간 합계 (예약이 없는 날은 빠짐)"""
+        result = await db.execute(
+            select(UserDailyUsage.usage_date, UserDailyUsage.booked_hours).where(
+                UserDailyUsage.user_id == user_id,
+                UserDailyUsage.usage_date >= date_from,
+                UserDailyUsage.usage_date <= date_to,
+            )
+        )
+        return dict(result.all())
+
+    async def is_empty(self, db: AsyncSession) -> bool:
+        return await db.scalar(select(UserDailyUsage.user_id).limit(1)) is None
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """reservations 테이블에서 합계를 처음부터 다시 계산합니다 (최초 배포 백필/정합성 복구용)"""
+        await db.execute(delete(UserDailyUsage))
+        aggregate = (
+            select(Reservation.user_id, Reservation.reservation_date, func.sum(Reservation.end_time - Reservation.start_time))
+            .where(active_reservation())
+            .group_by(Reservation.user_id, Reservation.reservation_date)
+        )
+        result = await db.execute(
+            insert(UserDailyUsage).from_select(["user_id", "usage_date", "booked_hours"], aggregate)
+        )
+        return result.rowcount
+
+usage_repo = DailyUsageRepository()
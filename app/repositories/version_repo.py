@@ -0,0 +1,46 @@
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.resource_version import ResourceVersion
+
+# 리소스 이름
+# 방 메타데이터: 방 생성·수정·삭제
+ROOMS_RESOURCE = "rooms"
+# 방 평점: 리뷰 작성·삭제 (방 메타데이터와 분리하여 리뷰마다 방 목록 캐시 전체를 다시 읽지 않게 함)
+RATINGS_RESOURCE = "ratings"
+# 방 실시간 상태: 오늘 날짜 예약의 생성·수정·취소
+ROOM_STATUS_RESOURCE = "room_status"
+
+
+def user_reservations_resource(user_id: int) -> str:
+    """유저별 내 예약 목록"""
+    return f"reservations:user:{user_id}"
+
+
+class ResourceVersionRepository:
+    async def get_many(self, db: AsyncSession, names: list[str]) -> list[int]:
+        """이름 순서대로 버전 목록 (한 번도 올린 적 없는 리소스는 0)"""
+        result = await db.execute(
+            select(ResourceVersion.name, ResourceVersion.version).where(ResourceVersion.name.in_(names))
+        )
+        versions = dict(result.all())
+        return [versions.get(name, 0) for name in names]
+
+    async def bump(self, db: AsyncSession, *names: str):
+        """
+        리소스 버전을 1씩 올립니다. commit은 서비스에서 하므로 데이터 변경과 버전 변경이 함께 커밋/롤백됩니다.
+        여러 트랜잭션이 같은 행들을 잠글 때 교착이 생기지 않도록 항상 이름 순으로 갱신합니다.
+        """
+        for name in sorted(set(names)):
+            stmt = update(ResourceVersion).where(ResourceVersion.name == name).values(version=ResourceVersion.version + 1)
+            result = await db.execute(stmt)
+            if result.rowcount:
+                continue
+            # 처음 쓰이는 리소스: 행을 만들고, 다른 요청이 먼저 만들었다면 UPDATE로 다시 반영합니다.
+            try:
+                async with db.begin_nested():
+                    await db.execute(insert(ResourceVersion).values(name=name, version=1))
+            except IntegrityError:
+                await db.execute(stmt)
+
+version_repo = ResourceVersionRepository()
@@ -0,0 +1,109 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, pool_stats
+from app.models.user import User
+from app.lifespan import get_startup_stats
+from app.middleware.rate_limit import RATE_LIMIT_ENABLED, rate_limiter
+from app.services.auth_service import auth_service, get_current_admin_user
+from app.services.booking_lock import booking_lock
+from app.services.password_hasher import password_hasher
+from app.services.principal_cache import principal_cache, token_cache
+from app.services.review_service import review_service
+from app.services.reservation_service import reservation_service
+from app.services.room_catalog import room_catalog
+from app.services.room_feed import room_feed
+from app.services.status_materializer import status_materializer
+from app.services.reservation_archiver import reservation_archiver
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+# 운영 지표 조회 (관리자 전용)
+@router.get("/stats/booking-locks")
+async def get_booking_lock_stats(current_admin: User = Depends(get_current_admin_user)):
+    """예약 쓰기 잠금의 대기열 길이, 대기 시간, 거절/타임아웃 횟수"""
+    return booking_lock.stats()
+
+
+@router.get("/stats/auth")
+async def get_auth_stats(current_admin: User = Depends(get_current_admin_user)):
+    """bcrypt 스레드 풀 대기열/지연 시간, 회원가입·로그인 전체 지연 시간, 인증 캐시 적중률"""
+    return {
+        "password_hasher": password_hasher.stats(),
+        "principal_cache": principal_cache.stats(),
+        "token_cache": token_cache.stats(),
+        **{op: stats.snapshot() for op, stats in auth_service.latency.items()},
+    }
+
+
+@router.get("/stats/room-catalog")
+async def get_room_catalog_stats(current_admin: User = Depends(get_current_admin_user)):
+    """방 목록 캐시의 버전, 적재 상태, DB 재적재 횟수"""
+    return room_catalog.stats()
+
+
+@router.get("/stats/rate-limit")
+async def get_rate_limit_stats(current_admin: User = Depends(get_current_admin_user)):
+    """그룹별 동시 처리 수, 허용/거부(429: rate, 503: concurrency) 횟수"""
+    return {"enabled": RATE_LIMIT_ENABLED, **rate_limiter.stats()}
+
+
+@router.get("/stats/reservation-status")
+async def get_reservation_status_stats(current_admin: User = Depends(get_current_admin_user)):
+    """예약 상태 갱신 작업의 실행 횟수, 옮긴 예약 수, 마지막 실행 시각"""
+    return status_materializer.stats()
+
+
+@router.post("/reservation-status/run")
+async def run_reservation_status(current_admin: User = Depends(get_current_admin_user)):
+    """예약 상태 갱신을 즉시 실행합니다. 옮긴 예약 수를 반환"""
+    return await status_materializer.run_once()
+
+
+@router.get("/stats/reservation-archive")
+async def get_reservation_archive_stats(current_admin: User = Depends(get_current_admin_user)):
+    """지난 예약 보관 작업의 실행 횟수, 옮긴 예약 수, 마지막 실행 시각"""
+    return reservation_archiver.stats()
+
+
+@router.post("/reservation-archive/run")
+async def run_reservation_archive(current_admin: User = Depends(get_current_admin_user)):
+    """지난 예약 보관을 즉시 실행합니다. 옮긴 예약 수를 반환"""
+    return {"archived": await reservation_archiver.run_once()}
+
+
+@router.get("/stats/room-feed")
+async def get_room_feed_stats(current_admin: User = Depends(get_current_admin_user)):
+    """방 상태 스트림 구독자 수와 발행한 delta 이벤트 수"""
+    return room_feed.stats()
+
+
+@router.get("/stats/pool")
+async def get_pool_stats(current_admin: User = Depends(get_current_admin_user)):
+    """DB 커넥션 풀 사용량(대여 중/초과 연결 수)과 연결 대기 시간, 대기 타임아웃 횟수 (워커 프로세스 단위)"""
+    return pool_stats()
+
+
+@router.get("/stats/startup")
+async def get_startup_stats_endpoint(current_admin: User = Depends(get_current_admin_user)):
+    """기동 시 DDL 실행 여부/소요 시간, 풀 예열 시간, 첫 요청 응답까지 걸린 시간"""
+    return get_startup_stats()
+
+
+@router.post("/rating-summaries/rebuild")
+async def rebuild_rating_summaries(
+    db: AsyncSession = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """방별 평점 집계를 리뷰 테이블 기준으로 다시 계산합니다."""
+    rebuilt = await review_service.rebuild_rating_summaries(db)
+    return {"rooms": rebuilt}
+
+
+@router.post("/daily-usage/rebuild")
+async def rebuild_daily_usage(
+    db: AsyncSession = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """유저별·날짜별 예약 시간 합계를 예약 테이블 기준으로 다시 계산합니다."""
+    rebuilt = await reservation_service.rebuild_daily_usage(db)
+    return {"user_days": rebuilt}
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends
+from datetime import date, datetime
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
-from app.schemas.reservation import ReservationCreate, ReservationResponse, ReservationUpdate
+from app.database import get_db, get_read_db
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from app.schemas.reservation import (
+    ReservationBulkCreate, ReservationCreate, ReservationResponse, ReservationUpdate, UsageSummary, dump_reservation_list
+)
 from app.services.reservation_service import reservation_service
 from app.repositories.reservation_repo import reservation_repo
+from app.repositories.version_repo import user_reservations_resource
+from app.services.http_cache import PRIVATE_CACHE_CONTROL, conditional_get
 from app.services.auth_service import get_current_user
 
 router = APIRouter(prefix="/reservations", tags=["Reservations"])
@@ -12,9 +18,53 @@ router = APIRouter(prefix="/reservations", tags=["Reservations"])
 async def create_reservation(res_in: ReservationCreate, db: AsyncSession = Depends(get_db), user = Depends(get_current_user)):
     return await reservation_service.create_res(db, user.id, res_in)
 
+@router.post("/bulk", response_model=list[ReservationResponse])
+async def create_bulk_reservations(res_in: ReservationBulkCreate, db: AsyncSession = Depends(get_db), user = Depends(get_current_user)):
+    """
+    일괄/반복 예약. slots(날짜·시간 목록) 또는 recurrence(반복 규칙) 중 하나를 보냅니다.
+    하나라도 예약할 수 없으면 아무것도 저장하지 않고, 충돌한 슬롯 목록을 400으로 반환합니다.
+    """
+    reservations = await reservation_service.create_bulk(db, user.id, res_in)
+    return Response(dump_reservation_list(reservations, datetime.now()), media_type="application/json")
+
 @router.get("/me", response_model=list[ReservationResponse])
-async def get_my_reservations(db: AsyncSession = Depends(get_db), user = Depends(get_current_user)):
-    return await reservation_service.get_my_reservations(db, user.id)
+async def get_my_reservations(
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    upcoming: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    user = Depends(get_current_user)
+):
+    """
+    내 예약 목록 (최신순). 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.
+    [v2.3] ETag를 내려주며, If-None-Match가 일치하면 예약을 조회하지 않고 304로 응답합니다.
+    [v2.3] upcoming=true면 아직 시작하지 않은 예약만 조회합니다.
+    """
+    conditional = await conditional_get(
+        request, db, [user_reservations_resource(user.id)], PRIVATE_CACHE_CONTROL, vary="Authorization"
+    )
+    if conditional.not_modified:
+        return conditional.response()
+
+    reservations, next_cursor = await reservation_service.get_my_reservations(
+        db, user.id, cursor=cursor, limit=limit, upcoming=upcoming
+    )
+    # [v2.3] 목록 고속 직렬화: Response를 직접 반환하면 response_model 재검증/인코딩을 건너뜁니다.
+    # (response_model은 API 문서용으로 유지)
+    headers = dict(conditional.headers)
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return Response(dump_reservation_list(reservations, datetime.now()), media_type="application/json", headers=headers)
+
+@router.get("/me/usage", response_model=UsageSummary)
+async def get_my_usage(
+    week_of: date | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    user = Depends(get_current_user)
+):
+    """[v2.3] 이번 주(week_of를 주면 그 날짜가 속한 주) 날짜별 예약 시간과 하루 최대 이용 시간 대비 남은 시간"""
+    return await reservation_service.get_my_usage(db, user.id, week_of=week_of)
 
 @router.patch("/{res_id}", response_model=ReservationResponse)
 async def update_reservation(res_id: int, res_in: ReservationUpdate, db: AsyncSession = Depends(get_db), user = Depends(get_current_user)):
@@ -1,15 +1,13 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
-from app.models.review import Review
-from app.repositories import review_repo
+from app.database import get_db, get_read_db
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 from app.schemas.review import ReviewCreate, ReviewResponse
 from app.services.review_service import review_service
 from app.services.auth_service import get_current_user
 from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(prefix="/reviews", tags=["Reviews"])
 
 @router.post("/", response_model=ReviewResponse)
 async def create_review(
@@ -30,17 +28,27 @@ async def delete_review(
 @router.get("/room/{room_id}", response_model=list[ReviewResponse])
 async def get_room_reviews(
     room_id: int,
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """특정 스터디룸의 모든 리뷰 조회 (로그인 불필요)"""
-    return await review_repo.get_all_by_room(db, room_id)
+    """특정 스터디룸의 리뷰 최신순 조회 (로그인 불필요, 다음 페이지 커서는 X-Next-Cursor 헤더)"""
+    reviews, next_cursor = await review_service.get_room_reviews(db, room_id, cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return reviews
 
 @router.get("/me", response_model=list[ReviewResponse])
 async def get_my_reviews(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """내가 작성한 리뷰 목록 조회"""
-    # 레포지토리에 get_all_by_user 함수를 추가하거나 여기서 직접 쿼리
-    result = await db.execute(select(Review).where(Review.user_id == current_user.id))
-    return result.scalars().all()
\ No newline at end of file
+    reviews, next_cursor = await review_service.get_my_reviews(db, current_user.id, cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return reviews
@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.user import User
-from app.schemas.room import RoomCreate, RoomResponse, RoomUpdate
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from app.schemas.room import RoomAvailability, RoomCreate, RoomResponse, RoomUpdate
+from app.schemas.review import RatingSummary
 from app.services.room_service import room_service
+from app.services.review_service import review_service
+from app.services.room_feed import room_feed
+from app.services.http_cache import PUBLIC_CACHE_CONTROL, conditional_get
+from app.repositories.version_repo import RATINGS_RESOURCE, ROOM_STATUS_RESOURCE, ROOMS_RESOURCE
 from app.services.auth_service import get_current_admin_user
 
 router = APIRouter(prefix="/rooms", tags=["Rooms"])
@@ -23,11 +31,105 @@ async def create_room(
     return await room_service.create_room(db, room_in)
 
 @router.get("/", response_model=list[RoomResponse])
-async def get_rooms(db: AsyncSession = Depends(get_db)):
-    return await room_service.get_rooms(db)
+async def get_rooms(
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    방 목록을 id 순으로 조회합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor로 넘겨 이어서 조회합니다.
+    [v2.3] ETag를 내려주며, If-None-Match가 일치하면 목록을 만들지 않고 304로 응답합니다.
+    """
+    conditional = await conditional_get(
+        request, db, [ROOMS_RESOURCE, RATINGS_RESOURCE, ROOM_STATUS_RESOURCE], PUBLIC_CACHE_CONTROL
+    )
+    if conditional.not_modified:
+        return conditional.response()
+
+    rooms, next_cursor = await room_service.get_rooms(
+        db, cursor=cursor, limit=limit, source_version=conditional.versions[0], ratings_version=conditional.versions[1]
+    )
+    response.headers.update(conditional.headers)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rooms
+
+# 조건 검색: "내일 14~16시, 6인 이상, 프로젝터 있는 방"
+@router.get("/search", response_model=list[RoomResponse])
+async def search_rooms(
+    reservation_date: date,
+    start_time: int = Query(..., ge=9, le=21),
+    end_time: int = Query(..., ge=10, le=22),
+    min_capacity: int | None = Query(None, gt=0),
+    has_whiteboard: bool | None = None,
+    has_projector: bool | None = None,
+    floor: int | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    시설 조건을 만족하면서 해당 시간대에 예약이 없는 방을 반환합니다.
+    인원 조건을 만족하는 가장 작은 방부터 정렬됩니다.
+    """
+    return await room_service.search_rooms(
+        db, reservation_date, start_time, end_time,
+        min_capacity=min_capacity, has_whiteboard=has_whiteboard,
+        has_projector=has_projector, floor=floor, limit=limit
+    )
+
+# [v2.3] 방 상태 실시간 스트림 (Server-Sent Events)
+@router.get("/stream")
+async def stream_rooms():
+    """
+    연결 직후 전체 방 목록(snapshot 이벤트)을 한 번 보내고,
+    이후에는 예약/방 변경이나 정시 전환으로 상태가 바뀐 방만 delta 이벤트
+    ({"changed": [방...], "removed": [방 id...]})로 보냅니다.
+    키오스크/웹 화면의 주기적 GET /rooms 폴링을 대체합니다.
+    """
+    return StreamingResponse(
+        room_feed.stream(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 이벤트를 모아 두지 않도록 버퍼링/캐시를 끕니다.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# 전체 방 예약 가능 달력 (/{room_id} 보다 먼저 선언해야 경로가 가려지지 않습니다)
+@router.get("/availability", response_model=list[RoomAvailability], response_model_exclude_none=True)
+async def get_rooms_availability(
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    packed: bool = False,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    기간 내 모든 운영 중인 방의 날짜별 예약 가능 슬롯을 반환합니다.
+    packed=true이면 슬롯 목록 대신 비트마스크(free_mask)로 반환합니다.
+    """
+    return await room_service.get_availability(db, date_from, date_to, packed=packed)
+
+@router.get("/{room_id}/availability", response_model=RoomAvailability, response_model_exclude_none=True)
+async def get_room_availability(
+    room_id: int,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    packed: bool = False,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """특정 방의 날짜별 예약 가능 슬롯을 반환합니다."""
+    result = await room_service.get_availability(db, date_from, date_to, room_id=room_id, packed=packed)
+    return result[0]
+
+# 방 평점 요약
+@router.get("/{room_id}/rating", response_model=RatingSummary)
+async def get_room_rating(room_id: int, db: AsyncSession = Depends(get_read_db)):
+    """평균 평점, 리뷰 수, 점수(1~5)별 리뷰 수를 반환합니다."""
+    return await review_service.get_rating_summary(db, room_id)
 
 @router.get("/{room_id}", response_model=RoomResponse)
-async def get_room(room_id: int, db: AsyncSession = Depends(get_db)):
+async def get_room(room_id: int, db: AsyncSession = Depends(get_read_db)):
     return await room_service.get_room(db, room_id)
 
 # 방 정보 수정 (관리자 전용)
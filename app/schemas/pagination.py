@@ -0,0 +1,39 @@
+import base64
+import json
+
+# 목록 API 페이지 크기 (기본값 / 최대값)
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 다음 페이지 커서를 내려주는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: list) -> str:
+    """정렬 키 값 목록을 클라이언트가 해석할 필요 없는 불투명 문자열로 변환"""
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """encode_cursor의 역변환. 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if not isinstance(values, list):
+        raise ValueError("잘못된 커서입니다.")
+    return values
+
+
+def split_page(rows, limit: int, key):
+    """
+    limit + 1개를 조회한 결과를 (현재 페이지, 다음 커서)로 나눕니다.
+    한 개가 더 있으면 다음 페이지가 존재하는 것이므로 마지막 항목의 정렬 키로 커서를 만듭니다.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(key(page[-1]))
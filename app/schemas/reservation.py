@@ -1,6 +1,45 @@
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
-from datetime import date, datetime, time
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, field_validator, model_validator
+from datetime import date, datetime, timedelta
 from typing import Optional, List
+from sqlalchemy.orm.attributes import instance_dict
+
+# [규칙 6] 운영 시간 (09:00 ~ 22:00)
+OPEN_HOUR = 9
+CLOSE_HOUR = 22
+
+# [v2.3] 일괄/반복 예약 한 번에 만들 수 있는 최대 건수 (한 학기 주 2회 정도)
+MAX_BULK_SLOTS = 40
+# [v2.3] 반복 예약 규칙의 최대 기간(일). 펼치기 전에 검증하여 긴 기간이 이벤트 루프를 막지 않게 합니다.
+MAX_RECURRENCE_DAYS = 366
+
+
+def classify_status(status: str, reservation_date: date, start_time: int, end_time: int, now: datetime) -> str:
+    """
+    DB 상태와 기준 시각(now)을 대조한 실시간 상태.
+    예약은 정시 단위이므로 datetime을 만들지 않고 (날짜, 시) 튜플 비교로 판별합니다.
+    """
+    if status in ("CANCELLED", "COMPLETED"):
+        # 취소/이용 완료는 더 바뀌지 않는 상태이므로 저장된 값을 그대로 씁니다.
+        return status
+    current = (now.date(), now.hour)
+    if current < (reservation_date, start_time):
+        return "UPCOMING"    # 이용 대기
+    if current < (reservation_date, end_time):
+        return "IN_USE"      # 이용 중
+    return "COMPLETED"       # 이용 완료
+
+
+def check_duration(start, end):
+    """[규칙 1, 2] 예약 시간은 1시간 이상 2시간 이하"""
+    if start is not None:
+        duration = end - start
+        # [규칙 1] 최소 1시간 단위 (int이므로 정수 체크)
+        if duration < 1:
+            raise ValueError("최소 예약 시간은 1시간입니다.")
+        # [규칙 2] 최대 2시간 제한
+        if duration > 2:
+            raise ValueError("최대 예약 가능 시간은 2시간입니다.")
+    return end
 
 class ReservationBase(BaseModel):
     room_id: int
@@ -12,17 +51,100 @@ class ReservationCreate(ReservationBase):
     @field_validator("end_time")
     @classmethod
     def validate_duration(cls, v, info):
-        start = info.data.get("start_time")
-        if start is not None:
-            duration = v - start
-            # [규칙 1] 최소 1시간 단위 (int이므로 정수 체크)
-            if duration < 1:
-                raise ValueError("최소 예약 시간은 1시간입니다.")
-            # [규칙 2] 최대 2시간 제한
-            if duration > 2:
-                raise ValueError("최대 예약 가능 시간은 2시간입니다.")
+        return check_duration(info.data.get("start_time"), v)
+
+# [v2.3] 일괄 예약: 날짜/시간 슬롯 하나
+class ReservationSlot(BaseModel):
+    reservation_date: date
+    start_time: int = Field(..., ge=9, le=21)
+    end_time: int = Field(..., ge=10, le=22)
+
+    @field_validator("end_time")
+    @classmethod
+    def validate_duration(cls, v, info):
+        return check_duration(info.data.get("start_time"), v)
+
+# [v2.3] 반복 예약 규칙: start_date ~ until 사이의 지정 요일마다 같은 시간
+class RecurrenceRule(BaseModel):
+    start_date: date
+    until: date
+    weekdays: Optional[List[int]] = Field(None, max_length=7, description="0=월 ~ 6=일, 생략 시 start_date의 요일")
+    interval_weeks: int = Field(1, ge=1, le=4, description="몇 주마다 반복할지")
+    start_time: int = Field(..., ge=9, le=21)
+    end_time: int = Field(..., ge=10, le=22)
+
+    @field_validator("end_time")
+    @classmethod
+    def validate_duration(cls, v, info):
+        return check_duration(info.data.get("start_time"), v)
+
+    @field_validator("weekdays")
+    @classmethod
+    def validate_weekdays(cls, v):
+        if v is not None and any(not 0 <= day <= 6 for day in v):
+            raise ValueError("요일은 0(월)부터 6(일) 사이여야 합니다.")
         return v
 
+    @model_validator(mode="after")
+    def validate_period(self):
+        if self.until < self.start_date:
+            raise ValueError("until은 start_date 이후여야 합니다.")
+        if (self.until - self.start_date).days > MAX_RECURRENCE_DAYS:
+            raise ValueError(f"반복 기간은 최대 {MAX_RECURRENCE_DAYS}일입니다.")
+        return self
+
+    def expand(self) -> List[ReservationSlot]:
+        """규칙을 실제 슬롯 목록으로 펼칩니다. 최대 건수를 넘으면 MAX_BULK_SLOTS + 1건에서 멈춥니다."""
+        weekdays = set(self.weekdays or [self.start_date.weekday()])
+        # 주 단위 반복의 기준은 start_date가 속한 주의 월요일
+        week_start = self.start_date - timedelta(days=self.start_date.weekday())
+        slots = []
+        day = self.start_date
+        while day <= self.until:
+            weeks = (day - week_start).days // 7
+            if day.weekday() in weekdays and weeks % self.interval_weeks == 0:
+                slots.append(ReservationSlot(reservation_date=day, start_time=self.start_time, end_time=self.end_time))
+                if len(slots) > MAX_BULK_SLOTS:
+                    break
+            day += timedelta(days=1)
+        return slots
+
+class ReservationBulkCreate(BaseModel):
+    room_id: int
+    slots: Optional[List[ReservationSlot]] = Field(None, max_length=MAX_BULK_SLOTS)
+    recurrence: Optional[RecurrenceRule] = None
+
+    @model_validator(mode="after")
+    def validate_source(self):
+        if (self.slots is None) == (self.recurrence is None):
+            raise ValueError("slots와 recurrence 중 하나만 입력해야 합니다.")
+        return self
+
+    def expand(self) -> List[ReservationSlot]:
+        slots = self.slots if self.slots is not None else self.recurrence.expand()
+        return sorted(slots, key=lambda slot: (slot.reservation_date, slot.start_time))
+
+# 일괄 예약 시 충돌한 슬롯 정보
+class SlotConflict(BaseModel):
+    reservation_date: date
+    start_time: int
+    end_time: int
+    reason: str  # ROOM(방 중복) / USER(유저 중복) / DUPLICATE(요청 내 중복) / RULE(예약 규칙 위반) / QUOTA(하루 이용 시간 초과)
+    detail: str
+
+# [v2.3] 내 이용 시간 요약 (하루 최대 이용 시간 기준)
+class DailyUsage(BaseModel):
+    usage_date: date
+    booked_hours: int
+    remaining_hours: int
+
+class UsageSummary(BaseModel):
+    week_start: date  # 월요일
+    week_end: date    # 일요일
+    daily_limit_hours: int
+    total_hours: int
+    days: List[DailyUsage]
+
 class ReservationUpdate(BaseModel):
     start_time: Optional[int] = Field(None, ge=9, le=21)
     end_time: Optional[int] = Field(None, ge=10, le=22)
@@ -40,17 +162,38 @@ class ReservationResponse(ReservationBase):
     @property
     def current_status(self) -> str:
         """DB 데이터와 현재 시간을 대조하여 실시간 상태를 계산"""
-        if self.status == "CANCELLED":
-            return "CANCELLED"
-        
-        now = datetime.now()
-        # 서비스 레이어 로직과 동일하게 날짜와 시간을 결합
-        res_start = datetime.combine(self.reservation_date, time(hour=self.start_time))
-        res_end = datetime.combine(self.reservation_date, time(hour=self.end_time))
-
-        if now < res_start:
-            return "UPCOMING"    # 이용 대기
-        elif res_start <= now < res_end:
-            return "IN_USE"      # 이용 중
-        else:
-            return "COMPLETED"   # 이용 완료
\ No newline at end of file
+        return classify_status(self.status, self.reservation_date, self.start_time, self.end_time, datetime.now())
+
+
+# [v2.3] 목록 응답 전용 고속 경로
+# 항목마다 datetime.now()를 부르는 computed_field 대신, 요청당 한 번 잡은 시각으로 상태를 미리 계산해
+# 일반 필드로 담고, 목록 전체를 TypeAdapter로 한 번에 검증/JSON 직렬화(pydantic-core)합니다.
+# 응답 형식은 ReservationResponse와 같습니다.
+class ReservationListItem(ReservationBase):
+    id: int
+    user_id: int
+    status: str
+    created_at: datetime
+    canceled_at: Optional[datetime] = None
+    current_status: str
+
+
+reservation_list_adapter = TypeAdapter(list[ReservationListItem])
+
+
+def dump_reservation_list(reservations, now: datetime) -> bytes:
+    """
+    예약 ORM 목록을 JSON 바이트로 직렬화 (상태 계산 기준 시각은 now 하나).
+    ORM 속성(descriptor)을 항목·필드마다 거치지 않도록 이미 로드된 값(instance_dict)을 그대로 넘깁니다.
+    조회/INSERT RETURNING 직후처럼 컬럼이 모두 로드된 객체에만 사용합니다.
+    """
+    rows = []
+    for res in reservations:
+        values = instance_dict(res)
+        rows.append({
+            **values,
+            "current_status": classify_status(
+                values["status"], values["reservation_date"], values["start_time"], values["end_time"], now
+            ),
+        })
+    return reservation_list_adapter.dump_json(reservation_list_adapter.validate_python(rows))
\ No newline at end of file
@@ -7,6 +7,13 @@ class ReviewCreate(BaseModel):
     rating: int = Field(..., ge=1, le=5, description="1점부터 5점까지 입력 가능합니다.")
     content: Optional[str] = None
 
+class RatingSummary(BaseModel):
+    room_id: int
+    count: int = 0
+    average: Optional[float] = None
+    # 점수(1~5)별 리뷰 수
+    histogram: dict[int, int] = Field(default_factory=lambda: {score: 0 for score in range(1, 6)})
+
 class ReviewResponse(BaseModel):
     id: int
     user_id: int
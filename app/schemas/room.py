@@ -1,4 +1,6 @@
+from datetime import date
 from pydantic import BaseModel, ConfigDict, Field
+from app.schemas.reservation import OPEN_HOUR, CLOSE_HOUR
 
 class RoomBase(BaseModel):
     name: str = Field(..., example="A1 스터디룸")
@@ -23,5 +25,21 @@ class RoomResponse(RoomBase):
     id: int
     is_active: bool
     availability_status: str = "AVAILABLE"
+    # [v2.3] 평점 집계 (리뷰가 없으면 rating_avg는 null)
+    rating_avg: float | None = None
+    rating_count: int = 0
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class DayAvailability(BaseModel):
+    date: date
+    # 기본 형식: open_hour부터 1시간 단위 슬롯 목록 (True = 예약 가능)
+    slots: list[bool] | None = None
+    # packed=true 형식: h번 비트가 1이면 h시 슬롯 예약 가능
+    free_mask: int | None = None
+
+class RoomAvailability(BaseModel):
+    room_id: int
+    open_hour: int = OPEN_HOUR
+    close_hour: int = CLOSE_HOUR
+    days: list[DayAvailability]
@@ -7,22 +7,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.schemas.user import UserCreate, UserLogin
 from app.repositories.user_repo import user_repo 
-import bcrypt 
+from app.services.password_hasher import LatencyStats, password_hasher
+from app.services.principal_cache import AUTH_TRUST_TOKEN_ROLE, principal_cache, token_cache
+from sqlalchemy.orm import make_transient_to_detached
+from time import perf_counter, time
+import hashlib
 import jwt
 from app.database import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 class AuthService:
-    # 비밀번호 해싱 (동기 작업)
-    def _hash_password(self, password: str) -> str:
-        pw_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
-        hashed_pw = bcrypt.hashpw(pw_bytes, salt)
-        return hashed_pw.decode("utf-8")
+    def __init__(self):
+        # [v2.3] 인증 경로 지연 시간 지표 (DB 조회 + bcrypt 포함 전체 시간)
+        self.latency = {"signup": LatencyStats(), "login": LatencyStats()}
+
+    # 비밀번호 해싱 ([v2.3] 이벤트 루프를 막지 않도록 전용 스레드 풀에서 실행)
+    async def _hash_password(self, password: str) -> str:
+        return await password_hasher.hash(password)
 
     # 회원가입 로직
     async def signup(self, db: AsyncSession, data: UserCreate):
+        started = perf_counter()
+        try:
+            return await self._signup(db, data)
+        finally:
+            self.latency["signup"].observe(perf_counter() - started)
+
+    async def _signup(self, db: AsyncSession, data: UserCreate):
         # [STEP 1] 중복 검사
         existing_user = await user_repo.get_by_student_id(db, student_id=data.student_id)
         if existing_user:
@@ -32,14 +44,14 @@ class AuthService:
             )
 
         # [STEP 2] 비밀번호 해싱
-        hashed_password = self._hash_password(data.password)
+        hashed_password = await self._hash_password(data.password)
 
-        # [STEP 3] 트랜잭션 시작 (with 문으로 통일)
-        async with db.begin():
-            new_user = await user_repo.create(
-                db, user_in=data, hashed_password=hashed_password
-            )
-            # 블록 종료 시 자동 commit, 에러 발생 시 자동 rollback
+        # [STEP 3] 저장 및 커밋
+        # STEP 1의 조회로 이미 트랜잭션이 시작되었으므로 db.begin() 대신 commit으로 확정합니다.
+        new_user = await user_repo.create(
+            db, user_in=data, hashed_password=hashed_password
+        )
+        await db.commit()
 
         # [STEP 4] 데이터 동기화
         await db.refresh(new_user)
@@ -54,15 +66,30 @@ class AuthService:
 
     # 로그인 로직
     async def login(self, db: AsyncSession, data: UserLogin):
+        started = perf_counter()
+        try:
+            return await self._login(db, data)
+        finally:
+            self.latency["login"].observe(perf_counter() - started)
+
+    async def _login(self, db: AsyncSession, data: UserLogin):
         user = await user_repo.get_by_student_id(db, student_id=data.student_id)
         
         # 비밀번호 검증
-        if not user or not bcrypt.checkpw(data.password.encode("utf-8"), user.password.encode("utf-8")):
+        if not user or not await password_hasher.verify(data.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="학번 또는 비밀번호가 일치하지 않습니다.",
             )
 
+        # [v2.3] BCRYPT_ROUNDS가 바뀌었다면 로그인 성공 시점에 새 cost로 다시 해싱하여 저장
+        # (평문 비밀번호를 알 수 있는 유일한 시점)
+        if password_hasher.needs_rehash(user.password):
+            new_hash = await password_hasher.hash(data.password)
+            await user_repo.update(db, user, {"password": new_hash})
+            await db.commit()
+            invalidate_principal(user.student_id)
+
         # 관리자 권한(role) 정보를 포함하여 토큰 발행
         access_token = self._create_access_token(
             data={"sub": user.student_id, "role": user.role}
@@ -77,7 +104,7 @@ class AuthService:
         
     #     if not existing_admin:
     #         print("🚀 관리자 계정 생성 중...")
-    #         hashed_pw = self._hash_password("admin1234") 
+    #         hashed_pw = await self._hash_password("admin1234") 
             
     #         from app.models.user import User
     #         async with db.begin():
@@ -92,28 +119,69 @@ class AuthService:
 
 auth_service = AuthService()
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="인증 정보가 유효하지 않습니다.",
-    )
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="인증 정보가 유효하지 않습니다.",
+)
+
+# [v2.3] 토큰 검증 결과 캐시: 같은 토큰이면 서명 검증/디코딩을 다시 하지 않습니다.
+def decode_token(token: str) -> dict | None:
+    """서명/만료를 검증한 payload. 유효하지 않으면 None (요청 제한 미들웨어에서도 사용)"""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        student_id: str = payload.get("sub")
-        if student_id is None:
-            raise credentials_exception
     except jwt.PyJWTError:
+        return None
+    if payload.get("sub") is None:
+        return None
+
+    # 캐시가 토큰 만료 시각을 넘겨 유지되지 않도록 남은 유효 시간으로 제한
+    token_cache.set(key, payload, ttl=payload.get("exp", 0) - time())
+    return payload
+
+async def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    payload = decode_token(token)
+    if payload is None:
         raise credentials_exception
+    return payload
+
+# [v2.3] 유저 정보 캐시: 세션에서 분리된 스냅샷을 보관했다가 요청 세션에 merge(load=False)로 붙입니다.
+# merge(load=False)는 SELECT 없이 세션에 등록만 하므로 이후 수정/커밋도 그대로 동작합니다.
+async def _load_principal(db: AsyncSession, student_id: str) -> User:
+    cached = principal_cache.get(student_id)
+    if cached is not None:
+        return await db.merge(cached, load=False)
 
     user = await user_repo.get_by_student_id(db, student_id=student_id)
     if user is None:
         raise credentials_exception
+
+    snapshot = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+    make_transient_to_detached(snapshot)
+    principal_cache.set(student_id, snapshot)
     return user
 
-async def get_current_admin_user(current_user: User = Depends(get_current_user)):
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="관리자 권한이 필요한 서비스입니다."
-        )
-    return current_user
\ No newline at end of file
+def invalidate_principal(student_id: str):
+    """유저 정보(권한, 비밀번호 등)가 바뀌었을 때 호출하여 캐시된 스냅샷을 버립니다."""
+    principal_cache.invalidate(student_id)
+
+async def get_current_user(payload: dict = Depends(get_token_payload), db: AsyncSession = Depends(get_db)):
+    return await _load_principal(db, payload["sub"])
+
+async def get_current_admin_user(payload: dict = Depends(get_token_payload), db: AsyncSession = Depends(get_db)):
+    admin_exception = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="관리자 권한이 필요한 서비스입니다."
+    )
+    # AUTH_TRUST_TOKEN_ROLE이면 토큰의 role 클레임만으로 먼저 거절 (DB 조회 없음)
+    if AUTH_TRUST_TOKEN_ROLE and payload.get("role") != "admin":
+        raise admin_exception
+
+    current_user = await _load_principal(db, payload["sub"])
+    if not AUTH_TRUST_TOKEN_ROLE and current_user.role != "admin":
+        raise admin_exception
+    return current_user
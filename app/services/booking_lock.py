@@ -0,0 +1,145 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from datetime import date
+from time import perf_counter
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+# [v2.3] 예약 쓰기 직렬화 모드
+# - none     : 잠금 없음 (기본, DB 제약조건만으로 중복 차단)
+# - local    : 프로세스 내 (방, 날짜) 단위 스트라이프 잠금 (단일 워커용)
+# - advisory : PostgreSQL advisory lock (여러 워커/서버 간 직렬화)
+BOOKING_LOCK_MODE = os.getenv("BOOKING_LOCK_MODE", "none").lower()
+BOOKING_LOCK_STRIPES = int(os.getenv("BOOKING_LOCK_STRIPES", 64))
+# 잠금을 기다릴 수 있는 최대 요청 수. 넘치면 바로 503으로 돌려보냅니다.
+BOOKING_LOCK_MAX_WAITERS = int(os.getenv("BOOKING_LOCK_MAX_WAITERS", 100))
+BOOKING_LOCK_TIMEOUT = float(os.getenv("BOOKING_LOCK_TIMEOUT", 3.0))  # 초
+
+BUSY_DETAIL = "예약 요청이 몰려 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+
+# PostgreSQL lock_timeout 초과 에러 코드 (lock_not_available)
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def is_lock_timeout(exc: DBAPIError) -> bool:
+    """asyncpg(sqlstate)/psycopg2(pgcode) 모두에서 잠금 대기 시간 초과인지 판별"""
+    code = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+    return code == LOCK_NOT_AVAILABLE or "lock timeout" in str(exc.orig)
+
+
+class BookingLockManager:
+    """
+    같은 방·같은 날짜에 대한 예약 쓰기를 한 번에 하나씩 처리하도록 줄을 세웁니다.
+    대기열 길이와 대기 시간에 상한을 두어 요청이 몰릴 때도 응답 시간이 예측 가능하게 합니다.
+    """
+
+    def __init__(self, mode: str, stripes: int, max_waiters: int, timeout: float):
+        if mode not in ("none", "local", "advisory"):
+            raise ValueError(f"지원하지 않는 BOOKING_LOCK_MODE 입니다: {mode}")
+        self.mode = mode
+        self.max_waiters = max_waiters
+        self.timeout = timeout
+        self._stripes = [asyncio.Lock() for _ in range(stripes)]
+
+        # 지표
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _stripe_indexes(self, keys):
+        # 같은 스트라이프를 두 번 잡으면 스스로 교착되므로 중복을 제거하고,
+        # 항상 같은 순서로 잡아 요청 간 교착을 방지합니다.
+        return sorted({hash(key) % len(self._stripes) for key in keys})
+
+    @asynccontextmanager
+    async def hold(self, db, keys: list[tuple[int, date]]):
+        """(room_id, 날짜) 키들에 대한 쓰기 잠금을 잡은 상태로 블록을 실행"""
+        if self.mode == "none" or not keys:
+            yield
+            return
+
+        if self.waiting >= self.max_waiters:
+            self.rejected += 1
+            raise HTTPException(status_code=503, detail=BUSY_DETAIL, headers={"Retry-After": "1"})
+
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        started = perf_counter()
+        held = []
+        try:
+            if self.mode == "local":
+                async with asyncio.timeout(self.timeout):
+                    for index in self._stripe_indexes(keys):
+                        await self._stripes[index].acquire()
+                        held.append(self._stripes[index])
+            else:
+                await self._acquire_advisory(db, keys)
+        except (TimeoutError, DBAPIError) as e:
+            for lock in held:
+                lock.release()
+            if isinstance(e, DBAPIError):
+                await db.rollback()
+                if not is_lock_timeout(e):
+                    raise
+            self.timeouts += 1
+            raise HTTPException(status_code=503, detail=BUSY_DETAIL, headers={"Retry-After": "1"})
+        finally:
+            self.waiting -= 1
+            waited = perf_counter() - started
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+        self.acquired += 1
+        try:
+            yield
+        except DBAPIError as e:
+            # 잠금을 잡은 뒤의 쓰기가 행 잠금 대기 시간(서버 설정 lock_timeout)을 넘겨도 같은 503으로 응답합니다.
+            if not is_lock_timeout(e):
+                raise
+            await db.rollback()
+            self.timeouts += 1
+            raise HTTPException(status_code=503, detail=BUSY_DETAIL, headers={"Retry-After": "1"})
+        finally:
+            for lock in held:
+                lock.release()
+
+    async def _acquire_advisory(self, db, keys):
+        """
+        트랜잭션 범위 advisory lock: commit/rollback 시 자동으로 풀립니다.
+        lock_timeout은 잠금을 기다리는 동안에만 적용하고, 이후의 INSERT/제약조건 확인에는 서버 기본값을 돌려줍니다.
+        """
+        await db.execute(text(f"SET LOCAL lock_timeout = '{int(self.timeout * 1000)}ms'"))
+        for room_id, res_date in sorted(set(keys)):
+            await db.execute(
+                text("SELECT pg_advisory_xact_lock(:room_id, :day)"),
+                {"room_id": room_id, "day": res_date.toordinal()},
+            )
+        await db.execute(text("SET LOCAL lock_timeout = DEFAULT"))
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "max_waiters": self.max_waiters,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.acquired, 6) if self.acquired else 0.0,
+        }
+
+
+booking_lock = BookingLockManager(
+    mode=BOOKING_LOCK_MODE,
+    stripes=BOOKING_LOCK_STRIPES,
+    max_waiters=BOOKING_LOCK_MAX_WAITERS,
+    timeout=BOOKING_LOCK_TIMEOUT,
+)
@@ -0,0 +1,58 @@
+import hashlib
+import os
+from datetime import datetime
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.version_repo import version_repo
+
+# [v2.3] 조건부 GET(ETag) 설정
+# 공용 목록(방 목록)을 프록시/CDN이 재검증 없이 재사용해도 되는 시간(초). 0이면 매번 If-None-Match로 재검증합니다.
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", 0))
+
+PUBLIC_CACHE_CONTROL = f"public, max-age={HTTP_CACHE_MAX_AGE}, must-revalidate"
+# 유저별 응답은 공용 캐시에 저장하지 않고 브라우저만 재검증하며 사용합니다.
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110: 약한 비교이므로 W/ 접두사는 무시)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+class ConditionalGet:
+    """리소스 버전으로 만든 ETag와 캐시 헤더. not_modified면 본문 없이 304로 응답합니다."""
+
+    def __init__(self, etag: str, versions: list[int], headers: dict[str, str], not_modified: bool):
+        self.etag = etag
+        self.versions = versions
+        self.headers = headers
+        self.not_modified = not_modified
+
+    def response(self) -> Response:
+        return Response(status_code=304, headers=self.headers)
+
+
+async def conditional_get(
+    request: Request, db: AsyncSession, resources: list[str], cache_control: str, vary: str | None = None
+) -> ConditionalGet:
+    """
+    버전 조회 쿼리 1회로 ETag를 계산합니다. (목록 조회/직렬화 전에 호출)
+    ETag에는 리소스 버전 외에 현재 시각(시 단위)과 쿼리 문자열이 들어갑니다.
+    예약 상태(IN_USE/COMPLETED 등)는 정시에만 바뀌므로 시 단위가 바뀌면 ETag도 바뀝니다.
+    """
+    versions = await version_repo.get_many(db, resources)
+    etag = make_etag(*resources, *versions, datetime.now().strftime("%Y-%m-%dT%H"), request.url.query)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if vary:
+        headers["Vary"] = vary
+    return ConditionalGet(etag, versions, headers, etag_matches(request, etag))
@@ -0,0 +1,23 @@
+from sqlalchemy import text
+
+# [v2.3] 백그라운드 작업용 세션 advisory lock (PostgreSQL 전용)
+# 여러 워커가 같은 주기로 깨어나도 작업은 한 워커만 실행합니다.
+# 배치마다 commit해도 풀리지 않도록 트랜잭션이 아닌 연결(세션) 단위 잠금을 씁니다.
+# 같은 AsyncConnection으로 잡고 풀어야 하며, 다른 DB에서는 항상 성공으로 봅니다.
+
+
+async def try_job_lock(conn, key: int) -> bool:
+    if conn.dialect.name != "postgresql":
+        return True
+    acquired = await conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+    await conn.commit()
+    return bool(acquired)
+
+
+async def release_job_lock(conn, key: int):
+    if conn.dialect.name != "postgresql":
+        return
+    # 배치 도중 실패했다면 중단된 트랜잭션을 먼저 정리합니다.
+    await conn.rollback()
+    await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+    await conn.commit()
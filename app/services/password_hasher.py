@@ -0,0 +1,115 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+import bcrypt
+from fastapi import HTTPException
+
+# [v2.3] bcrypt 설정
+# 작업 비용(cost): 값이 1 오를 때마다 해싱 시간이 약 2배가 됩니다.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+# 해싱 전용 스레드 수 (워커 프로세스당). CPU 코어 수를 넘기지 않는 것을 권장합니다.
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", 2))
+# 실행 중 + 대기 중인 해싱 작업 상한. 넘치면 503으로 돌려보냅니다.
+BCRYPT_MAX_PENDING = int(os.getenv("BCRYPT_MAX_PENDING", 32))
+
+
+class LatencyStats:
+    """호출 횟수와 누적/최대 소요 시간만 기록하는 가벼운 지표"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "seconds_total": round(self.total, 6),
+            "seconds_avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "seconds_max": round(self.max, 6),
+        }
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 전용 스레드 풀에서 실행합니다.
+    bcrypt는 한 번에 수십 ms 동안 CPU를 쓰므로 이벤트 루프에서 직접 호출하면
+    그동안 같은 워커의 다른 요청이 모두 멈춥니다.
+    """
+
+    def __init__(self, rounds: int, workers: int, max_pending: int):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self.pending = 0
+        self.rejected = 0
+        self.latency = {"hash": LatencyStats(), "verify": LatencyStats()}
+
+    async def _run(self, op: str, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            )
+        if self._executor is None:
+            # 첫 사용 시 생성 (종료 후 같은 프로세스에서 앱을 다시 띄워도 동작하도록)
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        self.pending += 1
+        started = perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+            # 대기 시간까지 포함한 체감 지연 시간
+            self.latency[op].observe(perf_counter() - started)
+
+    def _hash_sync(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+    @staticmethod
+    def _verify_sync(password: str, hashed: str) -> bool:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self._hash_sync, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run("verify", self._verify_sync, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """저장된 해시의 cost가 현재 설정과 다르면 True (형식: $2b$12$...)"""
+        try:
+            return int(hashed.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            **{op: stats.snapshot() for op, stats in self.latency.items()},
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    rounds=BCRYPT_ROUNDS,
+    workers=BCRYPT_WORKERS,
+    max_pending=BCRYPT_MAX_PENDING,
+)
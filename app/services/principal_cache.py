@@ -0,0 +1,60 @@
+import os
+from collections import OrderedDict
+from time import monotonic
+
+# [v2.3] 인증 캐시 설정
+# 유저 정보(principal) 캐시 유지 시간(초). 0이면 캐시를 사용하지 않습니다.
+AUTH_PRINCIPAL_CACHE_TTL = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", 60))
+AUTH_PRINCIPAL_CACHE_SIZE = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", 1024))
+# true면 관리자 여부를 DB 대신 토큰의 role 클레임으로 판단합니다.
+# (권한이 회수되어도 토큰 만료 전까지는 반영되지 않는 대신 DB 조회가 사라집니다.)
+AUTH_TRUST_TOKEN_ROLE = os.getenv("AUTH_TRUST_TOKEN_ROLE", "false").lower() == "true"
+
+
+class TTLCache:
+    """유지 시간(TTL)과 최대 개수(LRU)를 가진 프로세스 내 캐시"""
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value, ttl: float | None = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+# 학번(sub) -> 세션에서 분리된 User 스냅샷
+principal_cache = TTLCache(AUTH_PRINCIPAL_CACHE_TTL, AUTH_PRINCIPAL_CACHE_SIZE)
+# 토큰 해시 -> 검증이 끝난 JWT 클레임 (서명 검증/디코딩 생략)
+token_cache = TTLCache(AUTH_PRINCIPAL_CACHE_TTL, AUTH_PRINCIPAL_CACHE_SIZE)
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import os
+from datetime import date, datetime, timedelta
+from time import perf_counter
+from app.database import engine
+from app.repositories.reservation_repo import reservation_repo
+from app.services.job_lock import release_job_lock, try_job_lock
+
+logger = logging.getLogger("uvicorn.error")
+
+# [v2.3] 지난 예약 보관 작업 설정
+RESERVATION_ARCHIVE_ENABLED = os.getenv("RESERVATION_ARCHIVE_ENABLED", "true").lower() == "true"
+# 예약 날짜로부터 며칠이 지나면 보관 테이블로 옮길지 (리뷰 작성 기한 7일보다 충분히 길게)
+RESERVATION_ARCHIVE_AFTER_DAYS = int(os.getenv("RESERVATION_ARCHIVE_AFTER_DAYS", 90))
+# 한 트랜잭션에서 옮기는 최대 예약 수
+RESERVATION_ARCHIVE_BATCH_SIZE = int(os.getenv("RESERVATION_ARCHIVE_BATCH_SIZE", 5000))
+# 실행 주기(초)
+RESERVATION_ARCHIVE_INTERVAL = float(os.getenv("RESERVATION_ARCHIVE_INTERVAL", 24 * 3600))
+
+# advisory lock 키: 여러 워커 중 한 곳만 실행
+ARCHIVE_JOB_LOCK_KEY = 20231020
+
+
+def archive_boundary(today: date) -> date:
+    """
+    보관 테이블에 있을 수 있는 가장 늦은 예약 날짜의 다음 날.
+    이 날짜 이후의 예약은 모두 reservations 테이블에 있으므로, 목록 조회가 이 날짜 이후에서 끝나면
+    보관 테이블을 읽지 않아도 됩니다.
+    """
+    return today - timedelta(days=RESERVATION_ARCHIVE_AFTER_DAYS)
+
+
+class ReservationArchiver:
+    """
+    오래된 COMPLETED/CANCELLED 예약을 reservations_archive로 옮기는 작업.
+    상태가 더 바뀌지 않는 예약만 옮기므로 예약 상태 갱신 작업(status_materializer)이 선행되어야 합니다.
+    배치마다 INSERT ... SELECT + DELETE를 한 트랜잭션으로 커밋하여, 중간에 멈춰도 예약이 사라지거나 중복되지 않습니다.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.runs = 0
+        self.skipped = 0
+        self.archived = 0
+        self.last_run_at: datetime | None = None
+        self.last_seconds = 0.0
+
+    async def run_once(self, today: date | None = None) -> int:
+        """보관 기준일 이전의 예약을 모두 옮기고 건수를 반환"""
+        before_date = archive_boundary(today or date.today())
+        started = perf_counter()
+        moved = 0
+        async with engine.connect() as conn:
+            if not await try_job_lock(conn, ARCHIVE_JOB_LOCK_KEY):
+                self.skipped += 1
+                return 0
+            try:
+                while True:
+                    count = await reservation_repo.archive_batch(conn, before_date, self.batch_size)
+                    await conn.commit()
+                    moved += count
+                    if count < self.batch_size:
+                        break
+            finally:
+                await release_job_lock(conn, ARCHIVE_JOB_LOCK_KEY)
+
+        self.runs += 1
+        self.archived += moved
+        self.last_run_at = datetime.now()
+        self.last_seconds = round(perf_counter() - started, 6)
+        if moved:
+            logger.info("Reservation archive: moved %d reservations before %s", moved, before_date)
+        return moved
+
+    async def run_forever(self, interval: float, initial_delay: float = 0):
+        """
+        lifespan에서 백그라운드로 실행: initial_delay초 후 1회, 이후 interval초마다
+        (기동 직후 상태 갱신 작업이 밀린 예약을 COMPLETED로 옮길 시간을 줍니다)
+        """
+        await asyncio.sleep(initial_delay)
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("예약 보관 작업 실패")
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "archived": self.archived,
+            "last_run_at": self.last_run_at.isoformat(timespec="seconds") if self.last_run_at else None,
+            "last_seconds": self.last_seconds,
+            "after_days": RESERVATION_ARCHIVE_AFTER_DAYS,
+            "batch_size": self.batch_size,
+        }
+
+
+reservation_archiver = ReservationArchiver(batch_size=RESERVATION_ARCHIVE_BATCH_SIZE)
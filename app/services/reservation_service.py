@@ -1,29 +1,168 @@
-from datetime import datetime, timedelta
+import heapq
+import logging
+import os
+from datetime import date, datetime, timedelta
 from fastapi import HTTPException
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from app.repositories.reservation_repo import reservation_repo
+from app.repositories.usage_repo import usage_repo
+from app.repositories.version_repo import ROOM_STATUS_RESOURCE, user_reservations_resource, version_repo
+from app.repositories.occupancy_index import occupancy_index, slot_mask, OCCUPANCY_INDEX_ENABLED
 from app.models.reservation import Reservation
+from app.services.booking_lock import booking_lock
+from app.services.room_feed import room_feed
+from app.services.reservation_archiver import archive_boundary
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, decode_cursor, split_page
+from app.schemas.reservation import MAX_BULK_SLOTS, DailyUsage, SlotConflict, UsageSummary, classify_status
+
+logger = logging.getLogger("uvicorn.error")
+
+# [v2.3] 저장 전 중복 체크 쿼리 실행 여부 (기본: 실행)
+# PostgreSQL의 배타 제약조건(ex_reservations_*_no_overlap)이 최종적으로 중복을 막으므로,
+# PostgreSQL 환경에서는 false로 두어 예약 1건당 쿼리 2회를 줄일 수 있습니다.
+# false여도 기동 시 두 제약조건이 DB에 있는 것을 확인한 경우에만 적용됩니다 (configure_overlap_precheck).
+OVERLAP_PRECHECK = os.getenv("RESERVATION_OVERLAP_PRECHECK", "true").lower() == "true"
+
+# [규칙 9] 하루 최대 이용 시간 (유저별, 취소되지 않은 예약 합계)
+DAILY_MAX_HOURS = int(os.getenv("RESERVATION_DAILY_MAX_HOURS", 4))
+DAILY_LIMIT_DETAIL = f"하루 최대 이용 시간({DAILY_MAX_HOURS}시간)을 초과합니다."
+
+# 중복 예약 에러 메시지 ([규칙 5] 방 중복, [규칙 7] 유저 중복)
+ROOM_OVERLAP_DETAIL = "해당 방의 해당 시간대는 이미 예약되었습니다."
+USER_OVERLAP_DETAIL = "해당 시간대에 이미 다른 예약이 존재합니다."
 
 class ReservationService:
+    # [v2.3] 실제로 사전 체크를 실행할지. 제약조건이 확인되기 전까지는 항상 실행합니다.
+    overlap_precheck = True
+
+    async def configure_overlap_precheck(self, conn) -> bool:
+        """
+        [v2.3] 기동 시 호출: RESERVATION_OVERLAP_PRECHECK=false이고 배타 제약조건이 pg_constraint에 있을 때만 사전 체크를 끕니다.
+        제약조건이 없는 DB(SQLite, 마이그레이션 전 PostgreSQL)에서 끄면 중복 예약을 막을 장치가 없어지기 때문입니다.
+        """
+        if OVERLAP_PRECHECK or await reservation_repo.overlap_constraints_present(conn):
+            self.overlap_precheck = OVERLAP_PRECHECK
+        else:
+            logger.error(
+                "RESERVATION_OVERLAP_PRECHECK=false ignored: overlap exclusion constraints not found "
+                "(apply migrations/v2_3_reservations.sql)"
+            )
+            self.overlap_precheck = True
+        return self.overlap_precheck
+
     async def create_res(self, db, user_id, res_in):
         # 1. 비즈니스 규칙 검증
         self._validate_reservation_rules(res_in.reservation_date, res_in.start_time, res_in.end_time)
 
-        # 2. 중복 체크 (방/유저)
-        if await reservation_repo.find_overlap(db, res_in.reservation_date, res_in.start_time, res_in.end_time, room_id=res_in.room_id):
-            raise HTTPException(status_code=400, detail="해당 방의 해당 시간대는 이미 예약되었습니다.")
-        
-        if await reservation_repo.find_overlap(db, res_in.reservation_date, res_in.start_time, res_in.end_time, user_id=user_id):
-            raise HTTPException(status_code=400, detail="해당 시간대에 이미 다른 예약이 존재합니다.")
+        # [v2.3] 같은 방·날짜의 쓰기는 잠금으로 줄을 세워, 중복 체크부터 커밋까지 한 번에 하나씩 처리합니다.
+        async with booking_lock.hold(db, [(res_in.room_id, res_in.reservation_date)]):
+            # 2. 중복 체크 (방/유저)
+            if await self._room_taken(db, res_in.room_id, res_in.reservation_date, res_in.start_time, res_in.end_time):
+                raise HTTPException(status_code=400, detail=ROOM_OVERLAP_DETAIL)
 
-        # 3. 객체 생성 및 저장
-        new_res = Reservation(**res_in.model_dump(), user_id=user_id)
-        saved_res = await reservation_repo.save(db, new_res)
-        
-        # 4. 명시적 저장 확정
-        await db.commit()
+            if await self._user_taken(db, user_id, res_in.reservation_date, res_in.start_time, res_in.end_time):
+                raise HTTPException(status_code=400, detail=USER_OVERLAP_DETAIL)
+
+            # 3. 객체 생성 및 저장 + 4. 명시적 저장 확정
+            # 동시에 들어온 요청이 사전 체크를 함께 통과해도 DB 제약조건이 한쪽을 거부합니다.
+            new_res = Reservation(**res_in.model_dump(), user_id=user_id)
+            try:
+                saved_res = await reservation_repo.save(db, new_res)
+                await self._reserve_hours(db, user_id, res_in.reservation_date, res_in.end_time - res_in.start_time)
+                await self._bump_versions(db, user_id)
+                await db.commit()
+            except IntegrityError as e:
+                await self._raise_overlap(db, e)
+            occupancy_index.add(saved_res.room_id, saved_res.user_id, saved_res.reservation_date, saved_res.start_time, saved_res.end_time)
+
+        await self._bump_room_status(db, saved_res.reservation_date)
+        room_feed.notify_reservation(saved_res.reservation_date)
         await db.refresh(saved_res)
         return saved_res
 
+    async def create_bulk(self, db, user_id, bulk_in):
+        """
+        [v2.3] 일괄/반복 예약 생성 (전부 성공하거나 전부 실패)
+        모든 슬롯의 방/유저 중복을 한 번의 쿼리로 확인하고, 한 번의 INSERT로 저장합니다.
+        """
+        slots = bulk_in.expand()
+        if not slots:
+            raise HTTPException(status_code=400, detail="예약할 슬롯이 없습니다.")
+        if len(slots) > MAX_BULK_SLOTS:
+            raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BULK_SLOTS}건까지 예약할 수 있습니다.")
+
+        conflicts = []
+        # 1. 비즈니스 규칙 검증 + 요청 안에서 서로 겹치는 슬롯 확인
+        requested: dict[date, int] = {}
+        for slot in slots:
+            try:
+                self._validate_reservation_rules(slot.reservation_date, slot.start_time, slot.end_time)
+            except HTTPException as e:
+                conflicts.append(self._conflict(slot, "RULE", e.detail))
+                continue
+            mask = slot_mask(slot.start_time, slot.end_time)
+            if requested.get(slot.reservation_date, 0) & mask:
+                conflicts.append(self._conflict(slot, "DUPLICATE", "요청한 슬롯끼리 시간이 겹칩니다."))
+            requested[slot.reservation_date] = requested.get(slot.reservation_date, 0) | mask
+
+        dates = sorted({slot.reservation_date for slot in slots})
+        async with booking_lock.hold(db, [(bulk_in.room_id, d) for d in dates]):
+            # 2. 중복 체크 (방/유저): 전체 날짜의 기존 예약을 한 번에 가져와 비트마스크로 비교
+            room_masks: dict[date, int] = {}
+            user_masks: dict[date, int] = {}
+            for room_id, res_user_id, res_date, start, end in await reservation_repo.find_active_on_dates(db, bulk_in.room_id, user_id, dates):
+                if room_id == bulk_in.room_id:
+                    room_masks[res_date] = room_masks.get(res_date, 0) | slot_mask(start, end)
+                if res_user_id == user_id:
+                    user_masks[res_date] = user_masks.get(res_date, 0) | slot_mask(start, end)
+
+            for slot in slots:
+                mask = slot_mask(slot.start_time, slot.end_time)
+                if room_masks.get(slot.reservation_date, 0) & mask:
+                    conflicts.append(self._conflict(slot, "ROOM", ROOM_OVERLAP_DETAIL))
+                elif user_masks.get(slot.reservation_date, 0) & mask:
+                    conflicts.append(self._conflict(slot, "USER", USER_OVERLAP_DETAIL))
+
+            if conflicts:
+                raise HTTPException(
+                    status_code=400,
+                    detail={"message": "예약할 수 없는 슬롯이 있어 전체 예약이 취소되었습니다.", "conflicts": conflicts},
+                )
+
+            # 3. 한 번의 INSERT로 저장 + 4. 한 번의 커밋으로 확정
+            rows = [
+                {
+                    "user_id": user_id,
+                    "room_id": bulk_in.room_id,
+                    "reservation_date": slot.reservation_date,
+                    "start_time": slot.start_time,
+                    "end_time": slot.end_time,
+                }
+                for slot in slots
+            ]
+            try:
+                saved = await reservation_repo.save_all(db, rows)
+                await self._reserve_bulk_hours(db, user_id, slots)
+                await self._bump_versions(db, user_id)
+                await db.commit()
+            except IntegrityError as e:
+                await self._raise_overlap(db, e)
+            for res in saved:
+                occupancy_index.add(res.room_id, res.user_id, res.reservation_date, res.start_time, res.end_time)
+
+        await self._bump_room_status(db, *dates)
+        room_feed.notify_reservation(*dates)
+        return saved
+
+    def _conflict(self, slot, reason, detail):
+        return SlotConflict(
+            reservation_date=slot.reservation_date,
+            start_time=slot.start_time,
+            end_time=slot.end_time,
+            reason=reason,
+            detail=detail,
+        ).model_dump(mode="json")
+
     async def cancel_res(self, db, user_id, res_id):
         # 1. 예약 존재 여부 및 본인 확인
         res = await reservation_repo.get_by_id(db, res_id)
@@ -33,11 +172,17 @@ class ReservationService:
         # 2. 취소 가능 시간 확인 (규칙 4)
         self._check_modification_limit(res.reservation_date, res.start_time)
 
-        # 3. 상태 변경 및 취소 시간 기록
+        # 3. 상태 변경 및 취소 시간 기록 (+ [v2.3] 하루 이용 시간 합계에서 제외)
+        if res.status != "CANCELLED":
+            await usage_repo.apply(db, user_id, res.reservation_date, -(res.end_time - res.start_time))
         res.status = "CANCELLED"
         res.canceled_at = datetime.now()
+        await self._bump_versions(db, user_id)
         
         await db.commit() # 변경 사항 반영
+        occupancy_index.remove(res.room_id, res.user_id, res.reservation_date, res.start_time, res.end_time)
+        await self._bump_room_status(db, res.reservation_date)
+        room_feed.notify_reservation(res.reservation_date)
         return {"message": "정상적으로 취소되었습니다."}
 
     async def update_res(self, db, user_id, res_id, res_in):
@@ -49,30 +194,140 @@ class ReservationService:
         self._check_modification_limit(res.reservation_date, res.start_time)
         
         update_data = res_in.model_dump(exclude_unset=True)
-        
-        # 2. 비즈니스 로직 판단 (중복 체크 등)
-        if any(k in update_data for k in ["start_time", "end_time", "reservation_date"]):
-            new_date = update_data.get("reservation_date", res.reservation_date)
-            new_start = update_data.get("start_time", res.start_time)
-            new_end = update_data.get("end_time", res.end_time)
-            
-            self._validate_reservation_rules(new_date, new_start, new_end)
-
-            overlap = await reservation_repo.find_overlap(
-                db, new_date, new_start, new_end, 
-                room_id=res.room_id, exclude_id=res_id
-            )
-            if overlap:
-                raise HTTPException(status_code=400, detail="해당 시간대에 이미 예약이 있습니다.")
+        new_date = update_data.get("reservation_date", res.reservation_date)
 
-        # 3. [변경포인트] 실제 수정 행위는 레포지토리에 위임!
-        updated_res = await reservation_repo.update(db, res, update_data)
-        
-        # 4. 트랜잭션 확정
-        await db.commit()
+        async with booking_lock.hold(db, [(res.room_id, new_date)]):
+            # 2. 비즈니스 로직 판단 (중복 체크 등)
+            if any(k in update_data for k in ["start_time", "end_time", "reservation_date"]):
+                new_start = update_data.get("start_time", res.start_time)
+                new_end = update_data.get("end_time", res.end_time)
+
+                self._validate_reservation_rules(new_date, new_start, new_end)
+                # [규칙 1, 2] 수정 후에도 1~2시간 구간이어야 합니다.
+                if not 1 <= new_end - new_start <= 2:
+                    raise HTTPException(status_code=400, detail="예약 시간은 1시간 이상 2시간 이하여야 합니다.")
+
+                if await self._room_taken(db, res.room_id, new_date, new_start, new_end, exclude=res):
+                    raise HTTPException(status_code=400, detail="해당 시간대에 이미 예약이 있습니다.")
+
+            # 인덱스 갱신을 위해 수정 전 구간을 기억해 둡니다.
+            old_slot = (res.room_id, res.user_id, res.reservation_date, res.start_time, res.end_time)
+            counted = res.status != "CANCELLED"
+
+            # 3. [변경포인트] 실제 수정 행위는 레포지토리에 위임! + 4. 트랜잭션 확정
+            try:
+                updated_res = await reservation_repo.update(db, res, update_data)
+                if counted:
+                    await self._move_hours(
+                        db, user_id, old_slot[2], old_slot[4] - old_slot[3],
+                        updated_res.reservation_date, updated_res.end_time - updated_res.start_time,
+                    )
+                await self._bump_versions(db, user_id)
+                await db.commit()
+            except IntegrityError as e:
+                await self._raise_overlap(db, e)
+            occupancy_index.remove(*old_slot)
+            occupancy_index.add(updated_res.room_id, updated_res.user_id, updated_res.reservation_date, updated_res.start_time, updated_res.end_time)
+
+        # 수정 전/후 날짜 중 하나라도 오늘이면 현재 상태가 바뀔 수 있습니다.
+        await self._bump_room_status(db, old_slot[2], updated_res.reservation_date)
+        room_feed.notify_reservation(old_slot[2], updated_res.reservation_date)
         await db.refresh(updated_res)
         return updated_res
 
+    async def _reserve_hours(self, db, user_id, res_date, hours):
+        """[규칙 9] 하루 이용 시간 합계를 한도 안에서만 늘립니다. 넘치면 저장하지 않고 400"""
+        if not await usage_repo.apply(db, user_id, res_date, hours, limit=DAILY_MAX_HOURS):
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=DAILY_LIMIT_DETAIL)
+
+    async def _reserve_bulk_hours(self, db, user_id, slots):
+        """[규칙 9] 일괄 예약: 날짜별로 합쳐 한 번씩 반영하고, 넘치는 날짜의 슬롯을 충돌 목록으로 반환"""
+        hours_by_date: dict[date, int] = {}
+        for slot in slots:
+            hours_by_date[slot.reservation_date] = hours_by_date.get(slot.reservation_date, 0) + slot.end_time - slot.start_time
+        over = set()
+        for res_date, hours in sorted(hours_by_date.items()):
+            if not await usage_repo.apply(db, user_id, res_date, hours, limit=DAILY_MAX_HOURS):
+                over.add(res_date)
+        if over:
+            await db.rollback()
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": "예약할 수 없는 슬롯이 있어 전체 예약이 취소되었습니다.",
+                    "conflicts": [
+                        self._conflict(slot, "QUOTA", DAILY_LIMIT_DETAIL) for slot in slots if slot.reservation_date in over
+                    ],
+                },
+            )
+
+    async def _move_hours(self, db, user_id, old_date, old_hours, new_date, new_hours):
+        """[규칙 9] 예약 수정: 이전 날짜에서 빼고 새 날짜에 더합니다 (늘어나는 쪽만 한도 확인)"""
+        if old_date == new_date:
+            if new_hours > old_hours:
+                await self._reserve_hours(db, user_id, new_date, new_hours - old_hours)
+            elif new_hours < old_hours:
+                await usage_repo.apply(db, user_id, old_date, new_hours - old_hours)
+            return
+        await usage_repo.apply(db, user_id, old_date, -old_hours)
+        await self._reserve_hours(db, user_id, new_date, new_hours)
+
+    async def _bump_versions(self, db, user_id):
+        """[v2.3] 조건부 GET용 버전 증가: 내 예약 목록 (유저별 행이므로 예약 트랜잭션 안에서 함께 커밋)"""
+        await version_repo.bump(db, user_reservations_resource(user_id))
+
+    async def _bump_room_status(self, db, *dates):
+        """
+        [v2.3] 방 실시간 상태 버전은 오늘 예약이 바뀔 때만 올립니다.
+        모든 방이 공유하는 한 행이라 예약 트랜잭션 안에서 올리면 커밋까지 행 잠금을 잡아 오늘 예약 전체가 줄을 서므로,
+        예약을 커밋한 뒤 별도의 짧은 트랜잭션으로 올립니다. 그 사이의 응답은 새 데이터에 이전 ETag가 붙을 뿐이라
+        다음 요청에서 다시 받게 됩니다.
+        """
+        if datetime.now().date() not in dates:
+            return
+        try:
+            # 실패해도 세이브포인트만 되돌려, 이미 커밋한 예약 객체가 만료되지 않게 합니다.
+            async with db.begin_nested():
+                await version_repo.bump(db, ROOM_STATUS_RESOURCE)
+        except DBAPIError:
+            logger.exception("방 상태 버전 증가 실패")
+        await db.commit()
+
+    async def _raise_overlap(self, db, exc: IntegrityError):
+        """DB 제약조건 위반을 기존 중복 예약 응답(400)으로 변환"""
+        await db.rollback()
+        kind = reservation_repo.overlap_violation(exc)
+        if kind == "room":
+            raise HTTPException(status_code=400, detail=ROOM_OVERLAP_DETAIL)
+        if kind == "user":
+            raise HTTPException(status_code=400, detail=USER_OVERLAP_DETAIL)
+        raise exc
+
+    async def _room_taken(self, db, room_id, res_date, start, end, exclude=None):
+        """[규칙 5] 방 중복 여부. 점유 인덱스가 켜져 있으면 비트 연산으로, 아니면 DB 범위 쿼리로 판별"""
+        if not self.overlap_precheck:
+            return False
+        if OCCUPANCY_INDEX_ENABLED:
+            ignore = 0
+            if exclude is not None and exclude.reservation_date == res_date:
+                ignore = slot_mask(exclude.start_time, exclude.end_time)
+            return await occupancy_index.room_conflict(db, room_id, res_date, start, end, ignore_mask=ignore)
+        overlap = await reservation_repo.find_overlap(
+            db, res_date, start, end,
+            room_id=room_id, exclude_id=exclude.id if exclude is not None else None
+        )
+        return overlap is not None
+
+    async def _user_taken(self, db, user_id, res_date, start, end):
+        """[규칙 7] 유저 중복 여부"""
+        if not self.overlap_precheck:
+            return False
+        if OCCUPANCY_INDEX_ENABLED:
+            return await occupancy_index.user_conflict(db, user_id, res_date, start, end)
+        overlap = await reservation_repo.find_overlap(db, res_date, start, end, user_id=user_id)
+        return overlap is not None
+
     def _validate_reservation_rules(self, res_date, start, end):
         now = datetime.now()
         if res_date < now.date():
@@ -87,32 +342,79 @@ class ReservationService:
         
     async def get_my_res(self, db, user_id):
         """내 예약 목록을 조회하며 실시간 상태를 계산하여 보여줌"""
-        from datetime import time  # 상단에 없다면 추가
-        
         # 1. DB에서 내 예약 목록 가져오기
         reservations = await reservation_repo.get_my_list(db, user_id)
         now = datetime.now()
 
-        # 2. 각 예약 객체에 '실시간 딱지' 붙이기
+        # 2. 각 예약 객체에 '실시간 딱지' 붙이기 (기준 시각은 한 번만 잡습니다)
         for res in reservations:
-            if res.status == "CANCELLED":
-                res.display_status = "CANCELLED"
-            else:
-                # 시작/종료 시간을 datetime 객체로 만들어 현재 시간과 비교
-                res_start = datetime.combine(res.reservation_date, time(res.start_time))
-                res_end = datetime.combine(res.reservation_date, time(res.end_time))
-                
-                if now < res_start:
-                    res.display_status = "UPCOMING"    # 이용 전
-                elif res_start <= now < res_end:
-                    res.display_status = "IN_USE"      # 이용 중
-                else:
-                    res.display_status = "COMPLETED"   # 이용 완료 (자동 전환 핵심!)
+            res.display_status = classify_status(res.status, res.reservation_date, res.start_time, res.end_time, now)
         
         return reservations
     
-    async def get_my_reservations(self, db, user_id):
-        """내 예약 목록 조회 (나중에 필터링이나 정렬 로직이 추가될 수 있음)"""
-        return await reservation_repo.get_my_list(db, user_id)
+    async def get_my_reservations(self, db, user_id, cursor=None, limit=DEFAULT_PAGE_SIZE, upcoming=False):
+        """
+        내 예약 목록 조회 (나중에 필터링이나 정렬 로직이 추가될 수 있음)
+        [v2.3] (날짜, 시작 시간, id) 기준 키셋 페이지네이션. (목록, 다음 페이지 커서)를 반환
+        [v2.3] upcoming=True면 아직 시작하지 않은 예약만 조회합니다.
+        """
+        after = None
+        if cursor:
+            try:
+                res_date, start_time, res_id = decode_cursor(cursor)
+                after = (date.fromisoformat(res_date), int(start_time), int(res_id))
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+        upcoming_after = None
+        if upcoming:
+            now = datetime.now()
+            upcoming_after = (now.date(), now.hour)
+        reservations = await reservation_repo.get_my_list(
+            db, user_id, after=after, limit=limit + 1, upcoming_after=upcoming_after
+        )
+        # [v2.3] 페이지가 보관 기준일 이전까지 내려가면 보관 테이블의 지난 예약도 같은 순서로 합칩니다.
+        # 최근 예약만 보는 대부분의 조회는 reservations 테이블 쿼리 1회로 끝납니다.
+        if not upcoming and (len(reservations) <= limit or reservations[-1].reservation_date < archive_boundary(date.today())):
+            archived = await reservation_repo.get_archived_list(db, user_id, after=after, limit=limit + 1)
+            if archived:
+                reservations = list(heapq.merge(reservations, archived, key=self._list_key, reverse=True))[:limit + 1]
+        return split_page(
+            reservations, limit,
+            key=lambda res: [res.reservation_date.isoformat(), res.start_time, res.id]
+        )
+
+    @staticmethod
+    def _list_key(res):
+        return (res.reservation_date, res.start_time, res.id)
+
+    async def get_my_usage(self, db, user_id, week_of: date | None = None):
+        """[v2.3] 이번 주(또는 week_of가 속한 주, 월~일) 날짜별 예약 시간과 남은 시간"""
+        day = week_of or date.today()
+        week_start = day - timedelta(days=day.weekday())
+        week_end = week_start + timedelta(days=6)
+        booked = await usage_repo.get_range(db, user_id, week_start, week_end)
+
+        days = []
+        for offset in range(7):
+            usage_date = week_start + timedelta(days=offset)
+            hours = booked.get(usage_date, 0)
+            days.append(DailyUsage(usage_date=usage_date, booked_hours=hours, remaining_hours=max(0, DAILY_MAX_HOURS - hours)))
+        return UsageSummary(
+            week_start=week_start, week_end=week_end, daily_limit_hours=DAILY_MAX_HOURS,
+            total_hours=sum(booked.values()), days=days,
+        )
+
+    async def rebuild_daily_usage(self, db):
+        """하루 이용 시간 합계를 reservations 테이블 기준으로 다시 계산합니다. 갱신된 (유저, 날짜) 수를 반환"""
+        rebuilt = await usage_repo.rebuild(db)
+        await db.commit()
+        return rebuilt
+
+    async def backfill_daily_usage(self, db):
+        """합계 테이블이 비어 있는데 예약이 있으면(최초 배포) 한 번 채웁니다."""
+        if await usage_repo.is_empty(db) and await reservation_repo.exists_any(db):
+            return await self.rebuild_daily_usage(db)
+        return 0
 
 reservation_service = ReservationService()
\ No newline at end of file
@@ -2,7 +2,12 @@ from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 from app.repositories.review_repo import review_repo
 from app.repositories.reservation_repo import reservation_repo
+from app.repositories.rating_repo import rating_repo
+from app.repositories.version_repo import RATINGS_RESOURCE, version_repo
 from app.models.review import Review
+from app.schemas.review import RatingSummary
+from app.services.room_catalog import room_catalog
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, decode_cursor, split_page
 
 class ReviewService:
     async def create_review(self, db, user_id, review_in):
@@ -41,7 +46,11 @@ class ReviewService:
         )
         
         saved_review = await review_repo.save(db, new_review)
+        # [v2.3] 평점 집계를 같은 트랜잭션에서 갱신 (리뷰와 집계가 항상 함께 커밋/롤백)
+        await rating_repo.apply(db, res.room_id, review_in.rating, 1)
+        await version_repo.bump(db, RATINGS_RESOURCE)
         await db.commit()
+        await self._refresh_catalog_rating(db, res.room_id)
         await db.refresh(saved_review)
         return saved_review
 
@@ -51,7 +60,59 @@ class ReviewService:
             raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없거나 삭제 권한이 없습니다.")
         
         await review_repo.delete(db, review)
+        await rating_repo.apply(db, review.room_id, review.rating, -1)
+        await version_repo.bump(db, RATINGS_RESOURCE)
         await db.commit()
+        await self._refresh_catalog_rating(db, review.room_id)
         return {"message": "리뷰가 삭제되었습니다."}
 
+    async def _refresh_catalog_rating(self, db, room_id):
+        """[v2.3] 방 목록 캐시에서 리뷰가 바뀐 방의 평점만 교체 (전체 다시 읽기 없음)"""
+        room_catalog.update_rating(room_id, await rating_repo.get_by_room(db, room_id))
+
+    async def get_room_reviews(self, db, room_id, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """방별 리뷰 최신순 조회. (목록, 다음 페이지 커서)를 반환"""
+        reviews = await review_repo.get_all_by_room(db, room_id, before_id=self._decode(cursor), limit=limit + 1)
+        return split_page(reviews, limit, key=lambda review: [review.id])
+
+    async def get_my_reviews(self, db, user_id, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """내가 작성한 리뷰 최신순 조회. (목록, 다음 페이지 커서)를 반환"""
+        reviews = await review_repo.get_all_by_user(db, user_id, before_id=self._decode(cursor), limit=limit + 1)
+        return split_page(reviews, limit, key=lambda review: [review.id])
+
+    async def get_rating_summary(self, db, room_id):
+        """[v2.3] 방 평점 요약 (평균, 개수, 점수별 분포)"""
+        if not await room_catalog.get(db, room_id):
+            raise HTTPException(status_code=404, detail="해당 방을 찾을 수 없습니다.")
+        summary = await rating_repo.get_by_room(db, room_id)
+        if summary is None:
+            return RatingSummary(room_id=room_id)
+        return RatingSummary(
+            room_id=room_id, count=summary.review_count,
+            average=summary.average, histogram=summary.histogram
+        )
+
+    async def rebuild_rating_summaries(self, db):
+        """평점 집계를 reviews 테이블 기준으로 다시 계산합니다. 갱신된 방 수를 반환"""
+        rebuilt = await rating_repo.rebuild(db)
+        await version_repo.bump(db, RATINGS_RESOURCE)
+        await db.commit()
+        room_catalog.invalidate_ratings()
+        return rebuilt
+
+    async def backfill_rating_summaries(self, db):
+        """집계 테이블이 비어 있는데 리뷰가 있으면(최초 배포) 한 번 채웁니다."""
+        if await rating_repo.is_empty(db) and await review_repo.exists_any(db):
+            return await self.rebuild_rating_summaries(db)
+        return 0
+
+    def _decode(self, cursor):
+        if not cursor:
+            return None
+        try:
+            (before_id,) = decode_cursor(cursor)
+            return int(before_id)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
 review_service = ReviewService()
\ No newline at end of file
@@ -0,0 +1,165 @@
+import asyncio
+import os
+from bisect import bisect_right
+from time import monotonic
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal, READ_REPLICA_ENABLED
+from app.schemas.room import RoomResponse
+from app.repositories.room_repo import room_repo
+from app.repositories.rating_repo import rating_repo
+
+# [v2.3] 방 목록(메타데이터) 캐시 유지 시간(초)
+# 같은 프로세스의 방 생성/수정/삭제는 즉시 반영되고, 다른 워커에서의 변경은 최대 이 시간만큼 늦게 반영됩니다.
+ROOM_CATALOG_TTL = float(os.getenv("ROOM_CATALOG_TTL", 300))
+
+
+class RoomCatalog:
+    """
+    방 메타데이터를 프로세스 메모리에 보관하는 읽기 캐시.
+    방 정보는 학기 중 거의 바뀌지 않으므로 전체를 한 번에 읽어 두고,
+    쓰기 경로에서 버전을 올려 다음 읽기 때 다시 불러오게 합니다.
+    실시간 상태(availability_status)는 여기에 담지 않고 조회 시점에 덧씌웁니다.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._loaded_version = -1
+        self._expires_at = 0.0
+        self._rooms: list[RoomResponse] = []  # id 오름차순
+        self._ids: list[int] = []
+        self._by_id: dict[int, RoomResponse] = {}
+        self._lock = asyncio.Lock()
+        self.loads = 0
+        # 마지막으로 확인한 DB의 방 리소스 버전 (resource_versions.rooms)
+        self._source_version: int | None = None
+        # 평점만 다시 읽어야 하는지 (다른 워커의 리뷰 작성/삭제, resource_versions.ratings)
+        self._ratings_stale = False
+        self._ratings_version: int | None = None
+        self.rating_loads = 0
+
+    def _fresh(self) -> bool:
+        return self._loaded_version == self.version and monotonic() < self._expires_at
+
+    async def _ensure_loaded(self, db: AsyncSession):
+        if self._fresh() and not self._ratings_stale:
+            return
+        # 동시에 여러 요청이 만료를 만나도 DB는 한 번만 읽습니다.
+        async with self._lock:
+            if self._fresh():
+                if self._ratings_stale:
+                    await self._reload_ratings(db)
+                return
+            self._ratings_stale = False
+            version = self.version
+            rooms = await self._from_primary(db, self._load)
+            self._set_rooms(rooms)
+            # 읽는 도중 버전이 올라갔다면 이번 결과는 한 번만 쓰고 다음 조회 때 다시 불러옵니다.
+            self._loaded_version = version
+            self._expires_at = monotonic() + self.ttl
+            self.loads += 1
+
+    @staticmethod
+    async def _from_primary(db: AsyncSession, loader):
+        if READ_REPLICA_ENABLED:
+            # 무효화 직후 복제 지연된 데이터를 TTL 동안 캐시하지 않도록 적재는 항상 primary에서 합니다.
+            async with AsyncSessionLocal() as primary_db:
+                return await loader(primary_db)
+        return await loader(db)
+
+    async def _load(self, db: AsyncSession) -> list[RoomResponse]:
+        rows = await room_repo.get_all_rooms(db, limit=None)
+        ratings = await rating_repo.get_all(db)
+        return [self._snapshot(row, ratings.get(row.id)) for row in rows]
+
+    async def _reload_ratings(self, db: AsyncSession):
+        """방 메타데이터는 그대로 두고 평점 집계만 다시 읽어 덮어씁니다 (쿼리 1회)"""
+        self._ratings_stale = False
+        ratings = await self._from_primary(db, rating_repo.get_all)
+        self._set_rooms([self._with_rating(room, ratings.get(room.id)) for room in self._rooms])
+        self.rating_loads += 1
+
+    def _set_rooms(self, rooms: list[RoomResponse]):
+        self._rooms = rooms
+        self._ids = [room.id for room in rooms]
+        self._by_id = {room.id: room for room in rooms}
+
+    @classmethod
+    def _snapshot(cls, row, rating) -> RoomResponse:
+        room = RoomResponse.model_validate(row)
+        if rating is None:
+            return room
+        return cls._with_rating(room, rating)
+
+    @staticmethod
+    def _with_rating(room: RoomResponse, rating) -> RoomResponse:
+        if rating is None:
+            return room.model_copy(update={"rating_avg": None, "rating_count": 0})
+        return room.model_copy(update={"rating_avg": rating.average, "rating_count": rating.review_count})
+
+    async def page(self, db: AsyncSession, after_id: int | None = None, limit: int | None = None) -> list[RoomResponse]:
+        """id 순 키셋 페이지 (room_repo.get_all_rooms와 같은 순서)"""
+        await self._ensure_loaded(db)
+        start = bisect_right(self._ids, after_id) if after_id is not None else 0
+        end = start + limit if limit is not None else None
+        return self._rooms[start:end]
+
+    async def get(self, db: AsyncSession, room_id: int) -> RoomResponse | None:
+        await self._ensure_loaded(db)
+        return self._by_id.get(room_id)
+
+    async def get_many(self, db: AsyncSession, room_ids) -> list[RoomResponse]:
+        """주어진 id 순서대로 스냅샷 목록 (캐시에 없는 id는 제외)"""
+        await self._ensure_loaded(db)
+        return [self._by_id[room_id] for room_id in room_ids if room_id in self._by_id]
+
+    async def active(self, db: AsyncSession) -> list[RoomResponse]:
+        await self._ensure_loaded(db)
+        return [room for room in self._rooms if room.is_active]
+
+    def invalidate(self):
+        """방 생성/수정/삭제 커밋 후 호출"""
+        self.version += 1
+
+    def invalidate_ratings(self):
+        """평점 집계 전체가 바뀌었을 때(재계산) 호출: 다음 조회 때 평점만 다시 읽습니다."""
+        self._ratings_stale = True
+
+    def update_rating(self, room_id: int, summary):
+        """리뷰 작성/삭제 커밋 후 호출: 해당 방의 스냅샷만 새 평점으로 교체합니다."""
+        if self._lock.locked():
+            # 진행 중인 적재가 커밋 전 평점을 읽었을 수 있으므로 다음 조회 때 평점을 다시 읽습니다.
+            self._ratings_stale = True
+        room = self._by_id.get(room_id)
+        if room is None:
+            return
+        updated = self._with_rating(room, summary)
+        self._by_id[room_id] = updated
+        self._rooms[bisect_right(self._ids, room_id) - 1] = updated
+
+    def sync(self, source_version: int, ratings_version: int | None = None):
+        """
+        [v2.3] 조건부 GET에서 읽은 DB 버전이 달라졌으면 캐시를 버립니다.
+        다른 워커의 방 변경은 전체를, 리뷰 변경은 평점만 TTL을 기다리지 않고 다음 방 목록 조회에 반영합니다.
+        """
+        if source_version != self._source_version:
+            self._source_version = source_version
+            self.invalidate()
+        if ratings_version is not None and ratings_version != self._ratings_version:
+            self._ratings_version = ratings_version
+            self._ratings_stale = True
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "source_version": self._source_version,
+            "ratings_version": self._ratings_version,
+            "fresh": self._fresh(),
+            "rooms": len(self._rooms),
+            "loads": self.loads,
+            "rating_loads": self.rating_loads,
+            "ttl": self.ttl,
+        }
+
+
+room_catalog = RoomCatalog(ttl=ROOM_CATALOG_TTL)
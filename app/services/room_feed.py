@@ -0,0 +1,154 @@
+import asyncio
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+from app.database import AsyncSessionLocal
+
+logger = logging.getLogger("uvicorn.error")
+
+# [v2.3] 방 상태 실시간 스트림(SSE) 설정
+# 구독자 한 명당 쌓아 둘 수 있는 이벤트 수. 넘치면 그 구독자에게는 스냅샷을 다시 보냅니다.
+ROOM_FEED_QUEUE_SIZE = int(os.getenv("ROOM_FEED_QUEUE_SIZE", 100))
+# 구독자가 있을 때 DB 기준으로 상태를 다시 맞추는 주기(초). 다른 워커에서 생긴 변경을 반영합니다.
+ROOM_FEED_REFRESH_INTERVAL = float(os.getenv("ROOM_FEED_REFRESH_INTERVAL", 30))
+# 변경이 없을 때 연결 유지를 위해 보내는 주석 줄 주기(초)
+ROOM_FEED_KEEPALIVE = float(os.getenv("ROOM_FEED_KEEPALIVE", 15))
+
+
+def sse_message(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+class Subscriber:
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        # 큐가 넘쳐 이벤트를 잃었으면 True (다음에 스냅샷을 다시 보내야 함)
+        self.overflowed = False
+
+
+class RoomStatusFeed:
+    """
+    방 상태(availability_status 포함) 변경을 구독자들에게 나눠 주는 프로세스 내 발행/구독 버스.
+    예약/방 변경 시 notify()가 호출되면 현재 상태를 DB에서 한 번 계산해 직전 상태와 비교하고,
+    바뀐 방만 delta 이벤트로 발행합니다. 구독자 수와 무관하게 변경 1회당 계산도 1회입니다.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: set[Subscriber] = set()
+        self._last: dict[int, dict] = {}
+        self._dirty = False
+        self._task: asyncio.Task | None = None
+        self._refresh_lock = asyncio.Lock()
+        self.published = 0
+
+    # --- 구독 ---
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self._subscribers.discard(subscriber)
+
+    def snapshot(self) -> list[dict]:
+        return list(self._last.values())
+
+    async def stream(self):
+        """SSE 응답 본문: 스냅샷 1회 후 delta 이벤트, 변경이 없으면 keepalive 주석"""
+        subscriber = self.subscribe()
+        try:
+            # 구독을 먼저 등록한 뒤 상태를 맞추므로 그 사이의 변경도 놓치지 않습니다.
+            await self.refresh()
+            snapshot = self.snapshot()
+            # 스냅샷 이전에 쌓인 delta는 스냅샷에 이미 반영되어 있으므로 버립니다.
+            self._drain(subscriber)
+            yield sse_message("snapshot", snapshot)
+            while True:
+                try:
+                    delta = await asyncio.wait_for(subscriber.queue.get(), timeout=ROOM_FEED_KEEPALIVE)
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if subscriber.overflowed:
+                    # 처리 속도가 느린 구독자: 밀린 delta 대신 현재 스냅샷으로 다시 맞춥니다.
+                    subscriber.overflowed = False
+                    self._drain(subscriber)
+                    yield sse_message("snapshot", self.snapshot())
+                    continue
+                yield sse_message("delta", delta)
+        finally:
+            self.unsubscribe(subscriber)
+
+    @staticmethod
+    def _drain(subscriber: Subscriber):
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+
+    # --- 발행 ---
+    def notify(self):
+        """방 상태가 바뀌었을 수 있음을 알립니다. 구독자가 없으면 아무 일도 하지 않습니다."""
+        if not self._subscribers:
+            return
+        self._dirty = True
+        # 짧은 시간에 여러 번 호출되어도 계산은 한 작업이 몰아서 합니다.
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    def notify_reservation(self, *dates: date):
+        """예약 변경: 오늘 날짜일 때만 현재 상태(IN_USE/AVAILABLE)에 영향을 줍니다."""
+        if datetime.now().date() in dates:
+            self.notify()
+
+    async def _refresh_loop(self):
+        while self._dirty:
+            self._dirty = False
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("방 상태 스트림 갱신 실패")
+
+    async def refresh(self):
+        """현재 상태를 계산해 직전 상태와 다른 방만 발행"""
+        from app.services.room_service import room_service
+
+        async with self._refresh_lock:
+            async with AsyncSessionLocal() as db:
+                rooms = await room_service.get_all_with_status(db)
+            state = {room.id: room.model_dump(mode="json") for room in rooms}
+
+            changed = [room for room_id, room in state.items() if self._last.get(room_id) != room]
+            removed = [room_id for room_id in self._last if room_id not in state]
+            self._last = state
+            if changed or removed:
+                self._publish({"changed": changed, "removed": removed})
+
+    def _publish(self, delta: dict):
+        self.published += 1
+        for subscriber in self._subscribers:
+            try:
+                subscriber.queue.put_nowait(delta)
+            except asyncio.QueueFull:
+                subscriber.overflowed = True
+
+    async def run_ticker(self, interval: float):
+        """
+        lifespan에서 백그라운드로 실행.
+        정시(예약 시작/종료 시각)마다, 그리고 interval초마다 상태를 다시 계산합니다.
+        """
+        while True:
+            now = datetime.now()
+            next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+            await asyncio.sleep(min((next_hour - now).total_seconds() + 0.5, interval))
+            self.notify()
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "rooms": len(self._last),
+            "published": self.published,
+        }
+
+
+room_feed = RoomStatusFeed(queue_size=ROOM_FEED_QUEUE_SIZE)
@@ -1,15 +1,25 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.room import StudyRoom
-from app.schemas.room import RoomCreate, RoomUpdate
+from app.schemas.room import RoomCreate, RoomResponse, RoomUpdate
+from app.schemas.reservation import OPEN_HOUR, CLOSE_HOUR
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, decode_cursor, split_page
 from app.repositories.room_repo import room_repo
 from app.repositories.reservation_repo import reservation_repo # 👈 추가: 예약 확인용
+from app.repositories.occupancy_index import slot_mask
+from app.services.room_catalog import room_catalog
+from app.services.room_feed import room_feed
+from app.repositories.version_repo import ROOMS_RESOURCE, version_repo
+
+# 달력 조회 최대 기간 (일)
+MAX_AVAILABILITY_DAYS = 31
 
 class RoomService:
     async def create_room(self, db: AsyncSession, room_in: RoomCreate):
         new_room = StudyRoom(**room_in.model_dump())
         await room_repo.save_room(db, new_room)
+        await version_repo.bump(db, ROOMS_RESOURCE)
         
         try:
             await db.commit() 
@@ -17,73 +27,173 @@ class RoomService:
         except Exception as e:
             await db.rollback()
             raise e
-                
+
+        room_catalog.invalidate()
+        room_feed.notify()
         return new_room
     
     # [수정] 전체 조회: 실시간 상태(availability_status) 계산 로직 추가
-    async def get_rooms(self, db: AsyncSession):
-        rooms = await room_repo.get_all_rooms(db)
+    async def get_rooms(self, db: AsyncSession, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE,
+                        source_version: int | None = None, ratings_version: int | None = None):
+        """
+        [v2.3] id 순 키셋 페이지네이션. (방 목록, 다음 페이지 커서)를 반환
+        source_version, ratings_version: 라우터가 ETag 계산 때 읽은 DB의 방/평점 리소스 버전 (캐시 일관성 확인용)
+        """
+        after_id = None
+        if cursor:
+            try:
+                (after_id,) = decode_cursor(cursor)
+                after_id = int(after_id)
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+        # [v2.3] 방 메타데이터는 캐시에서 읽고, DB는 실시간 점유 상태 조회에만 사용
+        if source_version is not None:
+            room_catalog.sync(source_version, ratings_version)
+        rooms = await room_catalog.page(db, after_id=after_id, limit=limit + 1)
+        rooms, next_cursor = split_page(rooms, limit, key=lambda room: [room.id])
+        return await self._apply_live_status(db, rooms), next_cursor
+
+    async def get_all_with_status(self, db: AsyncSession):
+        """[v2.3] 전체 방 + 실시간 상태 (방 상태 스트림용, 쿼리 1회)"""
+        return await self._apply_live_status(db, await room_catalog.page(db))
+
+    async def _apply_live_status(self, db: AsyncSession, rooms):
+        """현재 시간 기준 실시간 상태(availability_status)를 방 목록에 주입"""
         now = datetime.now()
 
+        # [v2.3] 방마다 find_overlap을 호출하던 N+1 쿼리를 제거하고,
+        # 현재 시간에 사용 중인 방 ID를 한 번에 가져와 집합 연산으로 판별합니다.
+        occupied_ids = await reservation_repo.get_occupied_room_ids(db, now.date(), now.hour)
+
+        result = []
         for room in rooms:
             # 1. 운영 여부 확인
             if not room.is_active:
-                room.availability_status = "INACTIVE"
+                result.append(self._with_status(room, "INACTIVE"))
                 continue
-            
-            # 2. 현재 시간 중복 예약 확인 (Repo의 find_overlap 활용)
-            # 현재 시간을 시작점으로 1시간 동안 예약이 있는지 확인
-            is_reserved = await reservation_repo.find_overlap(
-                db, 
-                res_date=now.date(), 
-                start=now.hour, 
-                end=now.hour + 1, 
-                room_id=room.id
-            )
-
-            # 3. 계산된 상태 주입
-            room.availability_status = "IN_USE" if is_reserved else "AVAILABLE"
-            
-        return rooms
+
+            # 2. 계산된 상태 주입
+            result.append(self._with_status(room, "IN_USE" if room.id in occupied_ids else "AVAILABLE"))
+
+        return result
+
+    @staticmethod
+    def _with_status(room, availability_status: str) -> RoomResponse:
+        # 캐시된 스냅샷은 여러 요청이 공유하므로 직접 수정하지 않고 복사본에 상태를 씌웁니다.
+        if not isinstance(room, RoomResponse):
+            room = RoomResponse.model_validate(room)
+        return room.model_copy(update={"availability_status": availability_status})
     
     # [수정] 단일 조회: 실시간 상태 계산 로직 추가
     async def get_room(self, db: AsyncSession, room_id: int):
-        room = await room_repo.get_room_by_id(db, room_id)
+        room = await room_catalog.get(db, room_id)
         if not room:
             raise HTTPException(status_code=404, detail="해당 방을 찾을 수 없습니다.")
         
         # 실시간 상태 계산
         now = datetime.now()
         if not room.is_active:
-            room.availability_status = "INACTIVE"
-        else:
-            is_reserved = await reservation_repo.find_overlap(
-                db, now.date(), now.hour, now.hour + 1, room_id=room.id
-            )
-            room.availability_status = "IN_USE" if is_reserved else "AVAILABLE"
-            
-        return room
+            return self._with_status(room, "INACTIVE")
+
+        is_reserved = await reservation_repo.find_overlap(
+            db, now.date(), now.hour, now.hour + 1, room_id=room.id
+        )
+        return self._with_status(room, "IN_USE" if is_reserved else "AVAILABLE")
     
-    async def update_room(self, db: AsyncSession, room_id: int, room_in: RoomUpdate):
-        # async with db.begin()을 쓰면 내부에서 commit/rollback을 알아서 관리합니다.
-        async with db.begin():
-            room = await room_repo.get_room_by_id(db, room_id)
+    async def search_rooms(self, db: AsyncSession, res_date: date, start: int, end: int, min_capacity=None,
+                           has_whiteboard=None, has_projector=None, floor=None, limit: int = 20):
+        """[v2.3] 조건에 맞고 해당 시간대가 비어 있는 방을 작은 방 순서로 검색"""
+        if end <= start:
+            raise HTTPException(status_code=400, detail="종료 시간은 시작 시간보다 늦어야 합니다.")
+
+        rooms = await room_repo.search_free_rooms(
+            db, res_date, start, end,
+            min_capacity=min_capacity, has_whiteboard=has_whiteboard,
+            has_projector=has_projector, floor=floor, limit=limit
+        )
+        # 검색 순서는 유지하고, 평점 등 표시 정보는 캐시된 스냅샷으로 채웁니다.
+        rooms = await room_catalog.get_many(db, [room.id for room in rooms])
+        return await self._apply_live_status(db, rooms)
+
+    async def get_availability(self, db: AsyncSession, date_from: date | None, date_to: date | None, room_id: int | None = None, packed: bool = False):
+        """
+        [v2.3] 기간 내 방별/날짜별 예약 가능 슬롯 달력.
+        기간 안의 예약을 한 번의 쿼리로 가져와 (방, 날짜)별 비트마스크로 합칩니다.
+        """
+        date_from = date_from or datetime.now().date()
+        date_to = date_to or date_from + timedelta(days=6)
+        if date_to < date_from:
+            raise HTTPException(status_code=400, detail="종료 날짜는 시작 날짜보다 빠를 수 없습니다.")
+        if (date_to - date_from).days + 1 > MAX_AVAILABILITY_DAYS:
+            raise HTTPException(status_code=400, detail=f"최대 {MAX_AVAILABILITY_DAYS}일까지 조회할 수 있습니다.")
+
+        if room_id is not None:
+            room = await room_catalog.get(db, room_id)
             if not room:
-                raise HTTPException(status_code=404, detail="방을 찾을 수 없습니다.")
+                raise HTTPException(status_code=404, detail="해당 방을 찾을 수 없습니다.")
+            rooms = [room]
+        else:
+            rooms = await room_catalog.active(db)
+
+        # 1. 기간 내 예약을 (방, 날짜)별 점유 마스크로 변환
+        occupied: dict[tuple[int, date], int] = {}
+        for r_id, res_date, start, end in await reservation_repo.get_active_in_range(db, date_from, date_to, room_id=room_id):
+            occupied[(r_id, res_date)] = occupied.get((r_id, res_date), 0) | slot_mask(start, end)
+
+        # 2. 날짜별 예약 가능 시간대 마스크 (운영 시간 내, [규칙 3] 지난 시간 제외)
+        now = datetime.now()
+        days = [date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1)]
+        open_mask = slot_mask(OPEN_HOUR, CLOSE_HOUR)
+        bookable: dict[date, int] = {}
+        for day in days:
+            if day < now.date():
+                bookable[day] = 0
+            elif day == now.date():
+                bookable[day] = open_mask & ~slot_mask(0, min(now.hour + 1, 24))
+            else:
+                bookable[day] = open_mask
+
+        # 3. 응답 구성
+        result = []
+        for room in rooms:
+            room_days = []
+            for day in days:
+                free = bookable[day] & ~occupied.get((room.id, day), 0) if room.is_active else 0
+                if packed:
+                    room_days.append({"date": day, "free_mask": free})
+                else:
+                    room_days.append({"date": day, "slots": [bool(free >> h & 1) for h in range(OPEN_HOUR, CLOSE_HOUR)]})
+            result.append({"room_id": room.id, "days": room_days})
+        return result
+
+    async def update_room(self, db: AsyncSession, room_id: int, room_in: RoomUpdate):
+        # 관리자 인증 단계의 조회로 세션 트랜잭션이 이미 시작되어 있으므로
+        # db.begin() 대신 commit으로 확정합니다.
+        room = await room_repo.get_room_by_id(db, room_id)
+        if not room:
+            raise HTTPException(status_code=404, detail="방을 찾을 수 없습니다.")
+
+        update_data = room_in.model_dump(exclude_unset=True)
+        updated_room = await room_repo.update_room(db, room, update_data)
+        await version_repo.bump(db, ROOMS_RESOURCE)
+        await db.commit()
+        room_catalog.invalidate()
+        room_feed.notify()
 
-            update_data = room_in.model_dump(exclude_unset=True)
-            updated_room = await room_repo.update_room(db, room, update_data)
-        
         await db.refresh(updated_room)
         return updated_room
 
     async def delete_room(self, db: AsyncSession, room_id: int):
-        async with db.begin():
-            room = await room_repo.get_room_by_id(db, room_id)
-            if not room:
-                raise HTTPException(status_code=404, detail="방을 찾을 수 없습니다.")
-            
-            await room_repo.delete_room(db, room)
+        room = await room_repo.get_room_by_id(db, room_id)
+        if not room:
+            raise HTTPException(status_code=404, detail="방을 찾을 수 없습니다.")
+
+        await room_repo.delete_room(db, room)
+        await version_repo.bump(db, ROOMS_RESOURCE)
+        await db.commit()
+        room_catalog.invalidate()
+        room_feed.notify()
 
     
 
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from time import perf_counter
+from sqlalchemy import and_, or_
+from app.database import engine
+from app.models.reservation import Reservation
+from app.repositories.reservation_repo import reservation_repo
+from app.services.job_lock import release_job_lock, try_job_lock
+
+logger = logging.getLogger("uvicorn.error")
+
+# [v2.3] 예약 상태 갱신 작업 설정
+RESERVATION_STATUS_JOB_ENABLED = os.getenv("RESERVATION_STATUS_JOB_ENABLED", "true").lower() == "true"
+# UPDATE 한 번에 옮기는 최대 예약 수. 최초 실행처럼 밀린 건이 많아도 잠금을 짧게 끊어 갑니다.
+RESERVATION_STATUS_BATCH_SIZE = int(os.getenv("RESERVATION_STATUS_BATCH_SIZE", 5000))
+
+# advisory lock 키: 여러 워커가 같은 정시에 깨어나도 한 워커만 실행
+STATUS_JOB_LOCK_KEY = 20231019
+
+
+class ReservationStatusMaterializer:
+    """
+    저장된 예약 상태를 시간에 맞춰 옮기는 작업 (CONFIRMED → IN_USE → COMPLETED).
+    예약은 정시 단위이므로 매 정시 직후 한 번, 그리고 기동 시 밀린 건을 따라잡기 위해 한 번 실행합니다.
+    화면에 보이는 상태는 여전히 classify_status가 시각으로 판별하므로, 작업이 늦어도 응답이 틀리지 않고
+    저장된 상태는 "예정된 예약만" 같은 필터를 인덱스로 처리하는 데 쓰입니다.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.runs = 0
+        self.skipped = 0
+        self.updated = {"IN_USE": 0, "COMPLETED": 0}
+        self.last_run_at: datetime | None = None
+        self.last_seconds = 0.0
+
+    async def run_once(self, now: datetime | None = None) -> dict:
+        """기준 시각(now)까지 끝난 예약은 COMPLETED, 진행 중인 예약은 IN_USE로 옮기고 건수를 반환"""
+        now = now or datetime.now()
+        today, hour = now.date(), now.hour
+        finished = or_(
+            Reservation.reservation_date < today,
+            and_(Reservation.reservation_date == today, Reservation.end_time <= hour),
+        )
+        in_progress = and_(
+            Reservation.reservation_date == today,
+            Reservation.start_time <= hour,
+            Reservation.end_time > hour,
+        )
+
+        started = perf_counter()
+        moved = {"IN_USE": 0, "COMPLETED": 0}
+        # 배치마다 commit하면서도 같은 연결(advisory lock 보유)을 유지하기 위해 세션 대신 연결을 씁니다.
+        async with engine.connect() as conn:
+            if not await try_job_lock(conn, STATUS_JOB_LOCK_KEY):
+                self.skipped += 1
+                return moved
+            try:
+                for status, from_statuses, condition in (
+                    ("COMPLETED", ("CONFIRMED", "IN_USE"), finished),
+                    ("IN_USE", ("CONFIRMED",), in_progress),
+                ):
+                    while True:
+                        count = await reservation_repo.mark_due(conn, status, from_statuses, condition, self.batch_size)
+                        await conn.commit()
+                        moved[status] += count
+                        if count < self.batch_size:
+                            break
+            finally:
+                await release_job_lock(conn, STATUS_JOB_LOCK_KEY)
+
+        self.runs += 1
+        self.last_run_at = now
+        self.last_seconds = round(perf_counter() - started, 6)
+        for status, count in moved.items():
+            self.updated[status] += count
+        if any(moved.values()):
+            logger.info("Reservation status: %d -> IN_USE, %d -> COMPLETED", moved["IN_USE"], moved["COMPLETED"])
+        return moved
+
+    async def run_forever(self):
+        """lifespan에서 백그라운드로 실행: 기동 직후 1회, 이후 매 정시 직후"""
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("예약 상태 갱신 실패")
+            now = datetime.now()
+            next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+            await asyncio.sleep((next_hour - now).total_seconds() + 1)
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "updated": dict(self.updated),
+            "last_run_at": self.last_run_at.isoformat(timespec="seconds") if self.last_run_at else None,
+            "last_seconds": self.last_seconds,
+            "batch_size": self.batch_size,
+        }
+
+
+status_materializer = ReservationStatusMaterializer(batch_size=RESERVATION_STATUS_BATCH_SIZE)
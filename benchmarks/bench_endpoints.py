@@ -0,0 +1,276 @@
+"""
+[v2.3] 주요 API 부하/성능 벤치마크
+
+FastAPI 앱을 프로세스 안에서(httpx ASGITransport) 직접 호출하여 네트워크/서버 설정과 무관하게
+애플리케이션 + DB 구간만 측정합니다. 데이터셋 크기(예약 건수)와 동시 요청 수를 바꿔 가며
+처리량(req/s), p50/p95/p99 지연 시간(ms), 요청당 SQL 실행 수를 기록하고 JSON으로 저장합니다.
+
+실행 예:
+    python -m benchmarks.bench_endpoints --sizes 1000 10000 --concurrency 1 8 32
+    python -m benchmarks.bench_endpoints --database-url postgresql+asyncpg://.../bench
+    python -m benchmarks.compare benchmarks/results/old.json benchmarks/results/new.json
+
+기본 대상 DB(SQLite 파일)는 aiosqlite가 필요합니다: uv sync --group bench
+
+주의: 대상 DB의 모든 테이블 데이터를 지우고 다시 채웁니다. 전용 DB를 사용하세요.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SCENARIOS = ["login", "rooms", "reservations_me", "reviews", "create_reservation"]
+BENCH_PASSWORD = "bench1234"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=f"sqlite+aiosqlite:///{ROOT / 'benchmarks' / 'bench.db'}")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="데이터셋 예약 건수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="시나리오/동시성 조합마다 측정할 요청 수")
+    parser.add_argument("--login-requests", type=int, default=40, help="로그인은 bcrypt 비용이 커서 따로 지정")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--rooms", type=int, default=50, help="방 수 (= 유저 수)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/<커밋>-<시각>.json)")
+    parser.add_argument("--label", default=None, help="결과에 남길 이름 (기본: 현재 커밋)")
+    return parser.parse_args()
+
+
+args = parse_args()
+# 앱 모듈을 import하기 전에 DB/인증 설정을 정합니다.
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+# 운영 cost(12)로 로그인을 측정하려면 BCRYPT_ROUNDS=12로 실행합니다.
+os.environ.setdefault("BCRYPT_ROUNDS", "10")
+# 한 클라이언트가 반복 요청하는 구조라 요청 제한에 걸리므로 기본으로 끕니다 (제한 포함 측정: RATE_LIMIT_ENABLED=true).
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+# 시드/생성 시나리오는 유저 한 명이 하루 6시간을 예약하므로 하루 최대 이용 시간을 넉넉히 둡니다 (합계 확인 비용은 그대로 측정됨).
+os.environ.setdefault("RESERVATION_DAILY_MAX_HOURS", "24")
+
+import bcrypt  # noqa: E402
+import httpx  # noqa: E402
+from sqlalchemy import delete, event, insert, text  # noqa: E402
+from app import models  # noqa: E402
+from app.database import AsyncSessionLocal, READ_REPLICA_ENABLED, engine, read_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Reservation, Review, StudyRoom, User  # noqa: E402
+from app.repositories.occupancy_index import occupancy_index  # noqa: E402
+from app.services.auth_service import auth_service  # noqa: E402
+from app.services.principal_cache import principal_cache, token_cache  # noqa: E402
+from app.services.review_service import review_service  # noqa: E402
+from app.services.reservation_service import reservation_service  # noqa: E402
+from app.services.room_catalog import room_catalog  # noqa: E402
+
+
+class SQLCounter:
+    """엔진에서 실행된 SQL 문 수"""
+
+    def __init__(self):
+        self.count = 0
+
+    def attach(self, target_engine):
+        event.listen(target_engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *_):
+        self.count += 1
+
+
+sql_counter = SQLCounter()
+sql_counter.attach(engine)
+if READ_REPLICA_ENABLED:
+    sql_counter.attach(read_engine)
+
+
+def student_id(index: int) -> str:
+    return f"2024{index:04d}"
+
+
+async def seed(size: int, n_rooms: int):
+    """
+    방 n_rooms개, 유저 n_rooms명, 예약 size건(절반은 지난 예약), 지난 예약 절반에 리뷰.
+    예약 k는 (날짜, 2시간 슬롯, 방)이 겹치지 않게 배치하고, 유저 i는 방 i만 사용하여 유저 중복도 없습니다.
+    """
+    async with AsyncSessionLocal() as db:
+        for table in reversed(models.Base.metadata.sorted_tables):
+            await db.execute(delete(table))
+
+        hashed = bcrypt.hashpw(BENCH_PASSWORD.encode(), bcrypt.gensalt(int(os.environ["BCRYPT_ROUNDS"]))).decode()
+        await db.execute(insert(StudyRoom), [
+            {"id": i + 1, "name": f"Room {i + 1}", "floor": i % 5 + 1, "capacity": 2 + i % 8,
+             "has_whiteboard": i % 2 == 0, "has_projector": i % 3 == 0, "is_active": True}
+            for i in range(n_rooms)
+        ])
+        await db.execute(insert(User), [
+            {"id": i + 1, "student_id": student_id(i), "name": f"bench{i}", "password": hashed, "role": "user"}
+            for i in range(n_rooms)
+        ])
+
+        today = date.today()
+        per_day = n_rooms * 6  # 9~21시 2시간 슬롯 6개
+        past_days = (size // 2) // per_day + 1
+        rows, reviews = [], []
+        for k in range(size):
+            room = k % n_rooms
+            slot = (k // n_rooms) % 6
+            day = today + timedelta(days=k // per_day - past_days)
+            rows.append({
+                "id": k + 1, "room_id": room + 1, "user_id": room + 1, "reservation_date": day,
+                "start_time": 9 + slot * 2, "end_time": 10 + slot * 2,
+                "status": "COMPLETED" if day < today else "CONFIRMED",
+            })
+            if day < today and k % 2 == 0:
+                reviews.append({"user_id": room + 1, "room_id": room + 1, "reservation_id": k + 1,
+                                "rating": k % 5 + 1, "content": "benchmark"})
+        for chunk in range(0, len(rows), 5000):
+            await db.execute(insert(Reservation), rows[chunk:chunk + 5000])
+        if reviews:
+            await db.execute(insert(Review), reviews)
+        if db.bind.dialect.name == "postgresql":
+            # id를 직접 넣었으므로 이후 API의 INSERT가 같은 id를 받지 않도록 시퀀스를 맞춥니다.
+            for table in ("rooms", "users", "reservations"):
+                await db.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))"))
+        await db.commit()
+
+        await review_service.rebuild_rating_summaries(db)
+        await reservation_service.rebuild_daily_usage(db)
+        await occupancy_index.rebuild(db)
+
+    # 프로세스 내 캐시는 이전 데이터셋 기준이므로 비웁니다.
+    room_catalog.invalidate()
+    principal_cache.clear()
+    token_cache.clear()
+    return today + timedelta(days=size // per_day - past_days + 1)
+
+
+def percentile(cuts, p: int) -> float:
+    return round(cuts[p - 1] * 1000, 3)
+
+
+async def run(client, request, total: int, concurrency: int, counter):
+    """total건을 concurrency개 작업자가 나눠 보내고 지표를 계산"""
+    latencies, errors = [], 0
+    remaining = itertools.count()
+
+    async def worker():
+        nonlocal errors
+        while next(remaining) < total:
+            started = perf_counter()
+            response = await request(client, next(counter))
+            latencies.append(perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    sql_before = sql_counter.count
+    started = perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 2),
+        "p50_ms": percentile(cuts, 50),
+        "p95_ms": percentile(cuts, 95),
+        "p99_ms": percentile(cuts, 99),
+        "sql_per_request": round((sql_counter.count - sql_before) / total, 2),
+    }
+
+
+def build_scenarios(n_rooms: int, first_free_day: date):
+    tokens = [
+        {"Authorization": "Bearer " + auth_service._create_access_token({"sub": student_id(i), "role": "user"})}
+        for i in range(n_rooms)
+    ]
+
+    async def login(client, i):
+        return await client.post("/auth/login", json={"student_id": student_id(i % n_rooms), "password": BENCH_PASSWORD})
+
+    async def rooms(client, i):
+        return await client.get("/rooms/", params={"limit": 20})
+
+    async def reservations_me(client, i):
+        return await client.get("/reservations/me", params={"limit": 20}, headers=tokens[i % n_rooms])
+
+    async def reviews(client, i):
+        return await client.get(f"/reviews/room/{i % n_rooms + 1}", params={"limit": 20})
+
+    async def create_reservation(client, i):
+        # 시드 데이터 이후 날짜에 (방, 슬롯)이 겹치지 않게 배치 (유저 i는 방 i만 사용)
+        room = i % n_rooms
+        slot = (i // n_rooms) % 6
+        day = first_free_day + timedelta(days=i // (n_rooms * 6))
+        return await client.post("/reservations/", headers=tokens[room], json={
+            "room_id": room + 1, "reservation_date": day.isoformat(),
+            "start_time": 9 + slot * 2, "end_time": 10 + slot * 2,
+        })
+
+    return {
+        "login": login, "rooms": rooms, "reservations_me": reservations_me,
+        "reviews": reviews, "create_reservation": create_reservation,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def main():
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for size in args.sizes:
+                first_free_day = await seed(size, args.rooms)
+                scenarios = build_scenarios(args.rooms, first_free_day)
+                for name in args.scenarios:
+                    # 같은 데이터셋 안에서는 요청 번호를 이어 써서 생성 요청이 서로 겹치지 않게 합니다.
+                    counter = itertools.count()
+                    total = args.login_requests if name == "login" else args.requests
+                    await run(client, scenarios[name], min(10, total), 1, counter)  # 워밍업
+                    for concurrency in args.concurrency:
+                        metrics = await run(client, scenarios[name], total, concurrency, counter)
+                        results.append({"scenario": name, "size": size, "concurrency": concurrency, **metrics})
+                        print(
+                            f"{name:<20} size={size:<7} c={concurrency:<4} "
+                            f"{metrics['throughput_rps']:>9.1f} req/s  p50={metrics['p50_ms']:>8.2f}ms  "
+                            f"p95={metrics['p95_ms']:>8.2f}ms  p99={metrics['p99_ms']:>8.2f}ms  "
+                            f"sql/req={metrics['sql_per_request']:>5.2f}  errors={metrics['errors']}"
+                        )
+
+    commit = git_commit()
+    report = {
+        "label": args.label or commit,
+        "commit": commit,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "bcrypt_rounds": int(os.environ["BCRYPT_ROUNDS"]),
+        "results": results,
+    }
+    output = Path(args.output) if args.output else (
+        ROOT / "benchmarks" / "results" / f"{commit}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"saved: {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+[v2.3] 예약 목록 직렬화 벤치마크
+
+기존 경로와 고속 경로로 같은 예약 목록을 JSON으로 만드는 시간을 비교합니다.
+- 기존: response_model=list[ReservationResponse] 처리와 같은 단계
+        (항목별 from_attributes 검증 → computed_field에서 항목마다 datetime.now() → dict 변환 → json.dumps)
+- 고속: dump_reservation_list (요청당 now 한 번, TypeAdapter 일괄 검증, pydantic-core dump_json)
+
+실행: python -m benchmarks.bench_serialization --sizes 1000 5000 10000
+(aiosqlite가 필요합니다: uv sync --group bench)
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# 모델 import 시 엔진이 만들어지므로 DB 설정이 없으면 접속하지 않는 메모리 URL을 씁니다.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from pydantic import TypeAdapter  # noqa: E402
+from app.models import Reservation  # noqa: E402
+from app.schemas.reservation import ReservationResponse, dump_reservation_list  # noqa: E402
+
+legacy_adapter = TypeAdapter(list[ReservationResponse])
+
+
+def make_reservations(n: int) -> list[Reservation]:
+    """
+    세션에 붙지 않은 ORM 객체 n개 (실제 응답과 같은 속성 접근 비용)
+    상태는 상태 갱신 작업이 저장하는 값과 같게 두어 classify_status의 모든 분기를 거칩니다.
+    """
+    today = date.today()
+    created = datetime.now()
+    rows = []
+    for i in range(n):
+        start = 9 + i % 12
+        end = start + 1 + i % 2
+        res_date = today + timedelta(days=i % 60 - 30)
+        rows.append(Reservation(
+            id=i + 1, room_id=i % 30 + 1, user_id=1,
+            reservation_date=res_date, start_time=start, end_time=end,
+            status=stored_status(i, res_date, start, end, created),
+            created_at=created, canceled_at=created if i % 10 == 0 else None,
+        ))
+    return rows
+
+
+def stored_status(i: int, res_date: date, start: int, end: int, now: datetime) -> str:
+    if i % 10 == 0:
+        return "CANCELLED"
+    current = (now.date(), now.hour)
+    if current >= (res_date, end):
+        # 일부는 아직 상태 갱신 작업이 옮기지 않은 예약 (CONFIRMED지만 시각상 이용 완료)
+        return "CONFIRMED" if i % 7 == 0 else "COMPLETED"
+    if current >= (res_date, start):
+        return "IN_USE"
+    return "CONFIRMED"
+
+
+def legacy_path(rows) -> bytes:
+    items = legacy_adapter.validate_python(rows, from_attributes=True)
+    content = legacy_adapter.dump_python(items, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(rows) -> bytes:
+    return dump_reservation_list(rows, datetime.now())
+
+
+def measure(fn, rows, repeat: int) -> float:
+    fn(rows)  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn(rows)
+        samples.append(perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'legacy(ms)':>12} {'fast(ms)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        rows = make_reservations(size)
+        # 두 경로의 결과가 같은지 먼저 확인
+        assert json.loads(legacy_path(rows)) == json.loads(fast_path(rows))
+        legacy = measure(legacy_path, rows, args.repeat)
+        fast = measure(fast_path, rows, args.repeat)
+        print(f"{size:>8} {legacy * 1000:>12.2f} {fast * 1000:>10.2f} {legacy / fast:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+[v2.3] 벤치마크 결과 비교
+
+bench_endpoints.py가 저장한 두 JSON 결과를 (시나리오, 데이터셋 크기, 동시성) 단위로 맞대어 비교합니다.
+기준(base) 대비 p95 지연 시간이 --threshold(%) 넘게 늘거나 처리량이 그만큼 줄면 회귀로 표시하고 종료 코드 1을 반환합니다.
+
+실행: python -m benchmarks.compare benchmarks/results/base.json benchmarks/results/new.json --threshold 10
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def load(path: str) -> tuple[dict, dict]:
+    report = json.loads(Path(path).read_text())
+    rows = {(row["scenario"], row["size"], row["concurrency"]): row for row in report["results"]}
+    return report, rows
+
+
+def change(base: float, new: float) -> float:
+    return (new - base) / base * 100 if base else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 변화율(%%)")
+    args = parser.parse_args()
+
+    base_report, base_rows = load(args.base)
+    new_report, new_rows = load(args.new)
+    print(f"base: {base_report['label']} ({base_report['created_at']})  new: {new_report['label']} ({new_report['created_at']})")
+    print(f"{'scenario':<20} {'size':>7} {'c':>4} {'req/s':>18} {'p95 ms':>20} {'sql/req':>14}")
+
+    regressions = 0
+    for key in sorted(base_rows.keys() & new_rows.keys()):
+        base, new = base_rows[key], new_rows[key]
+        rps = change(base["throughput_rps"], new["throughput_rps"])
+        p95 = change(base["p95_ms"], new["p95_ms"])
+        regressed = p95 > args.threshold or rps < -args.threshold or new["sql_per_request"] > base["sql_per_request"]
+        regressions += regressed
+        print(
+            f"{key[0]:<20} {key[1]:>7} {key[2]:>4} "
+            f"{base['throughput_rps']:>8.1f} {rps:>+7.1f}% "
+            f"{base['p95_ms']:>9.2f} {p95:>+8.1f}% "
+            f"{base['sql_per_request']:>5.2f}->{new['sql_per_request']:<5.2f}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+
+    missing = base_rows.keys() ^ new_rows.keys()
+    if missing:
+        print(f"한쪽에만 있는 조합 {len(missing)}개는 비교에서 제외했습니다.")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
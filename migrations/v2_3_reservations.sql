@@ -0,0 +1,42 @@
+-- [v2.3] 기존 PostgreSQL DB에 예약 테이블 인덱스/중복 차단 제약조건 적용
+-- create_all은 이미 있는 테이블의 인덱스/제약조건을 추가하지 않으므로, v2.3 이전에 만든 DB는 이 파일을 한 번 실행합니다.
+-- CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 psql 기본(autocommit) 모드로 실행하세요.
+--   psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f migrations/v2_3_reservations.sql
+-- 모든 문장은 다시 실행해도 안전합니다.
+
+-- 1. 확장: 정수/날짜의 = 연산을 GiST 인덱스에서 쓰기 위해 필요
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+-- 2. 부분/복합 인덱스 (쓰기를 막지 않도록 CONCURRENTLY)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reservations_room_date_active
+    ON reservations (room_id, reservation_date, start_time, end_time) WHERE status <> 'CANCELLED';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reservations_user_date_active
+    ON reservations (user_id, reservation_date, start_time, end_time) WHERE status <> 'CANCELLED';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reservations_date_active
+    ON reservations (reservation_date) WHERE status <> 'CANCELLED';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reservations_user_list
+    ON reservations (user_id, reservation_date, start_time, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reservations_user_upcoming
+    ON reservations (user_id, reservation_date, start_time, id) WHERE status = 'CONFIRMED';
+
+-- 3. 배타 제약조건 (같은 방/같은 유저·같은 날짜의 겹치는 유효한 예약 거부)
+-- 이미 겹치는 예약이 있으면 ADD CONSTRAINT가 실패합니다. 먼저 아래 쿼리로 확인하고 정리하세요.
+--   SELECT a.id, b.id FROM reservations a JOIN reservations b
+--     ON a.id < b.id AND a.reservation_date = b.reservation_date
+--    AND (a.room_id = b.room_id OR a.user_id = b.user_id)
+--    AND a.start_time < b.end_time AND b.start_time < a.end_time
+--    AND a.status <> 'CANCELLED' AND b.status <> 'CANCELLED';
+-- 제약조건의 GiST 인덱스를 만드는 동안 테이블 쓰기가 잠기므로 트래픽이 적은 시간에 실행하세요.
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ex_reservations_room_no_overlap') THEN
+        ALTER TABLE reservations ADD CONSTRAINT ex_reservations_room_no_overlap
+            EXCLUDE USING gist (room_id WITH =, reservation_date WITH =, int4range(start_time, end_time) WITH &&)
+            WHERE (status <> 'CANCELLED');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ex_reservations_user_no_overlap') THEN
+        ALTER TABLE reservations ADD CONSTRAINT ex_reservations_user_no_overlap
+            EXCLUDE USING gist (user_id WITH =, reservation_date WITH =, int4range(start_time, end_time) WITH &&)
+            WHERE (status <> 'CANCELLED');
+    END IF;
+END $$;